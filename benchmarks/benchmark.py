@@ -0,0 +1,170 @@
+"""Benchmarks of the feature file parsing, the step lookup and the feature file discovery.
+
+The benchmarks are not run by the test suite. Run them from the repository root, optionally selecting
+the benchmarks by the name prefix::
+
+    python benchmarks/benchmark.py
+    python benchmarks/benchmark.py parse lookup
+
+Every benchmark prints the best time of a single call out of the repeated runs. Compare the results
+of two revisions on the same machine, the absolute numbers are meaningless elsewhere.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pytest_bdd import parsers  # noqa: E402
+from pytest_bdd.discovery import find_feature_files  # noqa: E402
+from pytest_bdd.parser import index_feature, parse_feature, tokenize  # noqa: E402
+from pytest_bdd.registry import StepRegistry  # noqa: E402
+from pytest_bdd.types import GIVEN  # noqa: E402
+
+SCENARIOS = 200
+STEP_DEFINITIONS = 200
+
+
+def make_feature(scenarios=SCENARIOS, language=None):
+    """Make the feature file text with the plain scenarios and the scenario outlines.
+
+    :param int scenarios: Number of the scenarios.
+    :param str language: Feature file language, English if not given.
+    """
+    keywords = {
+        None: ("Feature", "Background", "Scenario", "Scenario Outline", "Examples", "Given", "When", "Then", "And"),
+        "de": (
+            "Funktionalität",
+            "Grundlage",
+            "Szenario",
+            "Szenariogrundriss",
+            "Beispiele",
+            "Angenommen",
+            "Wenn",
+            "Dann",
+            "Und",
+        ),
+    }[language]
+    feature, background, scenario, outline, examples, given, when, then, and_ = keywords
+    lines = [f"# language: {language}"] if language else []
+    lines += ["@feature", f"{feature}: Benchmark", "    Some description", "", f"    {background}:"]
+    lines += [f"        {given} a background step", ""]
+    for index in range(scenarios):
+        lines.append(f"    @tag{index % 7} @smoke")
+        if index % 2:
+            lines.append(f"    {outline}: Outline {index}")
+            lines.append(f"        {given} there are <start> cucumbers  # comment")
+            lines.append(f"        {when} I eat <eat> cucumbers")
+            lines.append(f"        {then} I should have <left> cucumbers")
+            lines.append(f"        {and_} I have a doc string:")
+            lines.append('            """')
+            lines.extend(f"            Line {line} of the <start> doc string" for line in range(5))
+            lines.append('            """')
+            lines.append(f"        {examples}:")
+            lines.append("        | start | eat | left |")
+            lines.extend(f"        | {row + 10} | {row} | 10 |" for row in range(20))
+        else:
+            lines.append(f"    {scenario}: Plain {index}")
+            lines.append(f"        {given} I am logged in as admin")
+            lines.append(f"        {and_} I have an article {index}")
+            lines.append(f"        {when} I go to the article page")
+            lines.append(f"        {then} I should not see the error message")
+        lines.append("")
+    return "\n".join(lines)
+
+
+def make_tree(path, folders=50, files=4):
+    """Make the directory tree of the feature files with some ignored folders.
+
+    :param str path: Root directory.
+    :param int folders: Number of the folders.
+    :param int files: Number of the feature files per folder.
+    """
+    for folder in range(folders):
+        for name in (f"features/{folder}", f"features/{folder}/node_modules", f"features/{folder}/.git"):
+            os.makedirs(os.path.join(path, name))
+        for index in range(files):
+            with open(os.path.join(path, f"features/{folder}/test_{index}.feature"), "w") as f:
+                f.write(f"Feature: Feature {index}\n")
+            with open(os.path.join(path, f"features/{folder}/test_{index}.py"), "w") as f:
+                f.write("")
+
+
+def make_registry(definitions=STEP_DEFINITIONS):
+    """Register the regex and parse step definitions, in the consecutive groups of the same kind.
+
+    :param int definitions: Number of the step definitions of every kind.
+    """
+    registry = StepRegistry()
+    for index in range(definitions):
+        registry.register(GIVEN, parsers.re(rf"I have (?P<count>\d+) items? of kind {index}"), f"re_{index}")
+    for index in range(definitions):
+        registry.register(GIVEN, parsers.parse(f"the order {index} has {{count:d}} items"), f"parse_{index}")
+    return registry
+
+
+def get_benchmarks(tmpdir):
+    """Get the benchmarks.
+
+    :param str tmpdir: Directory of the generated feature files.
+
+    :return: `list` of `tuple` in form (<name>, <function>).
+    """
+    with open(os.path.join(tmpdir, "benchmark.feature"), "w", encoding="utf-8") as f:
+        f.write(make_feature())
+    with open(os.path.join(tmpdir, "benchmark_de.feature"), "w", encoding="utf-8") as f:
+        f.write(make_feature(language="de"))
+    lines = make_feature().splitlines()
+    make_tree(tmpdir)
+    registry = make_registry()
+    last = STEP_DEFINITIONS - 1
+
+    def parse_steps():
+        for scenario in parse_feature(tmpdir, "benchmark.feature").scenarios.values():
+            for step in scenario.steps:
+                step.name, step.params
+
+    def parse_examples():
+        for scenario in parse_feature(tmpdir, "benchmark.feature").scenarios.values():
+            list(scenario.get_params())
+
+    def lookup(name):
+        return lambda: list(registry.iter_matching(name, GIVEN))
+
+    return [
+        ("tokenize", lambda: list(tokenize(lines))),
+        ("parse_feature", lambda: parse_feature(tmpdir, "benchmark.feature")),
+        ("parse_feature de", lambda: parse_feature(tmpdir, "benchmark_de.feature")),
+        ("parse_feature steps", parse_steps),
+        ("parse_feature examples", parse_examples),
+        ("index_feature", lambda: index_feature(tmpdir, "benchmark.feature")),
+        ("index_feature scenario", lambda: index_feature(tmpdir, "benchmark.feature").scenarios["Plain 100"]),
+        ("index_feature tags", lambda: index_feature(tmpdir, "benchmark.feature").select_scenarios(["tag3"])),
+        ("lookup re first", lookup("I have 5 items of kind 0")),
+        ("lookup re last", lookup(f"I have 5 items of kind {last}")),
+        ("lookup parse last", lookup(f"the order {last} has 5 items")),
+        ("lookup missing", lookup("there is no such step")),
+        ("discovery", lambda: find_feature_files(os.path.join(tmpdir, "features"))),
+    ]
+
+
+def main(argv=None):
+    argument_parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    argument_parser.add_argument("names", nargs="*", help="Prefixes of the benchmark names to run.")
+    argument_parser.add_argument("--repeat", type=int, default=5, help="Number of the runs of every benchmark.")
+    args = argument_parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for name, function in get_benchmarks(tmpdir):
+            if args.names and not any(name.startswith(prefix) for prefix in args.names):
+                continue
+            timer = timeit.Timer(function)
+            number, _ = timer.autorange()
+            best = min(timer.repeat(repeat=args.repeat, number=number)) / number
+            print(f"{name:<24} {best * 1000:10.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Precompiled feature bundles.
+
+The ``pytest-bdd compile`` command parses a tree of feature files once and writes all the parsed features into
+a single bundle file. When the bundle is configured with the ``bdd_features_bundle`` ini option, the features
+are loaded from it instead of being parsed, as long as the feature file content didn't change.
+
+The bundle file starts with `MAGIC`, followed by the pickled header (parser version, encoding and the index of
+the features) and the pickled features. The index maps the feature file paths, relative to the bundle directory,
+to the offset and length of the pickled feature, the feature file size and its content hash.
+"""
+import hashlib
+import os.path
+import pickle
+import warnings
+
+import pytest
+
+from .parser import PARSER_VERSION, parse_feature
+from .utils import CONFIG_STACK
+
+MAGIC = b"pytest-bdd feature bundle\n"
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    parser.addini("bdd_features_bundle", "Feature bundle compiled by the `pytest-bdd compile` command.")
+
+
+def configure(config):
+    path = config.getini("bdd_features_bundle")
+    if path:
+        rootdir = getattr(config, "rootpath", None) or config.rootdir
+        config._bddfeaturebundle = load_bundle(os.path.join(str(rootdir), path))
+
+
+def get_feature_bundle():
+    """Get the feature bundle of the current pytest session.
+
+    :return: `FeatureBundle` instance or `None` if there is no bundle.
+    """
+    if not CONFIG_STACK:
+        return None
+    return getattr(CONFIG_STACK[-1], "_bddfeaturebundle", None)
+
+
+def load_bundle(path):
+    """Load the feature bundle index.
+
+    A warning is issued when the bundle can't be used, the feature files are parsed as usual then.
+
+    :param str path: Bundle file path.
+
+    :return: `FeatureBundle` instance or `None` if the bundle is missing, broken or compiled by another parser version.
+    """
+    try:
+        bundle = FeatureBundle(path)
+    except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+        warnings.warn(pytest.PytestWarning(f"Cannot load the feature bundle {path}: {e}"))
+        return None
+    if bundle.version != PARSER_VERSION:
+        warnings.warn(
+            pytest.PytestWarning(
+                f"The feature bundle {path} was compiled by another version of pytest-bdd, ignoring it"
+            )
+        )
+        return None
+    return bundle
+
+
+def get_digest(content):
+    """Get the feature file content hash.
+
+    :param bytes content: Feature file content.
+    """
+    return hashlib.sha1(content).hexdigest()
+
+
+def write_bundle(path, filenames, encoding="utf-8"):
+    """Parse the feature files and write them into the bundle.
+
+    :param str path: Bundle file path.
+    :param filenames: Iterable of the feature file paths.
+    :param str encoding: Feature file encoding.
+
+    :return: Number of the bundled feature files.
+    """
+    basedir = os.path.dirname(os.path.abspath(path))
+    index = {}
+    chunks = []
+    offset = 0
+    for filename in filenames:
+        abs_filename = os.path.abspath(filename)
+        with open(abs_filename, "rb") as f:
+            content = f.read()
+        feature = parse_feature(*os.path.split(abs_filename), encoding=encoding)
+        data = pickle.dumps(feature, protocol=pickle.HIGHEST_PROTOCOL)
+        index[os.path.relpath(abs_filename, basedir)] = (offset, len(data), len(content), get_digest(content))
+        chunks.append(data)
+        offset += len(data)
+
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        pickle.dump((PARSER_VERSION, encoding, index), f, protocol=pickle.HIGHEST_PROTOCOL)
+        for data in chunks:
+            f.write(data)
+    return len(index)
+
+
+class FeatureBundle:
+    """Index of the features compiled into the bundle file."""
+
+    def __init__(self, path):
+        """Read the bundle header.
+
+        :param str path: Bundle file path.
+        """
+        self.path = os.path.abspath(path)
+        self.basedir = os.path.dirname(self.path)
+        with open(self.path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a feature bundle")
+            self.version, self.encoding, self.index = pickle.load(f)
+            self.data_start = f.tell()
+
+    def get_feature(self, basedir, filename, encoding="utf-8"):
+        """Load the feature from the bundle.
+
+        :param str basedir: Feature files base directory.
+        :param str filename: Relative path to the feature file.
+        :param str encoding: Feature file encoding.
+
+        :return: `Feature` instance or `None` if the feature file is not bundled or was changed since.
+        """
+        abs_filename = os.path.abspath(os.path.join(basedir, filename))
+        try:
+            entry = self.index.get(os.path.relpath(abs_filename, self.basedir))
+        except ValueError:
+            # Paths on different drives
+            return None
+        if entry is None or encoding != self.encoding:
+            return None
+
+        offset, length, size, digest = entry
+        try:
+            with open(abs_filename, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        if len(content) != size or get_digest(content) != digest:
+            return None
+
+        with open(self.path, "rb") as f:
+            f.seek(self.data_start + offset)
+            feature = pickle.loads(f.read(length))
+        # The bundle can be moved together with the feature files
+        feature.filename = abs_filename
+        feature.rel_filename = os.path.join(os.path.basename(basedir), filename)
+        return feature
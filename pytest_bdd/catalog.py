@@ -0,0 +1,82 @@
+"""Feature catalog shared with the xdist workers.
+
+Every xdist worker collects all the tests, so without the catalog every worker parses the whole feature tree.
+When the ``bdd_features_catalog`` ini option is set, the xdist controller parses the feature files of the given paths
+once (or loads them from the feature bundle or cache) and sends them to the workers through the ``workerinput``.
+The workers store the features from the catalog in the features cache, so `get_feature` doesn't parse them again.
+
+The catalog is the compressed parser version followed by the `list` of the parsed features, pickled separately,
+so that the features are never unpickled by another parser version.
+"""
+import io
+import pickle
+import zlib
+
+from . import feature
+from .parser import PARSER_VERSION
+
+WORKERINPUT_KEY = "bdd_features_catalog"
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    parser.addini(
+        "bdd_features_catalog",
+        "Feature files (or directories) the xdist controller parses once and sends to the workers.",
+        type="pathlist",
+    )
+
+
+def configure(config):
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None and WORKERINPUT_KEY in workerinput:
+        load_catalog(workerinput[WORKERINPUT_KEY])
+
+
+def configure_node(node):
+    """Send the feature catalog to the xdist worker.
+
+    :param node: xdist worker controller.
+    """
+    config = node.config
+    paths = config.getini("bdd_features_catalog")
+    if not paths:
+        return
+    catalog = getattr(config, "_bddfeaturecatalog", None)
+    if catalog is None:
+        catalog = config._bddfeaturecatalog = dump_catalog([str(path) for path in paths])
+    node.workerinput[WORKERINPUT_KEY] = catalog
+
+
+def dump_catalog(paths):
+    """Parse the feature files and serialize them into the catalog.
+
+    :param list paths: `list` of paths (file or dirs).
+
+    :return: `bytes` of the catalog.
+    """
+    features = feature.get_features(paths)
+    for parsed_feature in features:
+        # Parse the scenarios indexed by `index_feature`, so that the workers don't parse them
+        for _ in parsed_feature.scenarios.values():
+            pass
+    f = io.BytesIO()
+    pickle.dump(PARSER_VERSION, f, protocol=pickle.HIGHEST_PROTOCOL)
+    pickle.dump(features, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return zlib.compress(f.getvalue(), 1)
+
+
+def load_catalog(catalog):
+    """Store the features of the catalog in the features cache.
+
+    :param bytes catalog: Feature catalog.
+
+    :return: Number of the stored features, 0 if the catalog was made by another parser version.
+    """
+    f = io.BytesIO(zlib.decompress(catalog))
+    if pickle.load(f) != PARSER_VERSION:
+        return 0
+    features = pickle.load(f)
+    for parsed_feature in features:
+        feature.features[parsed_feature.filename] = parsed_feature
+    return len(features)
@@ -0,0 +1,168 @@
+"""Gherkin dialects.
+
+The feature file language is set by the ``# language: <code>`` comment before the feature line,
+the feature files without it are in English.
+
+The keywords of every language are put into a trie once, the trie is compiled into a regular expression,
+so a line is matched against all the keywords of the language at once, in the time of the keyword length.
+"""
+import functools
+import re
+
+from . import types
+
+DEFAULT_LANGUAGE = "en"
+
+LANGUAGE_RE = re.compile(r"^\s*#\s*language\s*:\s*([\w-]+)\s*$")
+
+# Keywords of the languages, the keywords are based on the cucumber gherkin-languages.json
+DIALECTS = {
+    "en": {
+        "feature": ["Feature"],
+        "background": ["Background"],
+        "scenario": ["Scenario"],
+        "scenario_outline": ["Scenario Outline"],
+        "examples": ["Examples"],
+        "given": ["Given"],
+        "when": ["When"],
+        "then": ["Then"],
+        "and": ["And"],
+        "but": ["But"],
+    },
+    "de": {
+        "feature": ["Funktionalität", "Funktion"],
+        "background": ["Grundlage", "Hintergrund", "Voraussetzungen", "Vorbedingungen"],
+        "scenario": ["Beispiel", "Szenario"],
+        "scenario_outline": ["Szenariogrundriss", "Szenarien"],
+        "examples": ["Beispiele"],
+        "given": ["Angenommen", "Gegeben sei", "Gegeben seien"],
+        "when": ["Wenn"],
+        "then": ["Dann"],
+        "and": ["Und"],
+        "but": ["Aber"],
+    },
+    "es": {
+        "feature": ["Característica", "Necesidad del negocio", "Requisito"],
+        "background": ["Antecedentes"],
+        "scenario": ["Ejemplo", "Escenario"],
+        "scenario_outline": ["Esquema del escenario"],
+        "examples": ["Ejemplos"],
+        "given": ["Dado", "Dada", "Dados", "Dadas"],
+        "when": ["Cuando"],
+        "then": ["Entonces"],
+        "and": ["Y", "E"],
+        "but": ["Pero"],
+    },
+}
+
+
+def get_prefixes(keywords):
+    """Get the line prefixes of the keywords.
+
+    :param dict keywords: Keywords of the language by their kind.
+
+    :return: `list` of `tuple` in form ("<prefix>", <type>).
+    """
+    prefixes = [("@", types.TAG)]
+    prefixes.extend((f"{keyword}: ", types.FEATURE) for keyword in keywords["feature"])
+    prefixes.extend((f"{keyword}: ", types.SCENARIO_OUTLINE) for keyword in keywords["scenario_outline"])
+    for keyword in keywords["examples"]:
+        prefixes.append((f"{keyword}: Vertical", types.EXAMPLES_VERTICAL))
+        prefixes.append((f"{keyword}:", types.EXAMPLES))
+    prefixes.extend((f"{keyword}: ", types.SCENARIO) for keyword in keywords["scenario"])
+    prefixes.extend((f"{keyword}:", types.BACKGROUND) for keyword in keywords["background"])
+    for kind, _type in (("given", types.GIVEN), ("when", types.WHEN), ("then", types.THEN)):
+        prefixes.extend((f"{keyword} ", _type) for keyword in keywords[kind])
+    # Continuation of the previously mentioned step type
+    prefixes.extend((f"{keyword} ", None) for keyword in keywords["and"] + keywords["but"])
+    return prefixes
+
+
+class Dialect:
+    """Keywords of the language compiled into a trie."""
+
+    def __init__(self, language, prefixes):
+        """Dialect constructor.
+
+        :param str language: Language code.
+        :param prefixes: `list` of `tuple` in form ("<prefix>", <type>).
+        """
+        self.language = language
+        self.prefixes = prefixes
+        self.trie = {}
+        for prefix, _type in prefixes:
+            node = self.trie
+            for char in prefix:
+                node = node.setdefault(char, {})
+            # The empty key marks the end of the prefix
+            node[""] = (prefix, prefix.strip(), _type)
+        self.first_chars = frozenset(self.trie)
+        self.entries = {prefix: (keyword, len(prefix), _type) for prefix, keyword, _type in self.iter_entries()}
+        self.regex = re.compile(self.get_pattern(self.trie))
+
+    def iter_entries(self, node=None):
+        """Iterate over the trie entries.
+
+        :return: Generator of `tuple` in form ("<prefix>", "<keyword>", <type>).
+        """
+        for char, child in (node if node is not None else self.trie).items():
+            if char:
+                yield from self.iter_entries(child)
+            else:
+                yield child
+
+    def get_pattern(self, node):
+        """Compile the trie node into a regular expression pattern.
+
+        The longer prefixes go first, so the longest prefix matches, e.g. "Examples: Vertical" before "Examples:".
+        """
+        alternatives = [re.escape(char) + self.get_pattern(child) for char, child in sorted(node.items()) if char]
+        if "" in node:
+            alternatives.append("")
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return f"(?:{'|'.join(alternatives)})"
+
+    def match(self, line):
+        """Find the keyword prefix the line starts with.
+
+        :param str line: Stripped line of the Feature file.
+
+        :return: `tuple` in form ("<keyword>", "<Line without the prefix>", <type>).
+        """
+        match = self.regex.match(line)
+        if match is None:
+            return "", line, None
+        keyword, length, _type = self.entries[match.group()]
+        return keyword, line[length:].strip(), _type
+
+
+@functools.lru_cache(maxsize=None)
+def get_dialect(language=DEFAULT_LANGUAGE):
+    """Get the dialect of the language, the dialects are built once.
+
+    :param str language: Language code.
+
+    :raises KeyError: If the language is not supported.
+    """
+    return Dialect(language, get_prefixes(DIALECTS[language]))
+
+
+def get_language(lines):
+    """Get the language of the feature file from the ``# language:`` comment before the first non-comment line.
+
+    :param lines: Iterable of the Feature file lines.
+
+    :return: `tuple` of the language code and the index of its comment line,
+             or `DEFAULT_LANGUAGE` and `None` if there is no language comment.
+    """
+    for index, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if not stripped.startswith("#"):
+            break
+        match = LANGUAGE_RE.match(stripped)
+        if match is not None:
+            return match.group(1), index
+    return DEFAULT_LANGUAGE, None
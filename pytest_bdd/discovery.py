@@ -0,0 +1,158 @@
+"""Feature files discovery.
+
+The feature files of a directory are found by walking it with `os.scandir`, skipping the directories matching
+the ``bdd_features_norecursedirs`` ini option patterns (the ``norecursedirs`` ones by default).
+
+When the ``bdd_features_dir_cache`` ini option is enabled, the directory listings are stored in the pytest cache
+directory along with the directory mtimes, so that the unchanged directories are not listed again by the following
+test runs. Adding, removing or renaming a directory entry changes the directory mtime.
+"""
+import fnmatch
+import os
+import time
+
+from .utils import CONFIG_STACK
+
+CACHE_KEY = "pytest-bdd/feature-dirs"
+
+# Default ``norecursedirs`` patterns of pytest, used outside of the pytest session
+DEFAULT_NORECURSEDIRS = ("*.egg", ".*", "_darcs", "build", "CVS", "dist", "node_modules", "venv", "{arch}")
+
+# Directories changed less than this number of seconds ago are not cached,
+# as the following changes might not change their mtime on the file systems with a coarse mtime resolution
+RACY_INTERVAL = 2
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    parser.addini(
+        "bdd_features_norecursedirs",
+        "Directory patterns to skip when looking for the feature files, defaults to the norecursedirs patterns.",
+        type="args",
+    )
+    parser.addini(
+        "bdd_features_dir_cache",
+        "Store the listings of the feature directories in the pytest cache directory.",
+        type="bool",
+        default=False,
+    )
+
+
+def configure(config):
+    config._bddnorecursedirs = tuple(config.getini("bdd_features_norecursedirs") or config.getini("norecursedirs"))
+    cache = getattr(config, "cache", None)
+    if cache is not None and config.getini("bdd_features_dir_cache"):
+        config._bdddirectorycache = DirectoryCache(cache)
+
+
+def unconfigure(config):
+    directory_cache = getattr(config, "_bdddirectorycache", None)
+    if directory_cache is not None:
+        directory_cache.save()
+
+
+def get_norecursedirs():
+    """Get the directory patterns to skip of the current pytest session.
+
+    :return: `tuple` of the patterns, `DEFAULT_NORECURSEDIRS` outside of the pytest session.
+    """
+    if not CONFIG_STACK:
+        return DEFAULT_NORECURSEDIRS
+    return getattr(CONFIG_STACK[-1], "_bddnorecursedirs", DEFAULT_NORECURSEDIRS)
+
+
+def get_directory_cache():
+    """Get the directory listings cache of the current pytest session.
+
+    :return: `DirectoryCache` instance or `None` if the cache is disabled.
+    """
+    if not CONFIG_STACK:
+        return None
+    return getattr(CONFIG_STACK[-1], "_bdddirectorycache", None)
+
+
+def list_directory(path):
+    """List the subdirectories and the feature files of the directory.
+
+    :param str path: Directory path.
+
+    :return: `tuple` of the `list` of the subdirectory names and the `list` of the feature file names.
+    """
+    dirnames = []
+    filenames = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                dirnames.append(entry.name)
+            elif entry.name.endswith(".feature") and not entry.name.startswith("."):
+                filenames.append(entry.name)
+    return dirnames, filenames
+
+
+def is_ignored(dirname, norecursedirs):
+    """Check whether the directory should be skipped.
+
+    :param str dirname: Directory name.
+    :param norecursedirs: Directory name patterns to skip.
+    """
+    return any(fnmatch.fnmatch(dirname, pattern) for pattern in norecursedirs)
+
+
+def find_feature_files(path, norecursedirs=DEFAULT_NORECURSEDIRS, directory_cache=None):
+    """Find the feature files of the directory tree.
+
+    :param str path: Directory path.
+    :param norecursedirs: Directory name patterns to skip.
+    :param DirectoryCache directory_cache: Directory listings cache.
+
+    :return: Sorted `list` of the feature file paths.
+    """
+    result = []
+    pending = [path]
+    while pending:
+        dirpath = pending.pop()
+        if directory_cache is not None:
+            dirnames, filenames = directory_cache.list_directory(dirpath)
+        else:
+            dirnames, filenames = list_directory(dirpath)
+        result.extend(os.path.join(dirpath, filename) for filename in filenames)
+        pending.extend(os.path.join(dirpath, dirname) for dirname in dirnames if not is_ignored(dirname, norecursedirs))
+    result.sort()
+    return result
+
+
+class DirectoryCache:
+    """Directory listings stored in the pytest cache, keyed by the absolute directory path."""
+
+    def __init__(self, cache):
+        """Directory cache constructor.
+
+        :param cache: pytest cache.
+        """
+        self.cache = cache
+        self.listings = cache.get(CACHE_KEY, {})
+        self.changed = False
+
+    def list_directory(self, path):
+        """List the directory, unless it's unchanged since it was cached.
+
+        :param str path: Directory path.
+
+        :return: `tuple` of the `list` of the subdirectory names and the `list` of the feature file names.
+        """
+        abs_path = os.path.abspath(path)
+        mtime = os.stat(abs_path).st_mtime_ns
+        listing = self.listings.get(abs_path)
+        if listing is not None and listing[0] == mtime:
+            return listing[1], listing[2]
+        dirnames, filenames = list_directory(abs_path)
+        if time.time() - mtime / 1e9 > RACY_INTERVAL:
+            self.listings[abs_path] = [mtime, dirnames, filenames]
+            self.changed = True
+        return dirnames, filenames
+
+    def save(self):
+        """Store the changed directory listings in the pytest cache."""
+        if self.changed:
+            self.cache.set(CACHE_KEY, self.listings)
+            self.changed = False
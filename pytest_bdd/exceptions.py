@@ -33,6 +33,10 @@ class NoScenariosFound(Exception):
     """No scenarios found."""
 
 
+class TagExpressionError(Exception):
+    """Tag expression is not valid."""
+
+
 class FeatureError(Exception):
     """Feature parse error."""
 
@@ -23,14 +23,271 @@ Syntax example:
 :note: There're no multiline steps, the description of the step must fit in
 one line.
 """
+import itertools
 import os.path
+import sys
+import time
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
+from concurrent.futures import ProcessPoolExecutor
 
-import glob2
+from .bundle import get_feature_bundle
+from .discovery import RACY_INTERVAL, find_feature_files, get_directory_cache, get_norecursedirs
+from .feature_cache import get_feature_cache
+from .parser import index_feature, parse_feature
+from .utils import CONFIG_STACK
 
-from .parser import parse_feature
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "invalidations", "maxsize", "maxbytes", "currsize", "currbytes"]
+)
 
-# Global features dictionary
-features = {}
+
+def get_signature(filename):
+    """Get the signature of the feature file to tell whether it was changed.
+
+    :param str filename: Absolute path to the feature file.
+
+    :return: `tuple` of the file mtime and size or `None` if the file can't be accessed.
+    """
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def is_racy(signature):
+    """Check whether the feature file could be changed without changing its signature.
+
+    The file modified within the mtime granularity of the file system before its signature was taken
+    can be modified again with the same mtime, so the signature just taken can't verify the content.
+
+    :param tuple signature: Feature file signature taken just now, see `get_signature`.
+    """
+    return signature is not None and time.time() - signature[0] / 1e9 <= RACY_INTERVAL
+
+
+class FeaturesCache(MutableMapping):
+    """Parsed features by the absolute feature file path, evicting the least recently used ones.
+
+    The cache is bounded by the number of the features and by the total size of their feature files,
+    the bounds of 0 mean no limit.
+
+    When the check interval is set, the cached features are checked for changes of their feature files
+    at most once per interval: on access and at once by `check` at the start of a pytest session.
+    The changed features are dropped, and the test modules bound to them are re-imported on the next collection.
+    The signature of the feature file is taken before the file is read, the features whose signature
+    was taken too close to the file modification are never fresh, see `is_racy`.
+    """
+
+    def __init__(self, maxsize=0, maxbytes=0, check_interval=None):
+        """Features cache constructor.
+
+        :param int maxsize: Maximum number of the cached features.
+        :param int maxbytes: Maximum total size of the cached feature files in bytes.
+        :param float check_interval: Seconds between the checks of the feature files, `None` to never check them.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.check_interval = check_interval
+        self.features = OrderedDict()
+        self.signatures = {}
+        self.racy = set()
+        self.checked = {}
+        self.modules = {}
+        self.stale_modules = set()
+        self.currbytes = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def __getitem__(self, filename):
+        feature = self.features[filename]
+        self.features.move_to_end(filename)
+        return feature
+
+    def __setitem__(self, filename, feature):
+        signature = get_signature(filename)
+        self.add(filename, feature, signature, racy=is_racy(signature))
+
+    def __delitem__(self, filename):
+        del self.features[filename]
+        del self.checked[filename]
+        self.racy.discard(filename)
+        signature = self.signatures.pop(filename)
+        self.currbytes -= signature[1] if signature else 0
+
+    def __contains__(self, filename):
+        return filename in self.features
+
+    def __iter__(self):
+        return iter(self.features)
+
+    def __len__(self):
+        return len(self.features)
+
+    def get(self, filename, default=None):
+        """Get the feature, counting the cache hits and misses.
+
+        The changed feature is dropped and counted as a miss.
+        """
+        try:
+            feature = self[filename]
+        except KeyError:
+            self.misses += 1
+            return default
+        if self.check_interval is not None and time.monotonic() - self.checked[filename] >= self.check_interval:
+            if not self.is_fresh(filename):
+                self.invalidate(filename)
+                self.misses += 1
+                return default
+        self.hits += 1
+        return feature
+
+    def add(self, filename, feature, signature, racy=False):
+        """Cache the feature with the signature its feature file had before it was read.
+
+        :param str filename: Absolute path to the feature file.
+        :param pytest_bdd.parser.Feature feature: Parsed feature.
+        :param tuple signature: Feature file signature, see `get_signature`.
+        :param bool racy: Whether the signature can't verify the feature file content, see `is_racy`.
+        """
+        if filename in self.features:
+            del self[filename]
+        self.features[filename] = feature
+        self.signatures[filename] = signature
+        if racy:
+            self.racy.add(filename)
+        self.checked[filename] = time.monotonic()
+        self.currbytes += signature[1] if signature else 0
+        self.evict()
+
+    def is_fresh(self, filename):
+        """Check whether the feature file is unchanged since the feature was cached.
+
+        :param str filename: Absolute path to the feature file.
+        """
+        self.checked[filename] = time.monotonic()
+        return filename not in self.racy and get_signature(filename) == self.signatures[filename]
+
+    def check(self):
+        """Check all the cached features at once, dropping the changed ones.
+
+        The test modules bound to the changed features are removed from `sys.modules`, so that they are imported
+        and their scenarios are bound again. It's only safe when no test module is being imported, so it should
+        be called at the start of the pytest session.
+
+        :return: `list` of the dropped feature file paths.
+        """
+        stale = [filename for filename in list(self.features) if not self.is_fresh(filename)]
+        for filename in stale:
+            self.invalidate(filename)
+        for module_name in self.stale_modules:
+            sys.modules.pop(module_name, None)
+        self.stale_modules.clear()
+        return stale
+
+    def invalidate(self, filename):
+        """Drop the changed feature, its test modules are removed from `sys.modules` by the next `check`.
+
+        :param str filename: Absolute path to the feature file.
+        """
+        del self[filename]
+        self.stale_modules.update(self.modules.pop(filename, ()))
+        self.invalidations += 1
+
+    def bind(self, filename, module_name):
+        """Remember the test module the feature scenarios are bound to.
+
+        :param str filename: Absolute path to the feature file.
+        :param str module_name: Test module name.
+        """
+        self.modules.setdefault(filename, set()).add(module_name)
+
+    def resize(self, maxsize=0, maxbytes=0):
+        """Change the cache bounds, evicting the features over them.
+
+        :param int maxsize: Maximum number of the cached features.
+        :param int maxbytes: Maximum total size of the cached feature files in bytes.
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.evict()
+
+    def evict(self):
+        """Evict the least recently used features until the cache is within its bounds.
+
+        The most recently added feature is never evicted.
+        """
+        while len(self.features) > 1 and (
+            (self.maxsize and len(self.features) > self.maxsize) or (self.maxbytes and self.currbytes > self.maxbytes)
+        ):
+            del self[next(iter(self.features))]
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all the cached features and reset the statistics."""
+        self.features.clear()
+        self.signatures.clear()
+        self.racy.clear()
+        self.checked.clear()
+        self.modules.clear()
+        self.stale_modules.clear()
+        self.currbytes = 0
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def cache_info(self):
+        """Get the cache statistics.
+
+        :return: `CacheInfo` tuple.
+        """
+        return CacheInfo(
+            self.hits,
+            self.misses,
+            self.evictions,
+            self.invalidations,
+            self.maxsize,
+            self.maxbytes,
+            len(self.features),
+            self.currbytes,
+        )
+
+
+# Global features cache
+features = FeaturesCache()
+
+# Minimal number of the feature files to parse them in a process pool
+PARALLEL_PARSE_THRESHOLD = 64
+
+
+def configure(config):
+    if len(CONFIG_STACK) != 1:
+        # The features cache is shared by the nested pytest sessions (e.g. the pytester ones),
+        # only the outermost session sets its bounds and checks the features, so that the nested ones
+        # don't remove the test modules of the outer session
+        return
+    features.resize(
+        maxsize=int(config.getini("bdd_features_memory_cache_size") or 0),
+        maxbytes=int(config.getini("bdd_features_memory_cache_bytes") or 0),
+    )
+    check_interval = config.getini("bdd_features_check_interval")
+    features.check_interval = float(check_interval) if check_interval else None
+    if features.check_interval is not None:
+        features.check()
+
+
+def unconfigure(config):
+    if not CONFIG_STACK and features.check_interval is None:
+        # The outermost pytest session is over, don't keep its features in the long-lived processes
+        # unless they are checked for changes in the following sessions
+        features.clear()
+
+
+def bind_feature(feature, module_name):
+    """Remember the test module the scenarios of the feature are bound to, to re-import it once the feature changes.
+
+    :param pytest_bdd.parser.Feature feature: Feature.
+    :param str module_name: Test module name.
+    """
+    features.bind(feature.filename, module_name)
 
 
 def get_feature(base_path, filename, encoding="utf-8"):
@@ -43,35 +300,131 @@ def get_feature(base_path, filename, encoding="utf-8"):
     :return: `Feature` instance from the parsed feature cache.
 
     :note: The features are parsed on the execution of the test and
-           stored in the global variable cache to improve the performance
+           stored in the global `FeaturesCache` to improve the performance
            when multiple scenarios are referencing the same file.
+           The cache can be bounded with the ``bdd_features_memory_cache_size``
+           and ``bdd_features_memory_cache_bytes`` ini options, the changed
+           feature files are parsed again when the ``bdd_features_check_interval``
+           ini option is set.
+           When the ``bdd_features_bundle`` ini option is set, the unchanged
+           features are loaded from the compiled feature bundle.
+           When the ``bdd_features_cache`` ini option is enabled, the parsed
+           features are also stored in the pytest cache directory.
+           The scenarios are parsed on the first access, so binding a few
+           scenarios of a large feature file doesn't parse the whole file.
     """
 
     full_name = os.path.abspath(os.path.join(base_path, filename))
     feature = features.get(full_name)
     if not feature:
-        feature = parse_feature(base_path, filename, encoding=encoding)
-        features[full_name] = feature
+        # The signature is taken before the feature file is read, so that the changes made meanwhile are detected
+        signature = get_signature(full_name)
+        racy = is_racy(signature)
+        feature_bundle = get_feature_bundle()
+        if feature_bundle is not None:
+            feature = feature_bundle.get_feature(base_path, filename, encoding=encoding)
+        if feature is None:
+            feature_cache = get_feature_cache()
+            if feature_cache is not None:
+                feature = feature_cache.get_feature(base_path, filename, encoding=encoding)
+            else:
+                feature = index_feature(base_path, filename, encoding=encoding)
+        features.add(full_name, feature, signature, racy=racy)
     return feature
 
 
-def get_features(paths, **kwargs):
+def get_features(paths, workers=None, **kwargs):
     """Get features for given paths.
 
     :param list paths: `list` of paths (file or dirs)
+    :param int workers: Number of processes to parse the feature files with. Defaults to the
+                        ``bdd_features_parse_workers`` ini option, the files are parsed serially if it's not set.
 
     :return: `list` of `Feature` objects.
     """
+    filenames = list(iter_feature_filenames(paths))
+    if workers is None:
+        workers = get_parse_workers()
+    if workers:
+        parse_features(filenames, workers, **kwargs)
+
+    result = [get_feature(*os.path.split(filename), **kwargs) for filename in filenames]
+    result.sort(key=lambda feature: feature.name or feature.filename)
+    return result
+
+
+def iter_feature_filenames(paths):
+    """Iterate over the feature files of the given paths.
+
+    :param list paths: `list` of paths (file or dirs)
+
+    :return: Generator of the feature file paths, the feature files of a directory are sorted.
+    """
     seen_names = set()
-    features = []
     for path in paths:
         if path not in seen_names:
             seen_names.add(path)
             if os.path.isdir(path):
-                features.extend(get_features(glob2.iglob(os.path.join(path, "**", "*.feature")), **kwargs))
+                yield from find_feature_files(
+                    path, norecursedirs=get_norecursedirs(), directory_cache=get_directory_cache()
+                )
             else:
-                base, name = os.path.split(path)
-                feature = get_feature(base, name, **kwargs)
-                features.append(feature)
-    features.sort(key=lambda feature: feature.name or feature.filename)
-    return features
+                yield path
+
+
+def get_parse_workers():
+    """Get the number of processes to parse the feature files with from the ini config.
+
+    :return: Number of processes, 0 if the feature files should be parsed serially.
+    """
+    if not CONFIG_STACK:
+        return 0
+    return int(CONFIG_STACK[-1].getini("bdd_features_parse_workers") or 0)
+
+
+def parse_features(filenames, workers, encoding="utf-8"):
+    """Parse the feature files in a process pool and store them in the features cache.
+
+    Nothing is done if there are less than `PARALLEL_PARSE_THRESHOLD` files to parse,
+    so that the small test suites don't pay for spawning the processes.
+
+    :param list filenames: `list` of the feature file paths.
+    :param int workers: Number of processes.
+    :param str encoding: Feature file encoding.
+    """
+    feature_bundle = get_feature_bundle()
+    feature_cache = get_feature_cache()
+    pending = []
+    for filename in filenames:
+        full_name = os.path.abspath(filename)
+        if full_name in features:
+            continue
+        base, name = os.path.split(filename)
+        signature = get_signature(full_name)
+        racy = is_racy(signature)
+        key = feature = None
+        if feature_bundle is not None:
+            feature = feature_bundle.get_feature(base, name, encoding=encoding)
+        if feature is None and feature_cache is not None:
+            key = feature_cache.get_key(base, name, encoding=encoding)
+            feature = feature_cache.load(key)
+        if feature is not None:
+            features.add(full_name, feature, signature, racy=racy)
+        else:
+            pending.append((full_name, base, name, key, signature, racy))
+
+    if len(pending) < PARALLEL_PARSE_THRESHOLD:
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        parsed = executor.map(
+            parse_feature,
+            [base for _, base, _, _, _, _ in pending],
+            [name for _, _, name, _, _, _ in pending],
+            itertools.repeat(encoding),
+            chunksize=max(1, len(pending) // (workers * 4)),
+        )
+        for (full_name, _, _, key, signature, racy), feature in zip(pending, parsed):
+            features.add(full_name, feature, signature, racy=racy)
+            if key is not None:
+                feature_cache.dump(key, feature)
@@ -0,0 +1,127 @@
+"""Persistent cache of the parsed feature files.
+
+When the ``bdd_features_cache`` ini option is enabled, the parsed features are stored in the pytest cache
+directory, so that the following test runs (and the xdist workers) don't parse the unchanged feature files again.
+"""
+import hashlib
+import os.path
+import pickle
+
+from .parser import PARSER_VERSION, parse_feature
+from .utils import CONFIG_STACK
+
+CACHE_DIR_NAME = "pytest-bdd-features"
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    parser.addini(
+        "bdd_features_cache",
+        "Store the parsed feature files in the pytest cache directory.",
+        type="bool",
+        default=False,
+    )
+
+
+def configure(config):
+    cache = getattr(config, "cache", None)
+    if cache is not None and config.getini("bdd_features_cache"):
+        # Cache.makedir is deprecated since pytest 7.0 in favor of Cache.mkdir
+        make_cache_dir = getattr(cache, "mkdir", None) or cache.makedir
+        config._bddfeaturecache = FeatureCache(str(make_cache_dir(CACHE_DIR_NAME)))
+
+
+def get_feature_cache():
+    """Get the persistent feature cache of the current pytest session.
+
+    :return: `FeatureCache` instance or `None` if the cache is disabled.
+    """
+    if not CONFIG_STACK:
+        return None
+    return getattr(CONFIG_STACK[-1], "_bddfeaturecache", None)
+
+
+class FeatureCache:
+    """Pickled features stored in a directory, one file per feature file."""
+
+    def __init__(self, path):
+        """Feature cache constructor.
+
+        :param str path: Cache directory.
+        """
+        self.path = path
+
+    def get_entry_path(self, filename):
+        """Get the cache entry path of the feature file.
+
+        :param str filename: Absolute path to the feature file.
+        """
+        return os.path.join(self.path, hashlib.sha1(filename.encode("utf-8")).hexdigest())
+
+    def get_key(self, basedir, filename, encoding="utf-8"):
+        """Get the cache key of the feature file.
+
+        :param str basedir: Feature files base directory.
+        :param str filename: Relative path to the feature file.
+        :param str encoding: Feature file encoding.
+
+        :return: `tuple` of the parser version, the file names, the encoding, the file mtime, size and content hash.
+        """
+        abs_filename = os.path.abspath(os.path.join(basedir, filename))
+        stat = os.stat(abs_filename)
+        with open(abs_filename, "rb") as f:
+            digest = hashlib.sha1(f.read()).hexdigest()
+        return (PARSER_VERSION, abs_filename, basedir, filename, encoding, stat.st_mtime_ns, stat.st_size, digest)
+
+    def get_feature(self, basedir, filename, encoding="utf-8"):
+        """Get the parsed feature from the cache, parse and store it if the cache entry is missing or stale.
+
+        The whole feature file is parsed before it's stored, so that the scenarios are not parsed again
+        on every run, as the scenarios of the features indexed by `pytest_bdd.parser.index_feature` are.
+
+        :param str basedir: Feature files base directory.
+        :param str filename: Relative path to the feature file.
+        :param str encoding: Feature file encoding.
+
+        :return: `Feature` instance.
+        """
+        key = self.get_key(basedir, filename, encoding=encoding)
+        feature = self.load(key)
+        if feature is None:
+            feature = parse_feature(basedir, filename, encoding=encoding)
+            self.dump(key, feature)
+        return feature
+
+    def load(self, key):
+        """Load the cache entry.
+
+        :param tuple key: Cache key of the feature file.
+
+        :return: `Feature` instance or `None` if the entry is missing, stale or broken.
+        """
+        try:
+            with open(self.get_entry_path(key[1]), "rb") as f:
+                # The key is pickled separately, so that the stale entries are never unpickled.
+                if pickle.load(f) != key:
+                    return None
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def dump(self, key, feature):
+        """Store the cache entry.
+
+        The entry is written to a temporary file first, so that concurrent readers never see a partial entry.
+
+        :param tuple key: Cache key of the feature file.
+        :param pytest_bdd.parser.Feature feature: Parsed feature.
+        """
+        entry_path = self.get_entry_path(key[1])
+        tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(feature, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            pass
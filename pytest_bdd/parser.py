@@ -1,28 +1,80 @@
+import codecs
+import functools
 import io
+import itertools
 import os.path
 import re
+import sys
 import textwrap
-from collections import OrderedDict
+from array import array
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping, Sequence
 
 from . import types, exceptions
+from .dialects import DEFAULT_LANGUAGE, DIALECTS, get_dialect, get_language, get_prefixes
+
+# Version of the parsed feature representation, bump it whenever the parser output changes.
+PARSER_VERSION = 12
 
 SPLIT_LINE_RE = re.compile(r"(?<!\\)\|")
 COMMENT_RE = re.compile(r"(^|(?<=\s))#")
-STEP_PREFIXES = [
-    ("Feature: ", types.FEATURE),
-    ("Scenario Outline: ", types.SCENARIO_OUTLINE),
-    ("Examples: Vertical", types.EXAMPLES_VERTICAL),
-    ("Examples:", types.EXAMPLES),
-    ("Scenario: ", types.SCENARIO),
-    ("Background:", types.BACKGROUND),
-    ("Given ", types.GIVEN),
-    ("When ", types.WHEN),
-    ("Then ", types.THEN),
-    ("@", types.TAG),
-    # Continuation of the previously mentioned step type
-    ("And ", None),
-    ("But ", None),
-]
+BUILTIN_MODULES = frozenset(("__builtin__", "builtins"))
+# DOTALL is needed to make the "." match also new lines
+MULTILINE_QUOTES_RE = re.compile(r'^"""\n(?P<content>.*)\n"""$', flags=re.DOTALL)
+# Line boundaries of the UTF-8 encoded text, the same as the ones `str.splitlines` splits on
+LINE_BREAK_RE = re.compile(rb"\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+LINE_BREAKS = (b"\r", b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9")
+# ASCII characters stripped by `str.lstrip`, besides the line boundaries
+INDENT_RE = re.compile(rb"[ \t\x1f]*")
+# Feature files larger than this are kept encoded and scanned without decoding their multiline steps
+BUFFER_THRESHOLD = 1024 * 1024
+# Line prefixes of the English keywords
+STEP_PREFIXES = get_prefixes(DIALECTS[DEFAULT_LANGUAGE])
+
+Token = namedtuple("Token", ["line_number", "line", "indent", "stripped", "clean", "type", "keyword", "text"])
+Token.__doc__ = """Lexical token of a single feature file line.
+
+:param int line_number: Line number.
+:param str line: Raw line.
+:param int indent: Line indentation.
+:param str stripped: Line without the leading and trailing whitespaces.
+:param str clean: Stripped line without comments.
+:param str type: Step type detected by the line prefix, or `None`.
+:param str keyword: Matched prefix without whitespaces (e.g. "Given"), or "".
+:param str text: Clean line without the prefix.
+"""
+
+
+def match_prefix(line, language=DEFAULT_LANGUAGE):
+    """Find the step prefix the line starts with.
+
+    All the keywords of the language are matched at once by the keyword trie of the dialect.
+
+    :param str line: Stripped line of the Feature file.
+    :param str language: Feature file language.
+
+    :return: `tuple` in form ("<keyword>", "<Line without the prefix>", <type>).
+    """
+    return get_dialect(language).match(line)
+
+
+def tokenize(lines, start=1, language=DEFAULT_LANGUAGE):
+    """Split the feature file lines into tokens, scanning each line once.
+
+    :param lines: Iterable of the Feature file lines.
+    :param int start: Line number of the first line.
+    :param str language: Feature file language.
+
+    :return: Generator of `Token` objects.
+    """
+    match = get_dialect(language).match
+    for line_number, line in enumerate(lines, start=start):
+        unindented = line.lstrip()
+        indent = len(line) - len(unindented)
+        stripped = unindented.rstrip()
+        clean = strip_comments(stripped) if "#" in stripped else stripped
+        keyword, text, _type = match(clean)
+        yield Token(line_number, line, indent, stripped, clean, _type, keyword, text)
 
 
 def split_line(line):
@@ -35,6 +87,37 @@ def split_line(line):
     return [cell.replace("\\|", "|").strip() for cell in SPLIT_LINE_RE.split(line)[1:-1]]
 
 
+def count_cells(line):
+    """Count the values of the given Examples line without splitting it.
+
+    :param str line: Feature file Examples line.
+
+    :return: Number of the values `split_line` would return.
+    """
+    return max(line.count("|") - line.count("\\|") - 1, 0)
+
+
+def split_table(lines, size):
+    """Split the given Examples lines into columns at once.
+
+    The lines are split by a single regex split of the whole table, the values are sliced out by columns.
+
+    :param list lines: Feature file Examples lines, each of `size` values.
+    :param int size: Number of the values of each line.
+
+    :return: `list` of columns, a `list` of strings per value of the line.
+    """
+    text = "\n".join(lines)
+    # The lines are separated by the pieces after the last and before the first separator of the adjacent lines
+    if "\\|" in text:
+        pieces = [piece.replace("\\|", "|") for piece in SPLIT_LINE_RE.split(text)]
+    else:
+        # Without the escaped separators it's a plain split, which is a lot faster than the regex one
+        pieces = text.split("|")
+    stride = size + 1
+    return [list(map(str.strip, pieces[index::stride])) for index in range(1, stride)]
+
+
 def parse_line(line):
     """Parse step line to get the step prefix (Scenario, Given, When, Then or And) and the actual step name.
 
@@ -42,10 +125,8 @@ def parse_line(line):
 
     :return: `tuple` in form ("<prefix>", "<Line without the prefix>").
     """
-    for prefix, _ in STEP_PREFIXES:
-        if line.startswith(prefix):
-            return prefix.strip(), line[len(prefix) :].strip()
-    return "", line
+    keyword, text, _ = match_prefix(line)
+    return keyword, text
 
 
 def strip_comments(line):
@@ -68,9 +149,7 @@ def get_step_type(line):
 
     :return: SCENARIO, GIVEN, WHEN, THEN, or `None` if can't be detected.
     """
-    for prefix, _type in STEP_PREFIXES:
-        if line.startswith(prefix):
-            return _type
+    return match_prefix(line)[2]
 
 
 def parse_feature(basedir, filename, encoding="utf-8"):
@@ -80,9 +159,111 @@ def parse_feature(basedir, filename, encoding="utf-8"):
     :param str filename: Relative path to the feature file.
     :param str encoding: Feature file encoding (utf-8 by default).
     """
+    feature = None
+    for item in iter_feature(basedir, filename, encoding=encoding):
+        if isinstance(item, Feature):
+            feature = item
+        elif isinstance(item, Scenario):
+            feature.scenarios[item.name] = item
+    feature.tag_index = get_tag_index((name, scenario.tags) for name, scenario in feature.scenarios.items())
+    return feature
+
+
+def iter_lines(f):
+    """Iterate over the lines of the file object without reading the whole file.
+
+    :param f: File object opened in the text mode.
+
+    :return: Generator of lines split the same way as `str.splitlines` does.
+    """
+    for line in f:
+        yield from line.splitlines()
+
+
+def iter_feature(basedir, filename, encoding="utf-8"):
+    """Parse the feature file incrementally.
+
+    The feature is yielded as soon as its header is parsed, followed by its background (if any).
+    Then every scenario is yielded as soon as it is completely parsed. Scenarios are not stored in the
+    `Feature.scenarios`, so the memory usage is bounded by the largest scenario, not by the whole file.
+
+    :param str basedir: Feature files base directory.
+    :param str filename: Relative path to the feature file.
+    :param str encoding: Feature file encoding (utf-8 by default).
+
+    :return: Generator of `Feature`, `Background` and `Scenario` objects.
+    """
+    feature = _create_feature(basedir, filename)
+    with open(feature.filename, encoding=encoding) as f:
+        lines = iter_lines(f)
+        # Only the comments before the feature line are read to detect the language
+        head = []
+        for line in lines:
+            head.append(line)
+            if line.strip() and not line.lstrip().startswith("#"):
+                break
+        feature.language = _detect_language(head, filename)
+        tokens = tokenize(itertools.chain(head, lines), language=feature.language)
+        yield from _parse_tokens(tokens, feature, filename)
+
+
+def index_feature(basedir, filename, encoding="utf-8"):
+    """Parse the feature file header and index its scenarios, which are parsed on demand.
+
+    The scenario sections are found by `scan_sections`, so only the scenarios that are actually
+    accessed through `Feature.scenarios` are parsed, their tags are indexed from the sections though.
+    The large files are kept encoded in a `FeatureBuffer`, so the multiline step content of their scenarios
+    is only decoded when the step name is accessed.
+
+    :param str basedir: Feature files base directory.
+    :param str filename: Relative path to the feature file.
+    :param str encoding: Feature file encoding (utf-8 by default).
+
+    :return: `Feature` instance with a `ScenarioIndex` as the scenarios.
+    """
+    feature = _create_feature(basedir, filename)
+    lines = read_feature_lines(feature.filename, encoding=encoding)
+    language = feature.language = _detect_language(lines, filename)
+
+    sections = scan_sections(lines, language=language)
+    if sections is None:
+        for item in _parse_tokens(tokenize(lines, language=language), feature, filename):
+            if isinstance(item, Scenario):
+                feature.scenarios[item.name] = item
+        feature.tag_index = get_tag_index((name, scenario.tags) for name, scenario in feature.scenarios.items())
+        return feature
+
+    header_end = sections[0].start if sections else len(lines)
+    for _ in _parse_tokens(tokenize(lines[:header_end], language=language), feature, filename):
+        pass
+    feature.scenarios = ScenarioIndex(feature, filename, lines, sections)
+    feature.tag_index = get_tag_index((section.name, get_tags(section.prev_line)) for section in sections)
+    return feature
+
+
+def _detect_language(lines, filename):
+    """Detect the language of the feature file by the ``# language:`` comment.
+
+    :param lines: Sequence of the Feature file lines, only the leading comments are read.
+    :param str filename: Relative path to the feature file.
+
+    :return: Language code.
+    """
+    language, index = get_language(lines)
+    if language not in DIALECTS:
+        raise exceptions.FeatureError(f"Unknown language {language!r}", index + 1, lines[index].strip(), filename)
+    return language
+
+
+def _create_feature(basedir, filename):
+    """Create an empty feature of the feature file.
+
+    :param str basedir: Feature files base directory.
+    :param str filename: Relative path to the feature file.
+    """
     abs_filename = os.path.abspath(os.path.join(basedir, filename))
     rel_filename = os.path.join(os.path.basename(basedir), filename)
-    feature = Feature(
+    return Feature(
         scenarios=OrderedDict(),
         filename=abs_filename,
         rel_filename=rel_filename,
@@ -92,34 +273,311 @@ def parse_feature(basedir, filename, encoding="utf-8"):
         examples=Examples(),
         background=None,
         description="",
+        tag_index={},
+        language=DEFAULT_LANGUAGE,
     )
-    scenario = None
+
+
+def read_feature_lines(filename, encoding="utf-8"):
+    """Read the lines of the feature file.
+
+    The files larger than `BUFFER_THRESHOLD` are read as bytes and not decoded at once, the files in other
+    encodings than UTF-8 are decoded and encoded to UTF-8 though. The bytes are owned by the buffer, not mapped
+    from the file, so the cached features are not affected by the later changes of the file.
+
+    :param str filename: Absolute path to the feature file.
+    :param str encoding: Feature file encoding (utf-8 by default).
+
+    :return: `list` of the lines or `FeatureBuffer` instance for the large files.
+    """
+    if os.path.getsize(filename) <= BUFFER_THRESHOLD:
+        with open(filename, encoding=encoding) as f:
+            return f.read().splitlines()
+
+    with open(filename, "rb") as f:
+        data = f.read()
+    if codecs.lookup(encoding).name != "utf-8":
+        data = data.decode(encoding).encode("utf-8")
+    return FeatureBuffer(data)
+
+
+def iter_indents(lines):
+    """Iterate over the indents of the feature file lines.
+
+    :param lines: `list` of the lines or `FeatureBuffer` instance.
+
+    :return: Generator of (<line indent>, <whether the line is blank>, <unindented line>) tuples. The unindented
+             line is `bytes` if the line is not decoded yet.
+    """
+    if isinstance(lines, FeatureBuffer):
+        yield from lines.iter_indents()
+        return
+    for line in lines:
+        unindented_line = line.lstrip()
+        yield len(line) - len(unindented_line), not unindented_line, unindented_line
+
+
+class FeatureBuffer(Sequence):
+    """Lines of the UTF-8 encoded feature file, decoded on access."""
+
+    __slots__ = ("data", "starts", "ends")
+
+    def __init__(self, data, offsets=None):
+        """Feature buffer constructor.
+
+        :param bytes data: UTF-8 encoded feature file.
+        :param tuple offsets: Start and end offsets of the lines, found in the data if not given.
+        """
+        self.data = data
+        if offsets is None:
+            starts, ends = array("q", [0]), array("q")
+            if any(data.find(line_break) != -1 for line_break in LINE_BREAKS):
+                for match in LINE_BREAK_RE.finditer(data):
+                    ends.append(match.start())
+                    starts.append(match.end())
+            else:
+                # Only the "\n" line breaks, which are found a lot faster than the regex matches
+                end = data.find(b"\n")
+                while end != -1:
+                    ends.append(end)
+                    starts.append(end + 1)
+                    end = data.find(b"\n", end + 1)
+            if starts[-1] < len(data):
+                ends.append(len(data))
+            else:
+                # No empty line after the last line break, the same as `str.splitlines` does
+                starts.pop()
+            offsets = starts, ends
+        self.starts, self.ends = offsets
+
+    def __reduce__(self):
+        return self.__class__, (self.data, (self.starts, self.ends))
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            if start >= stop:
+                return []
+            # Decode the lines at once, the line boundaries are the same ones `str.splitlines` splits on
+            lines = self.data[self.starts[start] : self.ends[stop - 1]].decode("utf-8").splitlines()
+            if len(lines) < stop - start:
+                # The trailing empty line is lost by `str.splitlines`
+                lines.append("")
+            return lines
+        return self.data[self.starts[index] : self.ends[index]].decode("utf-8")
+
+    def iter_indents(self):
+        """Iterate over the indents of the lines, only the lines indented by non-ASCII characters are decoded.
+
+        :return: Generator of (<line indent>, <whether the line is blank>, <unindented line>) tuples. The unindented
+                 line is `bytes` if it's not decoded.
+        """
+        data, match_indent = self.data, INDENT_RE.match
+        for start, end in zip(self.starts, self.ends):
+            pos = match_indent(data, start, end).end()
+            if pos < end and data[pos] >= 0x80:
+                # Possibly indented by non-ASCII whitespace
+                line = data[start:end].decode("utf-8")
+                unindented_line = line.lstrip()
+                yield len(line) - len(unindented_line), not unindented_line, unindented_line
+            else:
+                yield pos - start, pos == end, data[pos:end]
+
+
+class StepLines(Sequence):
+    """Multiline step content kept in the feature buffer until the step name is accessed."""
+
+    __slots__ = ("buffer", "start", "end")
+
+    def __init__(self, buffer, start, end):
+        """Step lines constructor.
+
+        :param FeatureBuffer buffer: Feature file buffer.
+        :param int start: Index of the first line.
+        :param int end: Index of the line after the last line.
+        """
+        self.buffer = buffer
+        self.start = start
+        self.end = end
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def __iter__(self):
+        return iter(self.buffer[self.start : self.end])
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        return self.buffer[self.start + index]
+
+    def get_params(self):
+        """Get the params of the lines without decoding the lines.
+
+        The params are found in the encoded lines one by one, the "<" and ">" delimiters are never a part
+        of a multibyte UTF-8 character.
+
+        :return: `set` of the param names.
+        """
+        buffer = self.buffer
+        data, starts, ends = buffer.data, buffer.starts, buffer.ends
+        params = set()
+        for index in range(self.start, self.end):
+            params.update(STEP_PARAM_BYTES_RE.findall(data, starts[index], ends[index]))
+        return {param.decode("utf-8") for param in params}
+
+
+ScenarioSection = namedtuple("ScenarioSection", ["name", "start", "end", "mode", "prev_line", "blocks"])
+ScenarioSection.__doc__ = """Lines of a single scenario in the feature file.
+
+:param str name: Scenario name.
+:param int start: Index of the scenario line.
+:param int end: Index of the line after the last line of the scenario.
+:param str mode: Parser mode of the scenario line (SCENARIO or SCENARIO_OUTLINE).
+:param str prev_line: Clean line preceding the scenario line (possibly with the scenario tags).
+:param tuple blocks: `tuple` of the (start, end) line indexes of the multiline step content
+                     left undecoded in the `FeatureBuffer`.
+"""
+
+
+def scan_sections(lines, language=DEFAULT_LANGUAGE):
+    """Find the scenario sections of the feature file without parsing them.
+
+    The lines are classified the same way the parser does, but only the keywords needed
+    to tell the scenario lines from the multiline step content are detected.
+    The multiline step content of a `FeatureBuffer` is not decoded, but recorded in the section blocks.
+
+    :param lines: `list` of the Feature file lines or `FeatureBuffer` instance.
+    :param str language: Feature file language.
+
+    :return: `list` of `ScenarioSection` objects or `None` if the file can't be split into
+             sections (when there is a background after the scenarios).
+    """
+    dialect = get_dialect(language)
+    headers = []
+    blocks = []
+    block_start = None
     mode = None
     prev_mode = None
-    description = []
-    step = None
+    step_indent = None
     multiline_step = False
     prev_line = None
 
-    with open(abs_filename, encoding=encoding) as f:
-        content = f.read()
+    for index, (line_indent, blank, unindented_line) in enumerate(iter_indents(lines)):
+        if step_indent is not None and (step_indent < line_indent or (blank and multiline_step)):
+            multiline_step = True
+            if block_start is None:
+                block_start = index
+            continue
+        if block_start is not None:
+            blocks.append((block_start, index))
+            block_start = None
+        step_indent = None
+        multiline_step = False
+        if not isinstance(unindented_line, str):
+            # The multiline step content of the feature buffer is never decoded
+            unindented_line = unindented_line.decode("utf-8")
+        clean_line = strip_comments(unindented_line) if "#" in unindented_line else unindented_line.rstrip()
+        if not clean_line:
+            if prev_mode == types.FEATURE:
+                prev_line = clean_line
+            continue
 
-    for line_number, line in enumerate(content.splitlines(), start=1):
-        unindented_line = line.lstrip()
-        line_indent = len(line) - len(unindented_line)
-        if step and (step.indent < line_indent or ((not unindented_line) and multiline_step)):
+        if clean_line[0] in dialect.first_chars:
+            _, parsed_line, _type = dialect.match(clean_line)
+            mode = _type or mode
+        else:
+            parsed_line = clean_line
+        if mode in (types.SCENARIO, types.SCENARIO_OUTLINE):
+            headers.append((parsed_line, index, mode, prev_line))
+        elif mode == types.BACKGROUND and headers:
+            return None
+
+        prev_mode = mode
+        if mode == types.EXAMPLES:
+            mode = types.EXAMPLES_HEADERS
+        elif mode == types.EXAMPLES_VERTICAL:
+            mode = types.EXAMPLE_LINE_VERTICAL
+        elif mode == types.EXAMPLES_HEADERS:
+            mode = types.EXAMPLE_LINE
+        elif mode in types.STEP_TYPES:
+            step_indent = line_indent
+        prev_line = clean_line
+
+    if block_start is not None:
+        blocks.append((block_start, len(lines)))
+    if not isinstance(lines, FeatureBuffer):
+        # The decoded multiline step content is parsed along with the other lines
+        blocks = []
+
+    sections = []
+    ends = [start for _, start, _, _ in headers[1:]] + [len(lines)]
+    # Both the blocks and the sections are ordered, the blocks before the first section belong to the header
+    blocks = iter(blocks)
+    block = next(blocks, None)
+    for (name, start, mode, prev_line), end in zip(headers, ends):
+        section_blocks = []
+        while block is not None and block[0] < end:
+            if block[0] >= start:
+                section_blocks.append(block)
+            block = next(blocks, None)
+        sections.append(ScenarioSection(name, start, end, mode, prev_line, tuple(section_blocks)))
+    return sections
+
+
+def _finalize_header(feature, description):
+    """Finalize the feature header once the first scenario or the end of file is reached.
+
+    :return: `list` of the parsed `Feature` and `Background` objects.
+    """
+    feature.description = "\n".join(description).strip()
+    return [feature, feature.background] if feature.background else [feature]
+
+
+def _parse_tokens(tokens, feature, filename, mode=None, prev_line=None, header=True):
+    """Parse the feature file tokens into the feature.
+
+    :param tokens: Iterable of `Token` objects.
+    :param pytest_bdd.parser.Feature feature: Feature to parse into.
+    :param str filename: Relative path to the feature file.
+    :param str mode: Parser mode before the tokens.
+    :param str prev_line: Clean line preceding the tokens.
+    :param bool header: Whether the tokens start with the feature header.
+
+    :return: Generator of `Feature`, `Background` and `Scenario` objects.
+    """
+    scenario = None
+    prev_mode = None
+    description = []
+    step = None
+    multiline_step = False
+
+    for token in tokens:
+        line_number, line_indent = token.line_number, token.indent
+        stripped_line, clean_line = token.stripped, token.clean
+        if step and (step.indent < line_indent or ((not stripped_line) and multiline_step)):
             multiline_step = True
             # multiline step, so just add line and continue
-            step.add_line(line)
+            step.add_line(token.line)
             continue
         else:
             step = None
             multiline_step = False
-        stripped_line = line.strip()
-        clean_line = strip_comments(line)
         if not clean_line and (not prev_mode or prev_mode not in types.FEATURE):
             continue
-        mode = get_step_type(clean_line) or mode
+        mode = token.type or mode
 
         allowed_prev_mode = (types.BACKGROUND, types.GIVEN, types.WHEN)
 
@@ -130,7 +588,7 @@ def parse_feature(basedir, filename, encoding="utf-8"):
 
         if mode == types.FEATURE:
             if prev_mode is None or prev_mode == types.TAG:
-                _, feature.name = parse_line(clean_line)
+                feature.name = token.text
                 feature.line_number = line_number
                 feature.tags = get_tags(prev_line)
             elif prev_mode == types.FEATURE:
@@ -145,11 +603,15 @@ def parse_feature(basedir, filename, encoding="utf-8"):
 
         prev_mode = mode
 
-        # Remove Feature, Given, When, Then, And
-        keyword, parsed_line = parse_line(clean_line)
+        # Feature, Given, When, Then, And are already removed by the tokenizer
+        keyword, parsed_line = token.keyword, token.text
         if mode in [types.SCENARIO, types.SCENARIO_OUTLINE]:
+            if scenario:
+                yield scenario
+            elif header:
+                yield from _finalize_header(feature, description)
             tags = get_tags(prev_line)
-            feature.scenarios[parsed_line] = scenario = Scenario(feature, parsed_line, line_number, tags=tags)
+            scenario = Scenario(feature, parsed_line, line_number, tags=tags)
         elif mode == types.BACKGROUND:
             feature.background = Background(feature=feature, line_number=line_number)
         elif mode == types.EXAMPLES:
@@ -161,12 +623,14 @@ def parse_feature(basedir, filename, encoding="utf-8"):
         elif mode == types.EXAMPLES_HEADERS:
             (scenario or feature).examples.set_param_names([l for l in split_line(parsed_line) if l])
             mode = types.EXAMPLE_LINE
-        elif mode == types.EXAMPLE_LINE:
-            (scenario or feature).examples.add_example([l for l in split_line(stripped_line)])
-        elif mode == types.EXAMPLE_LINE_VERTICAL:
-            param_line_parts = [l for l in split_line(stripped_line)]
+        elif mode in (types.EXAMPLE_LINE, types.EXAMPLE_LINE_VERTICAL):
+            examples = (scenario or feature).examples
             try:
-                (scenario or feature).examples.add_example_row(param_line_parts[0], param_line_parts[1:])
+                if mode == types.EXAMPLE_LINE:
+                    examples.add_example_line(stripped_line)
+                else:
+                    param_line_parts = split_line(stripped_line)
+                    examples.add_example_row(param_line_parts[0], param_line_parts[1:])
             except exceptions.ExamplesNotValidError as exc:
                 if scenario:
                     raise exceptions.FeatureError(
@@ -183,7 +647,14 @@ def parse_feature(basedir, filename, encoding="utf-8"):
                         filename,
                     )
         elif mode and mode not in (types.FEATURE, types.TAG):
-            step = Step(name=parsed_line, type=mode, indent=line_indent, line_number=line_number, keyword=keyword)
+            # The same step texts are repeated across the scenarios, share a single string per text
+            step = Step(
+                name=sys.intern(parsed_line),
+                type=mode,
+                indent=line_indent,
+                line_number=line_number,
+                keyword=sys.intern(keyword),
+            )
             if feature.background and not scenario:
                 target = feature.background
             else:
@@ -191,32 +662,177 @@ def parse_feature(basedir, filename, encoding="utf-8"):
             target.add_step(step)
         prev_line = clean_line
 
-    feature.description = "\n".join(description).strip()
-    return feature
+    if scenario:
+        yield scenario
+    elif header:
+        yield from _finalize_header(feature, description)
 
 
 class Feature:
     """Feature."""
 
-    def __init__(self, scenarios, filename, rel_filename, name, tags, examples, background, line_number, description):
+    __slots__ = (
+        "scenarios",
+        "rel_filename",
+        "filename",
+        "name",
+        "tags",
+        "examples",
+        "line_number",
+        "description",
+        "background",
+        "tag_index",
+        "language",
+    )
+
+    def __init__(
+        self,
+        scenarios,
+        filename,
+        rel_filename,
+        name,
+        tags,
+        examples,
+        background,
+        line_number,
+        description,
+        tag_index=None,
+        language=DEFAULT_LANGUAGE,
+    ):
         self.scenarios = scenarios
         self.rel_filename = rel_filename
         self.filename = filename
         self.name = name
         self.tags = tags
         self.examples = examples
-        self.name = name
         self.line_number = line_number
-        self.tags = tags
-        self.scenarios = scenarios
         self.description = description
         self.background = background
+        self.tag_index = tag_index if tag_index is not None else {}
+        self.language = language
+
+    def select_scenarios(self, tags):
+        """Get the names of the scenarios tagged with any of the tags, without parsing the other scenarios.
+
+        The scenarios are looked up in the `tag_index`, which maps the scenario tags to the scenario names.
+        All the scenarios are selected when the feature itself is tagged with any of the tags.
+
+        :param tags: Iterable of the tags without the "@".
+
+        :return: `list` of the scenario names in the feature file order.
+        """
+        tags = set(tags)
+        if not tags.isdisjoint(self.tags):
+            return list(self.scenarios)
+        selected = set()
+        for tag in tags:
+            selected.update(self.tag_index.get(tag, ()))
+        return [name for name in self.scenarios if name in selected]
+
+
+class ScenarioIndex(MutableMapping):
+    """Scenarios of the feature, parsed from their sections on the first access."""
+
+    __slots__ = ("feature", "filename", "lines", "pending", "scenarios")
+
+    def __init__(self, feature, filename, lines, sections):
+        """Scenario index constructor.
+
+        :param pytest_bdd.parser.Feature feature: Feature.
+        :param str filename: Relative path to the feature file.
+        :param lines: `list` of the Feature file lines or `FeatureBuffer` instance.
+        :param list sections: `list` of `ScenarioSection` objects.
+        """
+        self.feature = feature
+        self.filename = filename
+        self.lines = lines
+        self.scenarios = OrderedDict((section.name, section) for section in sections)
+        self.pending = len(self.scenarios)
+
+    def __getitem__(self, name):
+        scenario = self.scenarios[name]
+        if isinstance(scenario, ScenarioSection):
+            scenario = self.scenarios[name] = self.parse_section(scenario)
+        return scenario
+
+    def __setitem__(self, name, scenario):
+        self.discard_section(name)
+        self.scenarios[name] = scenario
+
+    def __delitem__(self, name):
+        self.discard_section(name)
+        del self.scenarios[name]
+
+    def __iter__(self):
+        return iter(self.scenarios)
+
+    def __len__(self):
+        return len(self.scenarios)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({list(self.scenarios)!r})"
+
+    def parse_section(self, section):
+        """Parse the scenario section.
+
+        :param ScenarioSection section: Scenario section.
+
+        :return: `Scenario` instance.
+        """
+        # The multiline step content is left out and attached to the steps undecoded
+        lines = self.lines
+        language = self.feature.language
+        segments = []
+        start = section.start
+        for block_start, block_end in section.blocks:
+            segments.append(tokenize(lines[start:block_start], start=start + 1, language=language))
+            start = block_end
+        segments.append(tokenize(lines[start : section.end], start=start + 1, language=language))
+
+        [scenario] = _parse_tokens(
+            itertools.chain.from_iterable(segments),
+            self.feature,
+            self.filename,
+            mode=section.mode,
+            prev_line=section.prev_line,
+            header=False,
+        )
+        if section.blocks:
+            blocks = {block_start: block_end for block_start, block_end in section.blocks}
+            for step in scenario._steps:
+                # The step line number is the index of the line following the step
+                block_end = blocks.get(step.line_number)
+                if block_end is not None:
+                    step.lines = StepLines(lines, step.line_number, block_end)
+        self.discard_section(section.name)
+        return scenario
+
+    def discard_section(self, name):
+        """Release the feature file lines once there are no sections left to parse."""
+        if isinstance(self.scenarios.get(name), ScenarioSection):
+            self.pending -= 1
+            if not self.pending:
+                self.lines = None
 
 
 class Scenario:
 
     """Scenario."""
 
+    __slots__ = (
+        "feature",
+        "name",
+        "_steps",
+        "examples",
+        "line_number",
+        "example_converters",
+        "tags",
+        "failed",
+        "test_function",
+        "_steps_cache",
+        "_params_cache",
+    )
+
     def __init__(self, feature, name, line_number, example_converters=None, tags=None):
         """Scenario constructor.
 
@@ -235,6 +851,8 @@ class Scenario:
         self.tags = tags or set()
         self.failed = False
         self.test_function = None
+        self._steps_cache = None
+        self._params_cache = None
 
     def add_step(self, step):
         """Add step to the scenario.
@@ -243,18 +861,22 @@ class Scenario:
         """
         step.scenario = self
         self._steps.append(step)
+        self._steps_cache = None
 
     @property
     def steps(self):
         """Get scenario steps including background steps.
 
-        :return: List of steps.
+        The steps are cached until a step is added to the scenario or to the feature background.
+
+        :return: Tuple of steps.
         """
-        result = []
-        if self.feature.background:
-            result.extend(self.feature.background.steps)
-        result.extend(self._steps)
-        return result
+        background = self.feature.background
+        background_key = (background, len(background.steps)) if background else None
+        if self._steps_cache is None or self._steps_cache[0] != background_key:
+            background_steps = background.steps if background else []
+            self._steps_cache = (background_key, tuple(background_steps + self._steps))
+        return self._steps_cache[1]
 
     @property
     def params(self):
@@ -263,7 +885,10 @@ class Scenario:
         :return: Parameter names.
         :rtype: frozenset
         """
-        return frozenset(sum((list(step.params) for step in self.steps), []))
+        steps = self.steps
+        if self._params_cache is None or self._params_cache[0] is not steps:
+            self._params_cache = (steps, frozenset(itertools.chain.from_iterable(step.params for step in steps)))
+        return self._params_cache[1]
 
     def get_example_params(self):
         """Get example parameter names."""
@@ -294,6 +919,22 @@ class Step:
 
     """Step."""
 
+    __slots__ = (
+        "lines",
+        "_name",
+        "_full_name",
+        "_params",
+        "keyword",
+        "indent",
+        "type",
+        "line_number",
+        "failed",
+        "start",
+        "stop",
+        "scenario",
+        "background",
+    )
+
     def __init__(self, name, type, indent, line_number, keyword):
         """Step constructor.
 
@@ -303,9 +944,9 @@ class Step:
         :param int line_number: line number.
         :param str keyword: step keyword.
         """
+        self.lines = []
         self.name = name
         self.keyword = keyword
-        self.lines = []
         self.indent = indent
         self.type = type
         self.line_number = line_number
@@ -320,28 +961,61 @@ class Step:
 
         :param str line: Line of text - the continuation of the step name.
         """
+        if not isinstance(self.lines, list):
+            self.lines = list(self.lines)
         self.lines.append(line)
+        self._full_name = self._params = None
 
     @property
     def name(self):
-        """Get step name."""
-        multilines_content = textwrap.dedent("\n".join(self.lines)) if self.lines else ""
-
-        # Remove the multiline quotes, if present.
-        multilines_content = re.sub(
-            pattern=r'^"""\n(?P<content>.*)\n"""$',
-            repl=r"\g<content>",
-            string=multilines_content,
-            flags=re.DOTALL,  # Needed to make the "." match also new lines
-        )
+        """Get step name.
 
-        lines = [self._name] + [multilines_content]
-        return "\n".join(lines).strip()
+        The name including the multiline content is computed on the first access and memoized
+        until the step is changed. The single line name is interned, so the steps with the same text share it.
+        The names with the multiline content are not, they can be large and interning would keep them alive.
+        """
+        if self._full_name is None:
+            if self.lines:
+                multilines_content = textwrap.dedent("\n".join(self.lines))
+
+                # Remove the multiline quotes, if present.
+                multilines_content = MULTILINE_QUOTES_RE.sub(r"\g<content>", multilines_content)
+
+                self._full_name = "\n".join([self._name, multilines_content]).strip()
+            else:
+                self._full_name = sys.intern(self._name.strip())
+        return self._full_name
 
     @name.setter
     def name(self, value):
         """Set step name."""
         self._name = value
+        self._full_name = self._params = None
+
+    def __getstate__(self):
+        """Get the step state as a tuple of the slot values, which is faster to unpickle than a dict."""
+        return tuple(getattr(self, attr) for attr in self.__slots__)
+
+    def __setstate__(self, state):
+        """Restore the unpickled step, interning its texts again."""
+        (
+            self.lines,
+            name,
+            full_name,
+            self._params,
+            keyword,
+            self.indent,
+            self.type,
+            self.line_number,
+            self.failed,
+            self.start,
+            self.stop,
+            self.scenario,
+            self.background,
+        ) = state
+        self._name = sys.intern(name)
+        self._full_name = full_name if full_name is None or self.lines else sys.intern(full_name)
+        self.keyword = sys.intern(keyword)
 
     def __str__(self):
         """Full step name including the type."""
@@ -349,14 +1023,31 @@ class Step:
 
     @property
     def params(self):
-        """Get step params."""
-        return tuple(frozenset(STEP_PARAM_RE.findall(self.name)))
+        """Get step params.
+
+        The params of the first line come from the shared params cache, the multiline content is scanned
+        line by line, without building the step name. The params of the content kept in the feature buffer
+        are found without decoding it.
+        """
+        if self._params is None:
+            params = get_step_params(self._name)
+            if self.lines:
+                if isinstance(self.lines, StepLines):
+                    content_params = self.lines.get_params()
+                else:
+                    content_params = {param for line in self.lines for param in STEP_PARAM_RE.findall(line)}
+                if content_params:
+                    params = tuple(content_params.union(params))
+            self._params = params
+        return self._params
 
 
 class Background:
 
     """Background."""
 
+    __slots__ = ("feature", "line_number", "steps")
+
     def __init__(self, feature, line_number):
         """Background constructor.
 
@@ -375,29 +1066,70 @@ class Background:
 
 class Examples:
 
-    """Example table."""
+    """Example table.
+
+    The values are stored by columns, one `list` per parameter. The example lines are kept unsplit
+    until the columns are accessed, then they are split at once by `split_table`.
+    The `examples` rows and the `vertical_examples` columns are built from the columns on access,
+    so they are changed by assigning them, not by changing the returned lists.
+    """
+
+    __slots__ = ("example_params", "_columns", "_lines", "line_number", "name", "_params")
 
     def __init__(self):
         """Initialize examples instance."""
         self.example_params = []
-        self.examples = []
-        self.vertical_examples = []
+        self._columns = []
+        self._lines = []
         self.line_number = None
         self.name = None
+        self._params = None
 
     def set_param_names(self, keys):
         """Set parameter names.
 
         :param names: `list` of `string` parameter names.
         """
-        self.example_params = [str(key) for key in keys]
+        example_params = [str(key) for key in keys]
+        if len(example_params) != len(self._columns):
+            if len(self):
+                raise exceptions.ExamplesNotValidError(
+                    f"Example rows should contain {len(example_params)} values, {len(self._columns)} found"
+                )
+            self._columns = [[] for _ in example_params]
+            self._lines = []
+        self.example_params = example_params
+        self._params = None
 
     def add_example(self, values):
         """Add example.
 
         :param values: `list` of `string` parameter values.
         """
-        self.examples.append(values)
+        if not self.example_params and not len(self):
+            # The parameter names can be set after the examples
+            self._columns = [[] for _ in values]
+        columns = self.columns
+        if len(values) != len(columns):
+            raise exceptions.ExamplesNotValidError(
+                f"Example rows should contain {len(columns)} values, {len(values)} found"
+            )
+        for column, value in zip(columns, values):
+            column.append(value)
+        self._params = None
+
+    def add_example_line(self, line):
+        """Add example line, it's only split when the columns are accessed.
+
+        :param str line: Feature file Examples line.
+        """
+        size = count_cells(line)
+        if size != len(self._columns):
+            raise exceptions.ExamplesNotValidError(
+                f"Example rows should contain {len(self._columns)} values, {size} found"
+            )
+        self._lines.append(line)
+        self._params = None
 
     def add_example_row(self, param, values):
         """Add example row.
@@ -409,40 +1141,132 @@ class Examples:
             raise exceptions.ExamplesNotValidError(
                 f"""Example rows should contain unique parameters. "{param}" appeared more than once"""
             )
+        columns = self.columns
+        if columns and len(values) != len(columns[0]):
+            raise exceptions.ExamplesNotValidError(
+                f"Example rows should contain {len(columns[0])} values, {len(values)} found"
+            )
         self.example_params.append(param)
-        self.vertical_examples.append(values)
+        columns.append(list(values))
+        self._params = None
+
+    @property
+    def columns(self):
+        """Get the example columns, splitting the pending example lines.
+
+        :return: `list` of `list` of `string` parameter values, one per parameter.
+        """
+        if self._lines:
+            for column, values in zip(self._columns, split_table(self._lines, len(self._columns))):
+                column.extend(values)
+            self._lines = []
+        return self._columns
+
+    @property
+    def examples(self):
+        """Get the example rows.
+
+        :return: `list` of `list` of `string` parameter values.
+        """
+        return [list(row) for row in zip(*self.columns)]
+
+    @examples.setter
+    def examples(self, rows):
+        """Set the example rows.
+
+        :param rows: `list` of `list` of `string` parameter values.
+        """
+        rows = [list(row) for row in rows]
+        size = len(self.example_params) if self.example_params else len(rows[0]) if rows else 0
+        for row in rows:
+            if len(row) != size:
+                raise exceptions.ExamplesNotValidError(f"Example rows should contain {size} values, {len(row)} found")
+        self._columns = [[row[index] for row in rows] for index in range(size)]
+        self._lines = []
+        self._params = None
+
+    @property
+    def vertical_examples(self):
+        """Get the example columns, one per parameter.
+
+        :return: `list` of `list` of `string` parameter values.
+        """
+        return [list(column) for column in self.columns]
+
+    @vertical_examples.setter
+    def vertical_examples(self, columns):
+        """Set the example columns.
+
+        :param columns: `list` of `list` of `string` parameter values, one per parameter.
+        """
+        columns = [list(column) for column in columns]
+        if self.example_params and len(columns) != len(self.example_params):
+            raise exceptions.ExamplesNotValidError(
+                f"Example columns should contain {len(self.example_params)} parameters, {len(columns)} found"
+            )
+        for column in columns[1:]:
+            if len(column) != len(columns[0]):
+                raise exceptions.ExamplesNotValidError(
+                    f"Example rows should contain {len(columns[0])} values, {len(column)} found"
+                )
+        self._columns = columns
+        self._lines = []
+        self._params = None
 
     def get_params(self, converters, builtin=False):
         """Get scenario pytest parametrization table.
 
+        The converters are applied to the whole columns. The table is cached until the examples
+        or the converters change.
+
         :param converters: `dict` of converter functions to convert parameter values
+        :param bool builtin: Only use the converted values of the builtin types.
         """
-        param_count = len(self.example_params)
-        if self.vertical_examples and not self.examples:
-            for value_index in range(len(self.vertical_examples[0])):
-                example = []
-                for param_index in range(param_count):
-                    example.append(self.vertical_examples[param_index][value_index])
-                self.examples.append(example)
-
-        if self.examples:
-            params = []
-            for example in self.examples:
-                example = list(example)
-                for index, param in enumerate(self.example_params):
-                    raw_value = example[index]
-                    if converters and param in converters:
-                        value = converters[param](raw_value)
-                        if not builtin or value.__class__.__module__ in {"__builtin__", "builtins"}:
-                            example[index] = value
-                params.append(example)
-            return [self.example_params, params]
-        else:
+        if not self:
             return []
+        if self._params is None:
+            self._params = {}
+        cached = self._params.get(builtin)
+        if cached is not None and cached[0] is converters:
+            return cached[1]
+
+        columns = [
+            self._convert_column(param, column, converters, builtin)
+            for param, column in zip(self.example_params, self.columns)
+        ]
+        params = [self.example_params, [list(row) for row in zip(*columns)]]
+        self._params[builtin] = (converters, params)
+        return params
+
+    @staticmethod
+    def _convert_column(param, column, converters, builtin):
+        """Convert the column values.
+
+        :param str param: Parameter name.
+        :param list column: `list` of `string` parameter values.
+        :param converters: `dict` of converter functions to convert parameter values
+        :param bool builtin: Only use the converted values of the builtin types.
+        """
+        if not converters or param not in converters:
+            return column
+        converter = converters[param]
+        values = [converter(value) for value in column]
+        if builtin and not all(cls.__module__ in BUILTIN_MODULES for cls in {value.__class__ for value in values}):
+            values = [
+                value if value.__class__.__module__ in BUILTIN_MODULES else raw_value
+                for value, raw_value in zip(values, column)
+            ]
+        return values
+
+    def __len__(self):
+        """Get the number of the examples without splitting the pending example lines."""
+        if not self._columns:
+            return 0
+        return len(self._columns[0]) + len(self._lines)
 
     def __bool__(self):
         """Bool comparison."""
-        return bool(self.vertical_examples or self.examples)
+        return bool(len(self))
 
 
 def get_tags(line):
@@ -457,4 +1281,33 @@ def get_tags(line):
     return {tag.lstrip("@") for tag in line.strip().split(" @") if len(tag) > 1}
 
 
+def get_tag_index(scenario_tags):
+    """Build the inverted index of the scenario tags.
+
+    :param scenario_tags: Iterable of the scenario name and its tags pairs.
+
+    :return: `dict` of the tag to the `tuple` of the names of the scenarios tagged with it.
+    """
+    index = {}
+    for name, tags in scenario_tags:
+        for tag in tags:
+            index.setdefault(sys.intern(tag), []).append(name)
+    return {tag: tuple(names) for tag, names in index.items()}
+
+
 STEP_PARAM_RE = re.compile(r"\<(.+?)\>")
+STEP_PARAM_BYTES_RE = re.compile(rb"\<(.+?)\>")
+
+
+@functools.lru_cache(maxsize=4096)
+def get_step_params(name):
+    """Get the params of the step name.
+
+    The params tuple is shared by all the steps with the same name. Only the first line of the step name
+    should be passed, so that the cache doesn't keep the large multiline contents alive.
+
+    :param str name: Step name.
+
+    :return: `tuple` of the param names.
+    """
+    return tuple(frozenset(STEP_PARAM_RE.findall(name)))
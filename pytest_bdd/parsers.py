@@ -2,28 +2,78 @@
 
 
 import re as base_re
-from functools import partial
+from functools import lru_cache, partial
 
 import parse as base_parse
 from parse_type import cfparse as base_cfparse
 
+# Numbered and named backreferences, conditional groups
+BACKREFERENCE_RE = base_re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Escaped characters and character sets are matched as a whole, so that only the actual named groups are renamed
+GROUP_RE = base_re.compile(r"\\.|\[\^?\]?(?:\\.|[^\]])*\]?|\(\?P<(\w+)>", base_re.DOTALL)
+
 
 class StepParser:
-    """Parser of the individual step."""
+    """Parser of the individual step.
+
+    The parsers implement `match` to match the step name and get the step arguments at once. The parsers
+    implementing only `is_matching` and `parse_arguments` are still supported, `match` calls them both.
+    """
 
     def __init__(self, name):
         self.name = name
 
+    def match(self, name):
+        """Match given name with the step name and get the step arguments.
+
+        :return: `dict` of step arguments or `None` if the name doesn't match
+        """
+        cls = type(self)
+        if cls.is_matching is StepParser.is_matching or cls.parse_arguments is StepParser.parse_arguments:
+            raise NotImplementedError()  # pragma: no cover
+        if not self.is_matching(name):
+            return None
+        return self.parse_arguments(name)
+
     def parse_arguments(self, name):
         """Get step arguments from the given step name.
 
         :return: `dict` of step arguments
         """
-        raise NotImplementedError()  # pragma: no cover
+        return self.match(name)
 
     def is_matching(self, name):
         """Match given name with the step name."""
-        raise NotImplementedError()  # pragma: no cover
+        return self.match(name) is not None
+
+
+def match_step(parser, name):
+    """Match the step name with the step parser, also the one not based on `StepParser`.
+
+    The `match` of the parser is only used if it agrees with its `is_matching` and `parse_arguments`,
+    see `is_match_consistent`.
+
+    :return: `dict` of step arguments or `None` if the name doesn't match
+    """
+    if isinstance(parser, StepParser) and is_match_consistent(type(parser)):
+        return parser.match(name)
+    if not parser.is_matching(name):
+        return None
+    return parser.parse_arguments(name)
+
+
+@lru_cache(maxsize=None)
+def is_match_consistent(cls):
+    """Check whether `match` of the step parser class agrees with its `is_matching` and `parse_arguments`.
+
+    It doesn't if a subclass overrides `is_matching` or `parse_arguments` without overriding `match`,
+    e.g. a subclass of `parse` converting the step arguments in `parse_arguments`.
+
+    :param type cls: `StepParser` subclass.
+    """
+    owner = next(base for base in cls.__mro__ if "match" in vars(base))
+    return all(getattr(cls, method) is getattr(owner, method) for method in ("is_matching", "parse_arguments"))
 
 
 class re(StepParser):
@@ -34,6 +84,14 @@ class re(StepParser):
         super().__init__(name)
         self.regex = base_re.compile(self.name, *args, **kwargs)
 
+    def match(self, name):
+        """Match given name with the step name and get the step arguments.
+
+        :return: `dict` of step arguments or `None` if the name doesn't match
+        """
+        match = self.regex.match(name)
+        return match.groupdict() if match else None
+
     def parse_arguments(self, name):
         """Get step arguments.
 
@@ -46,6 +104,106 @@ class re(StepParser):
         return bool(self.regex.match(name))
 
 
+class CombinedRegex:
+    """Regex step parsers compiled into a single alternation.
+
+    Every pattern becomes an alternative ending with an empty sentinel group, the named groups of the patterns are
+    renamed, so that the patterns with the same group names can be combined. The sentinel groups are put after
+    the patterns rather than around them, so that the regex engine can still factor out the common prefixes.
+    The alternatives are tried in their order, so a single match finds the same step as matching the patterns
+    one by one.
+    """
+
+    def __init__(self, parsers):
+        """Compile the alternation.
+
+        :param parsers: `list` of the `re` parsers, see `is_combinable`.
+        """
+        self.parsers = parsers
+        self.sentinels = {}
+        self.groups = []
+        alternatives = []
+        for index, parser in enumerate(parsers):
+            sentinel = f"_bdd{index}"
+            pattern, groups = rename_groups(parser.regex.pattern, f"{sentinel}_")
+            alternatives.append(f"(?:{pattern})(?P<{sentinel}>)")
+            self.sentinels[sentinel] = index
+            self.groups.append(groups)
+        self.regex = base_re.compile("|".join(alternatives))
+
+    def match(self, name):
+        """Match the step name against all the patterns at once.
+
+        :return: `tuple` of the index of the first matching parser and its step arguments, or `None`.
+        """
+        match = self.regex.match(name)
+        if match is None:
+            return None
+        # The sentinel group is the last group of the alternative, so it's the last matched one
+        index = self.sentinels[match.lastgroup]
+        return index, {group: match.group(renamed) for group, renamed in self.groups[index]}
+
+    def iter_matching(self, name):
+        """Find the parsers matching the step name in their order.
+
+        The parsers after the first matching one are matched one by one, they are rarely needed.
+
+        :return: Generator of `tuple` in form (<parser index>, <step arguments>).
+        """
+        match = self.match(name)
+        if match is None:
+            return
+        yield match
+        for index in range(match[0] + 1, len(self.parsers)):
+            arguments = self.parsers[index].match(name)
+            if arguments is not None:
+                yield index, arguments
+
+
+def rename_groups(pattern, prefix):
+    """Rename the named groups of the regex pattern.
+
+    :param str pattern: Regex pattern.
+    :param str prefix: Prefix of the new group names.
+
+    :return: `tuple` of the pattern and the `list` of `tuple` in form (<group name>, <new group name>).
+    """
+    groups = []
+
+    def rename(match):
+        if match.group(1) is None:
+            # Escaped character or character set
+            return match.group()
+        renamed = f"{prefix}{len(groups)}"
+        groups.append((match.group(1), renamed))
+        return f"(?P<{renamed}>"
+
+    return GROUP_RE.sub(rename, pattern), groups
+
+
+def is_combinable(parser):
+    """Check whether the step parser can be matched by `CombinedRegex`.
+
+    Only the plain `re` parsers can, without the flags, the backreferences and the other numbered group references.
+    """
+    if type(parser) is not re:
+        return False
+    regex = parser.regex
+    if not isinstance(regex.pattern, str) or regex.flags != base_re.UNICODE:
+        return False
+    if BACKREFERENCE_RE.search(regex.pattern):
+        return False
+    pattern, groups = rename_groups(regex.pattern, "_")
+    try:
+        renamed = base_re.compile(pattern)
+    except base_re.error:
+        return False
+    # The renamed groups must be the same groups in the same positions
+    if renamed.groups != regex.groups or len(groups) != len(regex.groupindex):
+        return False
+    return all(regex.groupindex[group] == renamed.groupindex[new_group] for group, new_group in groups)
+
+
 class parse(StepParser):
     """parse step parser."""
 
@@ -54,6 +212,17 @@ class parse(StepParser):
         super().__init__(name)
         self.parser = base_parse.compile(self.name, *args, **kwargs)
 
+    def match(self, name):
+        """Match given name with the step name and get the step arguments.
+
+        :return: `dict` of step arguments or `None` if the name doesn't match
+        """
+        try:
+            result = self.parser.parse(name)
+        except ValueError:
+            return None
+        return result.named if result else None
+
     def parse_arguments(self, name):
         """Get step arguments.
 
@@ -78,6 +247,94 @@ class cfparse(parse):
         self.parser = base_cfparse.Parser(self.name, *args, **kwargs)
 
 
+class PrefixIndex:
+    """Parse step parsers indexed by the literal text their step names start with.
+
+    The literal prefixes are put into a trie, so only the parsers whose prefix the step name starts with are
+    actually parsed. The parse parsers are case-insensitive by default, so the prefixes and the step names are
+    compared in lowercase. The prefixes end at the first non-ASCII character, and every parser below the first
+    non-ASCII character of the step name is a candidate, since the non-ASCII characters may match each other
+    and the ASCII ones case-insensitively.
+    """
+
+    def __init__(self, parsers):
+        """Build the trie.
+
+        :param parsers: `list` of the `parse` and `cfparse` parsers, see `is_indexable`.
+        """
+        self.parsers = parsers
+        self.trie = {}
+        for index, parser in enumerate(parsers):
+            node = self.trie
+            for char in get_literal_prefix(parser.name).lower():
+                node = node.setdefault(char, {})
+            # The empty key holds the parsers whose prefix ends here
+            node.setdefault("", []).append(index)
+
+    def get_candidates(self, name):
+        """Get the indexes of the parsers whose prefix the step name starts with.
+
+        :return: `list` of the parser indexes in their order.
+        """
+        node = self.trie
+        candidates = list(node.get("", ()))
+        for char in name:
+            if char > "\x7f":
+                candidates.extend(self.iter_indexes(node))
+                break
+            node = node.get(char.lower())
+            if node is None:
+                break
+            candidates.extend(node.get("", ()))
+        return sorted(candidates)
+
+    def iter_indexes(self, node):
+        """Iterate over the parser indexes of the trie node and below, except those whose prefix ends at the node."""
+        for char, child in node.items():
+            if char:
+                yield from child.get("", ())
+                yield from self.iter_indexes(child)
+
+    def iter_matching(self, name):
+        """Find the parsers matching the step name in their order.
+
+        :return: Generator of `tuple` in form (<parser index>, <step arguments>).
+        """
+        for index in self.get_candidates(name):
+            arguments = self.parsers[index].match(name)
+            if arguments is not None:
+                yield index, arguments
+
+
+def get_literal_prefix(format):
+    """Get the literal ASCII text the parse format starts with.
+
+    :param str format: Parse format.
+    """
+    prefix = []
+    for part in base_parse.PARSE_RE.split(format):
+        if part in ("{{", "}}"):
+            prefix.append(part[0])
+        elif part.startswith("{") and part.endswith("}"):
+            # Field
+            break
+        else:
+            prefix.append(part)
+    prefix = "".join(prefix)
+    for position, char in enumerate(prefix):
+        if char > "\x7f":
+            return prefix[:position]
+    return prefix
+
+
+def is_indexable(parser):
+    """Check whether the step parser can be matched by `PrefixIndex`.
+
+    Only the plain `parse` and `cfparse` parsers can.
+    """
+    return type(parser) in (parse, cfparse) and isinstance(parser.name, str)
+
+
 class string(StepParser):
     """Exact string step parser."""
 
@@ -86,6 +343,13 @@ class string(StepParser):
         name = str(name, **({"encoding": "utf-8"} if isinstance(name, bytes) else {}))
         super().__init__(name)
 
+    def match(self, name):
+        """Match given name with the step name, there are no parameters for simple string step.
+
+        :return: empty `dict` or `None` if the name doesn't match
+        """
+        return {} if self.name == name else None
+
     def parse_arguments(self, name):
         """No parameters are available for simple string step.
 
@@ -110,7 +374,7 @@ def get_parser(step_name):
     def does_support_parser_interface(obj):
         return all(map(partial(hasattr, obj), ["is_matching", "parse_arguments"]))
 
-    if does_support_parser_interface(step_name):
+    if isinstance(step_name, StepParser) or does_support_parser_interface(step_name):
         return step_name
     else:
         return string(step_name)
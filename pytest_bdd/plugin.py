@@ -2,11 +2,18 @@
 
 import pytest
 
+from . import bundle
+from . import catalog
 from . import cucumber_json
+from . import discovery
+from . import feature
+from . import feature_cache
 from . import generation
 from . import gherkin_terminal_reporter
 from . import given, when, then
+from . import registry
 from . import reporting
+from . import tag_expression
 from .utils import CONFIG_STACK
 
 
@@ -29,12 +36,37 @@ def pytest_addoption(parser):
     """Add pytest-bdd options."""
     add_bdd_ini(parser)
     cucumber_json.add_options(parser)
+    feature_cache.add_options(parser)
+    discovery.add_options(parser)
+    bundle.add_options(parser)
+    catalog.add_options(parser)
     generation.add_options(parser)
     gherkin_terminal_reporter.add_options(parser)
+    tag_expression.add_options(parser)
 
 
 def add_bdd_ini(parser):
     parser.addini("bdd_features_base_dir", "Base features directory.")
+    parser.addini(
+        "bdd_features_parse_workers",
+        "Number of processes to parse the feature files found by scenarios() with.",
+        default="0",
+    )
+    parser.addini(
+        "bdd_features_memory_cache_size",
+        "Maximum number of the parsed features kept in memory, the least recently used ones are evicted.",
+        default="0",
+    )
+    parser.addini(
+        "bdd_features_memory_cache_bytes",
+        "Maximum total size of the feature files whose parsed features are kept in memory.",
+        default="0",
+    )
+    parser.addini(
+        "bdd_features_check_interval",
+        "Seconds between the checks of the feature files for changes, the parsed features are kept in memory "
+        "between the pytest sessions of the same process when it's set.",
+    )
 
 
 @pytest.mark.trylast
@@ -42,6 +74,13 @@ def pytest_configure(config):
     """Configure all subplugins."""
     CONFIG_STACK.append(config)
     cucumber_json.configure(config)
+    feature.configure(config)
+    feature_cache.configure(config)
+    discovery.configure(config)
+    bundle.configure(config)
+    catalog.configure(config)
+    registry.configure(config)
+    tag_expression.configure(config)
     gherkin_terminal_reporter.configure(config)
 
 
@@ -49,6 +88,14 @@ def pytest_unconfigure(config):
     """Unconfigure all subplugins."""
     CONFIG_STACK.pop()
     cucumber_json.unconfigure(config)
+    feature.unconfigure(config)
+    discovery.unconfigure(config)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Send the feature catalog to the xdist worker."""
+    catalog.configure_node(node)
 
 
 @pytest.mark.hookwrapper
@@ -57,6 +104,10 @@ def pytest_runtest_makereport(item, call):
     reporting.runtest_makereport(item, call, outcome.get_result())
 
 
+def pytest_terminal_summary(terminalreporter):
+    registry.terminal_summary(terminalreporter)
+
+
 @pytest.mark.tryfirst
 def pytest_bdd_before_scenario(request, feature, scenario):
     reporting.before_scenario(request, feature, scenario)
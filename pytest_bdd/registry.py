@@ -0,0 +1,196 @@
+"""Step definition registry.
+
+The step decorators register every step definition by its step type: the exact string steps by their name,
+the steps with a parser by their fixture name. The steps are resolved by the registry instead of scanning all
+the fixtures of the pytest session, so only the parsers of the step type are matched against the step name.
+The consecutive regex steps of the step type are compiled into a single regex, see `pytest_bdd.parsers.CombinedRegex`,
+the consecutive parse steps are indexed by their literal prefix, see `pytest_bdd.parsers.PrefixIndex`.
+
+The registry only knows which step fixtures exist, pytest still decides which of them are visible to the test,
+so the step definitions of the conftest and test modules override each other just as the fixtures do.
+
+The found step definitions are cached for the pytest session by the step name, the step type and the location
+of the test, see `StepCache`. The cache hits and misses are shown in the terminal summary with ``-v``.
+"""
+import itertools
+from collections import namedtuple
+
+from .parsers import CombinedRegex, PrefixIndex, is_combinable, is_indexable, match_step, string
+from .utils import CONFIG_STACK
+
+StepCacheInfo = namedtuple("StepCacheInfo", ["hits", "misses", "currsize"])
+
+
+class StepRegistry:
+    """Step definitions by the step type."""
+
+    def __init__(self):
+        # {<step type>: {<step name>: <fixture name>}}
+        self.exact = {}
+        # {<step type>: {<fixture name>: <parser>}} in the registration order
+        self.parsers = {}
+        # {<step type>: tuple of (<fixture name>, <parser>)}, built on the first lookup after the registration
+        self.parser_entries = {}
+        # {<step type>: `list` of the step definitions and the `CombinedRegex` of the consecutive regex steps}
+        self.matchers = {}
+        # Incremented by every registration, to tell the step caches to drop the found steps
+        self.version = 0
+
+    def register(self, type_, parser, fixture_name):
+        """Register the step definition.
+
+        The steps registered again with the same fixture name, e.g. when their module is imported again,
+        replace the previous ones.
+
+        :param str type_: Step type.
+        :param parser: Step parser.
+        :param str fixture_name: Name of the step fixture.
+        """
+        self.version += 1
+        if isinstance(parser, string):
+            self.exact.setdefault(type_, {})[parser.name] = fixture_name
+        else:
+            self.parsers.setdefault(type_, {})[fixture_name] = parser
+            self.parser_entries.pop(type_, None)
+            self.matchers.pop(type_, None)
+
+    def get_parsers(self, type_):
+        """Get the step definitions with a parser.
+
+        :param str type_: Step type.
+
+        :return: `tuple` of `tuple` in form (<fixture name>, <parser>).
+        """
+        try:
+            return self.parser_entries[type_]
+        except KeyError:
+            entries = self.parser_entries[type_] = tuple(self.parsers.get(type_, {}).items())
+            return entries
+
+    def get_matchers(self, type_):
+        """Get the step definitions with a parser, the consecutive steps of the same kind are matched together.
+
+        :param str type_: Step type.
+
+        :return: `list` of `tuple` in form (<fixture name>, <parser>) and `tuple` in form
+                 (`tuple` of the fixture names, `CombinedRegex` or `PrefixIndex`).
+        """
+        try:
+            return self.matchers[type_]
+        except KeyError:
+            pass
+        matchers = []
+        for matcher_class, entries in itertools.groupby(
+            self.get_parsers(type_), lambda entry: get_matcher_class(entry[1])
+        ):
+            entries = list(entries)
+            if matcher_class is None or len(entries) == 1:
+                matchers.extend(entries)
+            else:
+                fixture_names, parsers = zip(*entries)
+                matchers.append((fixture_names, matcher_class(parsers)))
+        self.matchers[type_] = matchers
+        return matchers
+
+    def iter_matching(self, name, type_):
+        """Find the step definitions with a parser matching the step name.
+
+        :param str name: Step name.
+        :param str type_: Step type.
+
+        :return: Generator of `tuple` in form (<fixture name>, <parser>, <step arguments>) in the registration order.
+        """
+        for fixture_names, matcher in self.get_matchers(type_):
+            if isinstance(matcher, (CombinedRegex, PrefixIndex)):
+                for index, arguments in matcher.iter_matching(name):
+                    yield fixture_names[index], matcher.parsers[index], arguments
+            else:
+                # Single step definition
+                arguments = match_step(matcher, name)
+                if arguments is not None:
+                    yield fixture_names, matcher, arguments
+
+
+def get_matcher_class(parser):
+    """Get the class to match the step parser together with the others of the same kind.
+
+    :return: `CombinedRegex`, `PrefixIndex` or `None` if the parser is matched alone.
+    """
+    if is_combinable(parser):
+        return CombinedRegex
+    if is_indexable(parser):
+        return PrefixIndex
+    return None
+
+
+class StepCache:
+    """Found step definitions by the step name, the step type and the test location.
+
+    The test location is the node id of the parent of the test item, pytest looks up the fixtures visible
+    to the test by it. The cache is dropped whenever a step definition is registered.
+    """
+
+    def __init__(self, registry):
+        """Step cache constructor.
+
+        :param StepRegistry registry: Step registry.
+        """
+        self.registry = registry
+        self.version = registry.version
+        self.steps = {}
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        """Get the found step definition, counting the cache hits and misses.
+
+        :param tuple key: `tuple` in form (<step name>, <step type>, <test location>).
+
+        :return: `tuple` of the step fixture name, the step arguments and the converters or `None`.
+        """
+        if self.version != self.registry.version:
+            self.steps.clear()
+            self.version = self.registry.version
+        try:
+            resolved = self.steps[key]
+        except KeyError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return resolved
+
+    def __setitem__(self, key, resolved):
+        self.steps[key] = resolved
+
+    def cache_info(self):
+        """Get the cache statistics.
+
+        :return: `StepCacheInfo` tuple.
+        """
+        return StepCacheInfo(self.hits, self.misses, len(self.steps))
+
+
+step_registry = StepRegistry()
+
+
+def configure(config):
+    config._bddstepcache = StepCache(step_registry)
+
+
+def get_step_cache():
+    """Get the step cache of the current pytest session.
+
+    :return: `StepCache` instance or `None` outside of a pytest session.
+    """
+    if not CONFIG_STACK:
+        return None
+    return getattr(CONFIG_STACK[-1], "_bddstepcache", None)
+
+
+def terminal_summary(terminalreporter):
+    """Show the step cache statistics in verbose mode."""
+    step_cache = getattr(terminalreporter.config, "_bddstepcache", None)
+    if step_cache is None or terminalreporter.config.option.verbose <= 0:
+        return
+    hits, misses, currsize = step_cache.cache_info()
+    if hits or misses:
+        terminalreporter.write_sep("-", f"pytest-bdd step cache: {hits} hits, {misses} misses, {currsize} steps")
@@ -18,44 +18,105 @@ import pytest
 from _pytest.fixtures import FixtureLookupError
 
 from . import exceptions
-from .feature import get_feature, get_features
+from .feature import bind_feature, get_feature, get_features
+from .parsers import match_step
+from .registry import get_step_cache, step_registry
 from .steps import get_step_fixture_name, inject_fixture
-from .utils import CONFIG_STACK, get_args, get_caller_module_locals, get_caller_module_path
+from .tag_expression import get_tag_expression
+from .utils import (
+    CONFIG_STACK,
+    get_args,
+    get_caller_module_locals,
+    get_caller_module_name,
+    get_caller_module_path,
+)
 
 PYTHON_REPLACE_REGEX = re.compile(r"\W")
 ALPHA_REGEX = re.compile(r"^\d+_*")
 
 
 def find_argumented_step_fixture_name(name, type_, fixturemanager, request=None):
-    """Find argumented step fixture name."""
-    # happens to be that _arg2fixturedefs is changed during the iteration so we use a copy
-    for fixturename, fixturedefs in list(fixturemanager._arg2fixturedefs.items()):
-        for fixturedef in fixturedefs:
-            parser = getattr(fixturedef.func, "parser", None)
-            if parser is None:
-                continue
-            match = parser.is_matching(name)
-            if not match:
+    """Find argumented step fixture name.
+
+    Only the steps with a parser of the step type are matched, the first matching step visible to the test wins.
+
+    :param str name: Step name.
+    :param str type_: Step type.
+    :param fixturemanager: Pytest fixture manager.
+    :param request: Optional pytest request, the step arguments are injected into it.
+
+    :return: Name of the step fixture or `None`.
+    """
+    if request is not None:
+        found = _find_argumented_step(request, name, type_)
+        if found is None:
+            return None
+        fixture_name, arguments, converters = found
+        _inject_step_arguments(request, arguments, converters)
+        return fixture_name
+
+    for fixture_name, _, _ in step_registry.iter_matching(name, type_):
+        # The registry also knows the steps of the modules outside of the session
+        if fixture_name in fixturemanager._arg2fixturedefs:
+            return fixture_name
+
+
+def _find_argumented_step(request, name, type_):
+    """Find the first step with a parser matching the step name, visible to the test.
+
+    :return: `tuple` of the step fixture name, the step arguments before the conversion and the converters,
+             or `None`.
+    """
+    for fixture_name, parser, arguments in step_registry.iter_matching(name, type_):
+        fixturedefs = request._fixturemanager.getfixturedefs(fixture_name, request._pyfuncitem.parent.nodeid)
+        if not fixturedefs:
+            continue
+
+        # The visible step definition may override the registered one with another parser or converters.
+        # They are the attributes of the step fixture, the step function is shared by all its step decorators.
+        step_fixture = fixturedefs[-1].func
+        step_parser = getattr(step_fixture, "parser", parser)
+        if step_parser is not parser:
+            arguments = match_step(step_parser, name)
+            if arguments is None:
                 continue
+        return fixture_name, arguments, getattr(step_fixture, "converters", {})
+
+
+def _inject_step_arguments(request, arguments, converters):
+    """Convert the step arguments and inject them into the request."""
+    for arg, value in arguments.items():
+        if arg in converters:
+            value = converters[arg](value)
+        inject_fixture(request, arg, value)
+
+
+def _resolve_step(request, name, type_):
+    """Find the step definition visible to the test.
 
-            converters = getattr(fixturedef.func, "converters", {})
-            for arg, value in parser.parse_arguments(name).items():
-                if arg in converters:
-                    value = converters[arg](value)
-                if request:
-                    inject_fixture(request, arg, value)
-            parser_name = get_step_fixture_name(parser.name, type_)
-            if request:
-                try:
-                    request.getfixturevalue(parser_name)
-                except FixtureLookupError:
-                    continue
-            return parser_name
+    :raises FixtureLookupError: If there is no step definition for the step.
+
+    :return: `tuple` of the step fixture name, the step arguments before the conversion and the converters,
+             or `None` instead of the arguments and the converters if the step was found by its name.
+    """
+    fixture_name = get_step_fixture_name(name, type_)
+    # Simple case where no parser is used for the step, it wins over the steps with a parser wherever it is defined
+    if request._fixturemanager.getfixturedefs(fixture_name, request._pyfuncitem.parent.nodeid):
+        return fixture_name, None, None
+    # Could not find a step with the same name, let's see if there is a parser involved
+    found = _find_argumented_step(request, name, type_)
+    if found is None:
+        raise FixtureLookupError(fixture_name, request)
+    return found
 
 
 def _find_step_function(request, step, scenario):
     """Match the step defined by the regular expression pattern.
 
+    The found step definitions are cached by the step name, the step type and the location of the test,
+    which decides the step fixtures visible to the test. The cached step arguments are converted and injected
+    into the request again.
+
     :param request: PyTest request object.
     :param step: Step.
     :param scenario: Scenario.
@@ -63,22 +124,24 @@ def _find_step_function(request, step, scenario):
     :return: Function of the step.
     :rtype: function
     """
-    name = step.name
+    step_cache = get_step_cache()
+    key = (step.name, step.type, request._pyfuncitem.parent.nodeid)
+    resolved = step_cache.get(key) if step_cache is not None else None
     try:
-        # Simple case where no parser is used for the step
-        return request.getfixturevalue(get_step_fixture_name(name, step.type))
+        if resolved is None:
+            resolved = _resolve_step(request, step.name, step.type)
+            if step_cache is not None:
+                step_cache[key] = resolved
+        fixture_name, arguments, converters = resolved
+        step_func = request.getfixturevalue(fixture_name)
     except FixtureLookupError:
-        try:
-            # Could not find a fixture with the same name, let's see if there is a parser involved
-            name = find_argumented_step_fixture_name(name, step.type, request._fixturemanager, request)
-            if name:
-                return request.getfixturevalue(name)
-            raise
-        except FixtureLookupError:
-            raise exceptions.StepDefinitionNotFoundError(
-                f"Step definition is not found: {step}. "
-                f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
-            )
+        raise exceptions.StepDefinitionNotFoundError(
+            f"Step definition is not found: {step}. "
+            f'Line {step.line_number} in scenario "{scenario.name}" in the feature "{scenario.feature.filename}"'
+        )
+    if arguments:
+        _inject_step_arguments(request, arguments, converters)
+    return step_func
 
 
 def _execute_step_function(request, scenario, step, step_func):
@@ -154,6 +217,12 @@ def _get_scenario_decorator(feature, feature_name, scenario, scenario_name):
                 "scenario function can only be used as a decorator. Refer to the documentation."
             )
         [fn] = args
+        tag_expression = get_tag_expression()
+        if tag_expression is not None and not tag_expression.evaluate(scenario.tags.union(feature.tags)):
+            # The scenario is not selected by the --bdd-tags expression, don't collect it
+            fn.__test__ = False
+            fn.__scenario__ = scenario
+            return fn
         args = get_args(fn)
         function_args = list(args)
         for arg in scenario.get_example_params():
@@ -191,12 +260,16 @@ def scenario(feature_name, scenario_name, encoding="utf-8", example_converters=N
     """
 
     scenario_name = str(scenario_name)
+    caller_module_name = get_caller_module_name()
     caller_module_path = get_caller_module_path()
 
     # Get the feature
     if features_base_dir is None:
         features_base_dir = get_features_base_dir(caller_module_path)
     feature = get_feature(features_base_dir, feature_name, encoding=encoding)
+    if caller_module_name != __name__:
+        # The scenarios bound by `scenarios` are bound to its caller module
+        bind_feature(feature, caller_module_name)
 
     # Get the scenario
     try:
@@ -263,10 +336,12 @@ def get_python_name_generator(name):
         suffix = f"_{index}"
 
 
-def scenarios(*feature_paths, **kwargs):
+def scenarios(*feature_paths, tags=None, **kwargs):
     """Parse features from the paths and put all found scenarios in the caller module.
 
     :param *feature_paths: feature file paths to use for scenarios
+    :param tags: optional iterable of tags (without the "@"), only the scenarios tagged with any of them are bound.
+        The other scenarios are not parsed.
     """
     caller_locals = get_caller_module_locals()
     caller_path = get_caller_module_path()
@@ -288,10 +363,17 @@ def scenarios(*feature_paths, **kwargs):
         if hasattr(attr, "__scenario__")
     )
 
+    tag_expression = get_tag_expression()
     for feature in get_features(abs_feature_paths):
-        for scenario_name, scenario_object in feature.scenarios.items():
+        bind_feature(feature, caller_locals.get("__name__"))
+        found = found or bool(feature.scenarios)
+        scenario_names = feature.scenarios if tags is None else feature.select_scenarios(tags)
+        if tag_expression is not None:
+            selected = set(tag_expression.select_scenarios(feature))
+            scenario_names = [scenario_name for scenario_name in scenario_names if scenario_name in selected]
+        for scenario_name in scenario_names:
             # skip already bound scenarios
-            if (scenario_object.feature.filename, scenario_name) not in module_scenarios:
+            if (feature.filename, scenario_name) not in module_scenarios:
 
                 @scenario(feature.filename, scenario_name, **kwargs)
                 def _scenario():
@@ -302,6 +384,5 @@ def scenarios(*feature_paths, **kwargs):
                         # found an unique test name
                         caller_locals[test_name] = _scenario
                         break
-            found = True
     if not found:
         raise exceptions.NoScenariosFound(abs_feature_paths)
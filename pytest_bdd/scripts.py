@@ -6,6 +6,8 @@ import re
 
 import glob2
 
+from .bundle import write_bundle
+from .feature import iter_feature_filenames
 from .generation import generate_code, parse_feature_files
 
 MIGRATE_REGEX = re.compile(r"\s?(\w+)\s\=\sscenario\((.+)\)", flags=re.MULTILINE)
@@ -51,6 +53,13 @@ def print_generated_code(args):
     print(code)
 
 
+def compile_features(args):
+    """Compile the feature files of the given paths into the feature bundle."""
+    filenames = sorted(os.path.abspath(filename) for filename in iter_feature_filenames(args.paths))
+    count = write_bundle(args.output, filenames, encoding=args.encoding)
+    print(f"compiled {count} feature files into {args.output}")
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(prog="pytest-bdd")
@@ -70,6 +79,20 @@ def main():
     parser_migrate.add_argument("path", metavar="PATH", help="Migrate outdated tests to the most recent form")
     parser_migrate.set_defaults(func=migrate_tests)
 
+    parser_compile = subparsers.add_parser("compile", help="compile help")
+    parser_compile.add_argument(
+        "paths",
+        metavar="PATH",
+        type=check_existense,
+        nargs="+",
+        help="Feature files or directories to compile into the feature bundle",
+    )
+    parser_compile.add_argument(
+        "-o", "--output", default="features.bundle", help="Feature bundle file (default: features.bundle)"
+    )
+    parser_compile.add_argument("--encoding", default="utf-8", help="Feature files encoding (default: utf-8)")
+    parser_compile.set_defaults(func=compile_features)
+
     args = parser.parse_args()
     if hasattr(args, "func"):
         args.func(args)
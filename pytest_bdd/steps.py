@@ -41,6 +41,7 @@ from _pytest.fixtures import FixtureDef
 
 from .types import GIVEN, WHEN, THEN
 from .parsers import get_parser
+from .registry import step_registry
 from .utils import get_caller_module_locals
 
 
@@ -127,6 +128,7 @@ def _step_decorator(step_type, step_name, converters=None, target_fixture=None):
 
         lazy_step_func = pytest.fixture()(lazy_step_func)
         fixture_step_name = get_step_fixture_name(parsed_step_name, step_type)
+        step_registry.register(step_type, parser_instance, fixture_step_name)
 
         caller_locals = get_caller_module_locals()
         caller_locals[fixture_step_name] = lazy_step_func
@@ -0,0 +1,177 @@
+"""Cucumber tag expressions.
+
+The ``--bdd-tags`` option selects the scenarios to bind by a tag expression, e.g. ``@smoke and not (@slow or @flaky)``.
+The scenarios that don't match the expression are not bound to the tests, so neither the test functions nor
+the pytest marks of their tags are created.
+
+The expression is compiled once: every tag of the expression is assigned a bit, and the expression becomes a function
+of the bitset of the scenario tags. The tags of the unparsed scenarios are looked up in the feature tag index,
+so the scenarios that don't match the expression are never parsed.
+"""
+import re
+
+import pytest
+
+from . import exceptions
+from .utils import CONFIG_STACK
+
+OPERATORS = ("and", "or", "not")
+
+TOKEN_RE = re.compile(r"\s*(?:(\()|(\))|((?:\\.|[^\s()\\])+))")
+
+
+def add_options(parser):
+    """Add pytest-bdd options."""
+    group = parser.getgroup("bdd", "Tags")
+    group.addoption(
+        "--bdd-tags",
+        action="store",
+        dest="bdd_tags",
+        metavar="expression",
+        default=None,
+        help="only bind the scenarios matching the cucumber tag expression, e.g. '@smoke and not @slow'.",
+    )
+
+
+def configure(config):
+    expression = config.option.bdd_tags
+    if expression:
+        try:
+            config._bddtagexpression = TagExpression(expression)
+        except exceptions.TagExpressionError as exc:
+            raise pytest.UsageError(f"--bdd-tags: {exc}")
+
+
+def get_tag_expression():
+    """Get the tag expression of the current pytest session.
+
+    :return: `TagExpression` instance or `None` if all the scenarios are bound.
+    """
+    if not CONFIG_STACK:
+        return None
+    return getattr(CONFIG_STACK[-1], "_bddtagexpression", None)
+
+
+def tokenize(expression):
+    """Split the tag expression into the parentheses, the operators and the tags.
+
+    The parentheses, the whitespace and the backslash can be escaped with the backslash within the tags.
+
+    :param str expression: Tag expression.
+
+    :return: `list` of the tokens, the escaped tags are unescaped.
+    """
+    tokens = []
+    position = 0
+    expression = expression.rstrip()
+    while position < len(expression):
+        match = TOKEN_RE.match(expression, position)
+        if match is None:
+            raise exceptions.TagExpressionError(f"Invalid tag expression {expression!r} at {position}")
+        opening, closing, word = match.groups()
+        if word is not None and word not in OPERATORS:
+            word = re.sub(r"\\(.)", r"\1", word).lstrip("@")
+            tokens.append(("tag", word))
+        else:
+            tokens.append((opening or closing or word, None))
+        position = match.end()
+    return tokens
+
+
+class TagExpression:
+    """Compiled tag expression."""
+
+    def __init__(self, expression):
+        """Compile the tag expression.
+
+        :param str expression: Tag expression.
+        """
+        self.expression = expression
+        self.bits = {}
+        self.tokens = tokenize(expression)
+        self.position = 0
+        if not self.tokens:
+            raise exceptions.TagExpressionError("Empty tag expression")
+        source = self.parse_or()
+        if self.position < len(self.tokens):
+            self.error("Unexpected")
+        # The source is made of the tag bits and the operators only, never of the expression text
+        self.evaluate_bits = eval(f"lambda bits: bool({source})")
+
+    def error(self, message):
+        """Raise the error about the current token."""
+        if self.position < len(self.tokens):
+            token, tag = self.tokens[self.position]
+            message = f"{message} {tag or token!r} in the tag expression {self.expression!r}"
+        else:
+            message = f"{message} end of the tag expression {self.expression!r}"
+        raise exceptions.TagExpressionError(message)
+
+    def accept(self, token):
+        """Consume the token if it's the next one."""
+        if self.position < len(self.tokens) and self.tokens[self.position][0] == token:
+            self.position += 1
+            return True
+        return False
+
+    def parse_or(self):
+        """Parse the disjunction of the conjunctions into the python source."""
+        source = self.parse_and()
+        while self.accept("or"):
+            source = f"({source} or {self.parse_and()})"
+        return source
+
+    def parse_and(self):
+        """Parse the conjunction of the negations into the python source."""
+        source = self.parse_not()
+        while self.accept("and"):
+            source = f"({source} and {self.parse_not()})"
+        return source
+
+    def parse_not(self):
+        """Parse the negation, the parenthesized expression or the tag into the python source."""
+        if self.accept("not"):
+            return f"(not {self.parse_not()})"
+        if self.accept("("):
+            source = self.parse_or()
+            if not self.accept(")"):
+                self.error("Expected ')' instead of")
+            return source
+        if self.position < len(self.tokens) and self.tokens[self.position][0] == "tag":
+            tag = self.tokens[self.position][1]
+            self.position += 1
+            bit = self.bits.setdefault(tag, 1 << len(self.bits))
+            return f"(bits & {bit})"
+        self.error("Unexpected")
+
+    def get_bits(self, tags):
+        """Get the bitset of the tags, the tags not used by the expression are ignored.
+
+        :param tags: Iterable of the tags.
+        """
+        bits = 0
+        for tag in tags:
+            bits |= self.bits.get(tag, 0)
+        return bits
+
+    def evaluate(self, tags):
+        """Check whether the tags match the expression.
+
+        :param tags: Iterable of the tags without the "@".
+        """
+        return self.evaluate_bits(self.get_bits(tags))
+
+    def select_scenarios(self, feature):
+        """Get the names of the scenarios of the feature matching the expression, without parsing the scenarios.
+
+        :param pytest_bdd.parser.Feature feature: Feature.
+
+        :return: `list` of the scenario names in the feature file order.
+        """
+        feature_bits = self.get_bits(feature.tags)
+        scenario_bits = {}
+        for tag, bit in self.bits.items():
+            for name in feature.tag_index.get(tag, ()):
+                scenario_bits[name] = scenario_bits.get(name, 0) | bit
+        evaluate_bits = self.evaluate_bits
+        return [name for name in feature.scenarios if evaluate_bits(feature_bits | scenario_bits.get(name, 0))]
@@ -32,6 +32,11 @@ def get_caller_module_locals(depth=2):
     return _getframe(depth).f_locals
 
 
+def get_caller_module_name(depth=2):
+    """Get the caller module name."""
+    return _getframe(depth).f_globals.get("__name__")
+
+
 def get_caller_module_path(depth=2):
     """Get the caller module path.
 
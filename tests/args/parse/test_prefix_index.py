@@ -0,0 +1,85 @@
+"""Literal prefix index of the parse step parsers tests."""
+import pytest
+
+from pytest_bdd import parsers
+from pytest_bdd.registry import StepRegistry
+from pytest_bdd.types import GIVEN
+
+FORMATS = [
+    "the order {id:d} has {count:d} items",
+    "the order {id:d} is paid",
+    "the order {{draft}} {id:d} is open",
+    "{who} has {count:d} cucumbers",
+    "the orders are {state}",
+    "the örder {id:d} is late",
+    "I have no orders",
+]
+
+NAMES = [
+    "the order 5 has 3 items",
+    "The ORDER 5 is paid",
+    "the order {draft} 5 is open",
+    "the orders are paid",
+    "the örder 5 is late",
+    "the ÖRDER 5 is late",
+    "the order 5 has 3 cucumbers",
+    "I have no orders",
+    "I have 3 orders",
+    "",
+]
+
+
+@pytest.mark.parametrize(
+    ["format", "expected"],
+    [
+        ("the order {id:d} has {count:d} items", "the order "),
+        ("the order {{draft}} {id:d}", "the order {draft} "),
+        ("{who} has", ""),
+        ("the { order } {id}", "the { order } "),
+        ("the örder {id:d}", "the "),
+        ("I have no orders", "I have no orders"),
+    ],
+)
+def test_get_literal_prefix(format, expected):
+    assert parsers.get_literal_prefix(format) == expected
+
+
+@pytest.mark.parametrize("parser_class", [parsers.parse, parsers.cfparse])
+@pytest.mark.parametrize("name", NAMES)
+def test_prefix_index(parser_class, name):
+    """Test that the prefix index finds the same steps and arguments as the parsers one by one."""
+    step_parsers = [parser_class(format) for format in FORMATS]
+    expected = [
+        (index, parser.parse_arguments(name)) for index, parser in enumerate(step_parsers) if parser.is_matching(name)
+    ]
+    assert list(parsers.PrefixIndex(step_parsers).iter_matching(name)) == expected
+
+
+def test_candidates():
+    """Test that only the parsers whose prefix the step name starts with are candidates."""
+    index = parsers.PrefixIndex([parsers.parse(format) for format in FORMATS])
+    assert index.get_candidates("the order 5 has 3 items") == [0, 1, 3, 5]
+    assert index.get_candidates("the orders are paid") == [3, 4, 5]
+    assert index.get_candidates("I have no orders") == [3, 6]
+    assert index.get_candidates("the örder 5 is late") == [0, 1, 2, 3, 4, 5]
+
+
+def test_iter_matching():
+    """Test that the parse steps are indexed between the other steps in the registration order."""
+    registry = StepRegistry()
+    registry.register(GIVEN, parsers.parse("I have {count:d} Euro"), "first")
+    registry.register(GIVEN, parsers.cfparse("I have {count:d} {currency}"), "second")
+    registry.register(GIVEN, parsers.re(r"I have (?P<count>\d+)"), "third")
+    registry.register(GIVEN, parsers.parse("I have {count} Euro"), "fourth")
+
+    assert [type(matcher) for _, matcher in registry.get_matchers(GIVEN)] == [
+        parsers.PrefixIndex,
+        parsers.re,
+        parsers.parse,
+    ]
+    assert [fixture_name for fixture_name, _, _ in registry.iter_matching("I have 5 Euro", GIVEN)] == [
+        "first",
+        "second",
+        "third",
+        "fourth",
+    ]
@@ -0,0 +1,94 @@
+"""Combined regex step parsers tests."""
+import re
+
+import pytest
+
+from pytest_bdd import parsers
+from pytest_bdd.registry import StepRegistry
+from pytest_bdd.types import GIVEN
+
+PATTERNS = [
+    r"I have (?P<euro>\d+) Euro",
+    r"I have (?P<euro>\d+) (?P<currency>[A-Z]{3})",
+    r"I have (?P<count>\d+) (cucumbers|tomatoes)(?P<unit> kg)?",
+    r"I (?P<verb>eat|cut) [(?P<x>]+ (?P<what>\w+)",
+    r"I have a|I have an? (?P<thing>\w+)",
+]
+
+NAMES = [
+    "I have 5 Euro",
+    "I have 5 USD",
+    "I have 3 cucumbers",
+    "I have 3 tomatoes kg",
+    "I eat (( cucumbers",
+    "I have an apple",
+    "I have a pear",
+    "I have nothing",
+]
+
+
+@pytest.mark.parametrize(
+    ["pattern", "expected"],
+    [
+        (r"I have (?P<euro>\d+) Euro", True),
+        (r"I have (\d+) Euro", True),
+        (r"(?P<a>x) \(?P<b>y\)", True),
+        (r"(?i)I have (?P<euro>\d+) Euro", False),
+        (r"(?P<a>x) (?P=a)", False),
+        (r"(x) \1", False),
+        (r"(?P<a>x)?(?(a)y|z)", False),
+    ],
+)
+def test_is_combinable(pattern, expected):
+    assert parsers.is_combinable(parsers.re(pattern)) is expected
+
+
+def test_is_combinable_flags():
+    assert not parsers.is_combinable(parsers.re("I have (?P<euro>\\d+) Euro", re.IGNORECASE))
+    assert not parsers.is_combinable(parsers.parse("I have {euro:d} Euro"))
+
+
+@pytest.mark.parametrize("name", NAMES)
+def test_combined_regex(name):
+    """Test that the combined regex finds the same step and arguments as the regexes one by one."""
+    step_parsers = [parsers.re(pattern) for pattern in PATTERNS]
+    assert all(parsers.is_combinable(parser) for parser in step_parsers)
+    expected = next(
+        (
+            (index, parser.parse_arguments(name))
+            for index, parser in enumerate(step_parsers)
+            if parser.is_matching(name)
+        ),
+        None,
+    )
+    assert parsers.CombinedRegex(step_parsers).match(name) == expected
+
+
+def test_iter_matching():
+    """Test that the regex steps are combined between the other steps in the registration order."""
+    registry = StepRegistry()
+    registry.register(GIVEN, parsers.re(r"I have (?P<euro>\d+) Euro"), "first")
+    registry.register(GIVEN, parsers.re(r"I have (?P<count>\d+)"), "second")
+    registry.register(GIVEN, parsers.parse("I have {count:d} Euro"), "third")
+    registry.register(GIVEN, parsers.re(r"I have (?P<a>x) (?P=a)"), "fourth")
+    registry.register(GIVEN, parsers.re(r"I have (?P<count>\d+) Eur"), "fifth")
+    registry.register(GIVEN, parsers.re(r"I have (?P<euro>\d+) Euro"), "sixth")
+
+    assert [type(matcher) for _, matcher in registry.get_matchers(GIVEN)] == [
+        parsers.CombinedRegex,
+        parsers.parse,
+        parsers.re,
+        parsers.CombinedRegex,
+    ]
+    assert [
+        (fixture_name, arguments) for fixture_name, _, arguments in registry.iter_matching("I have 5 Euro", GIVEN)
+    ] == [
+        ("first", {"euro": "5"}),
+        ("second", {"count": "5"}),
+        ("third", {"count": 5}),
+        ("fifth", {"count": "5"}),
+        ("sixth", {"euro": "5"}),
+    ]
+
+    registry.register(GIVEN, parsers.re(r"I have (?P<a>x) (?P=a)"), "fourth")
+    assert [fixture_name for fixture_name, _, _ in registry.iter_matching("I have x x", GIVEN)] == ["fourth"]
@@ -0,0 +1,190 @@
+"""Step parser interface tests."""
+import textwrap
+
+import pytest
+
+from pytest_bdd import parsers
+from pytest_bdd.registry import StepRegistry
+from pytest_bdd.types import GIVEN
+
+
+class LegacyParser(parsers.StepParser):
+    """Step parser implementing only the methods before `match`."""
+
+    def is_matching(self, name):
+        return name.startswith(self.name)
+
+    def parse_arguments(self, name):
+        return {"rest": name[len(self.name) :]}
+
+
+class MatchParser(parsers.StepParser):
+    """Step parser implementing only `match`."""
+
+    def match(self, name):
+        return {"rest": name[len(self.name) :]} if name.startswith(self.name) else None
+
+
+class DuckParser:
+    """Step parser not based on `StepParser`."""
+
+    def __init__(self, name):
+        self.name = name
+
+    def is_matching(self, name):
+        return name.startswith(self.name)
+
+    def parse_arguments(self, name):
+        return {"rest": name[len(self.name) :]}
+
+
+class DoublingParse(parsers.parse):
+    """Parse step parser overriding only `parse_arguments`."""
+
+    def parse_arguments(self, name):
+        return {key: value * 2 for key, value in super().parse_arguments(name).items()}
+
+
+class PrefixRe(parsers.re):
+    """Regex step parser overriding only `is_matching`."""
+
+    def is_matching(self, name):
+        return name.startswith("I ") and super().is_matching(name)
+
+
+class CountingProxy:
+    """Proxy counting the calls of the regex or parse methods."""
+
+    def __init__(self, target, calls):
+        self.target = target
+        self.calls = calls
+
+    def __getattr__(self, name):
+        attribute = getattr(self.target, name)
+        if name in ("match", "parse"):
+
+            def counted(*args, **kwargs):
+                self.calls.append(name)
+                return attribute(*args, **kwargs)
+
+            return counted
+        return attribute
+
+
+@pytest.mark.parametrize(
+    ["parser", "expected"],
+    [
+        (parsers.re(r"I have (?P<count>\d+) cucumbers"), {"count": "5"}),
+        (parsers.parse("I have {count:d} cucumbers"), {"count": 5}),
+        (parsers.cfparse("I have {count:d} cucumbers"), {"count": 5}),
+        (parsers.string("I have 5 cucumbers"), {}),
+        (LegacyParser("I have "), {"rest": "5 cucumbers"}),
+        (MatchParser("I have "), {"rest": "5 cucumbers"}),
+        (DuckParser("I have "), {"rest": "5 cucumbers"}),
+        (DoublingParse("I have {count:d} cucumbers"), {"count": 10}),
+        (PrefixRe(r"\w+ have (?P<count>\d+) cucumbers"), {"count": "5"}),
+    ],
+)
+def test_match(parser, expected):
+    """Test that the step name is matched and its arguments are parsed at once."""
+    assert parsers.match_step(parser, "I have 5 cucumbers") == expected
+    assert parsers.match_step(parser, "You have 5 cucumbers") is None
+    assert parser.is_matching("I have 5 cucumbers")
+    assert not parser.is_matching("You have 5 cucumbers")
+    assert parser.parse_arguments("I have 5 cucumbers") == expected
+
+
+def test_match_parse_error():
+    """Test that the parse type conversion errors don't match."""
+
+    def to_int(text):
+        return int(text)
+
+    to_int.pattern = r".+"
+    parser = parsers.parse("I have {count:Int} cucumbers", extra_types={"Int": to_int})
+    assert parser.match("I have many cucumbers") is None
+    assert parser.match("I have 5 cucumbers") == {"count": 5}
+
+
+@pytest.mark.parametrize(
+    ["parser", "attribute", "expected"],
+    [
+        (parsers.re(r"I have (?P<count>\d+) cucumbers"), "regex", {"count": "5"}),
+        (parsers.parse("I have {count:d} cucumbers"), "parser", {"count": 5}),
+        (parsers.cfparse("I have {count:d} cucumbers"), "parser", {"count": 5}),
+    ],
+)
+def test_single_evaluation(parser, attribute, expected):
+    """Test that matching the step evaluates the regex of the step parser once."""
+    calls = []
+    setattr(parser, attribute, CountingProxy(getattr(parser, attribute), calls))
+    registry = StepRegistry()
+    registry.register(GIVEN, parser, "pytestbdd_given_cucumbers")
+
+    assert [arguments for _, _, arguments in registry.iter_matching("I have 5 cucumbers", GIVEN)] == [expected]
+    assert len(calls) == 1
+
+
+def test_overridden_parse_arguments():
+    """Test that the steps of the subclasses overriding only `parse_arguments` get the arguments they parse."""
+    assert not parsers.is_match_consistent(DoublingParse)
+    assert not parsers.is_match_consistent(PrefixRe)
+    assert parsers.is_match_consistent(parsers.cfparse)
+    assert parsers.is_match_consistent(MatchParser)
+
+    registry = StepRegistry()
+    registry.register(GIVEN, DoublingParse("I have {count:d} cucumbers"), "doubled")
+    registry.register(GIVEN, parsers.parse("I have {count:d} cucumbers"), "plain")
+    assert [
+        (fixture_name, arguments) for fixture_name, _, arguments in registry.iter_matching("I have 5 cucumbers", GIVEN)
+    ] == [
+        ("doubled", {"count": 10}),
+        ("plain", {"count": 5}),
+    ]
+
+
+def test_legacy_parser_steps(testdir):
+    """Test that the steps of the parsers implementing only the methods before `match` are found."""
+    testdir.makefile(
+        ".feature",
+        cucumbers=textwrap.dedent(
+            """\
+            Feature: Cucumbers
+                Scenario: Cucumbers
+                    Given I have 5 cucumbers
+                    Then I have 5 cucumbers left
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenario, then
+
+            class DuckParser:
+                def __init__(self, name):
+                    self.name = name
+
+                def is_matching(self, name):
+                    return name.startswith(self.name)
+
+                def parse_arguments(self, name):
+                    return {"rest": name[len(self.name) :]}
+
+            @scenario("cucumbers.feature", "Cucumbers")
+            def test_cucumbers():
+                pass
+
+            @given(DuckParser("I have "), target_fixture="cucumbers")
+            def cucumbers(rest):
+                return rest
+
+            @then(DuckParser("I have 5 cucumbers "))
+            def left(cucumbers, rest):
+                assert (cucumbers, rest) == ("5 cucumbers", "left")
+            """
+        )
+    )
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
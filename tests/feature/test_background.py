@@ -2,6 +2,8 @@
 
 import textwrap
 
+from pytest_bdd.parser import Step, parse_feature
+from pytest_bdd.types import GIVEN, THEN
 
 FEATURE = """\
 Feature: Background support
@@ -117,3 +119,17 @@ def test_background_check_order(testdir):
     )
     result = testdir.runpytest()
     result.assert_outcomes(passed=1)
+
+
+def test_background_steps_cache(testdir):
+    """Test that the cached scenario steps include the steps added later."""
+    testdir.makefile(".feature", background=textwrap.dedent(FEATURE))
+    feature = parse_feature(str(testdir.tmpdir), "background.feature")
+    scenario = feature.scenarios["Basic usage"]
+    assert len(scenario.steps) == 3
+    assert scenario.params == frozenset()
+
+    feature.background.add_step(Step(name="a <param>", type=GIVEN, indent=8, line_number=10, keyword="Given"))
+    scenario.add_step(Step(name="another step", type=THEN, indent=8, line_number=11, keyword="Then"))
+    assert [step.name for step in scenario.steps][2:] == ["a <param>", 'foo should have value "bar"', "another step"]
+    assert scenario.params == frozenset(["param"])
@@ -0,0 +1,139 @@
+"""Test the feature files in other languages."""
+import textwrap
+
+import pytest
+
+from pytest_bdd import exceptions, types
+from pytest_bdd.dialects import DIALECTS, get_dialect, get_language
+from pytest_bdd.parser import STEP_PREFIXES, index_feature, parse_feature
+
+GERMAN_FEATURE = textwrap.dedent(
+    """\
+    # language: de
+    @tag
+    Funktionalität: Gurken
+        Grundlage:
+            Angenommen es gibt Gurken
+
+        Szenariogrundriss: Gurken essen
+            Gegeben seien <start> Gurken
+            Wenn ich <eat> Gurken esse
+            Dann sollte ich <left> Gurken haben
+            Und ich bin satt
+
+            Beispiele:
+            | start | eat | left |
+            |  12   |  5  |  7   |
+    """
+)
+
+
+@pytest.mark.parametrize(
+    ["language", "line", "expected"],
+    [
+        ("en", "Scenario Outline: Outline", ("Scenario Outline:", "Outline", types.SCENARIO_OUTLINE)),
+        ("en", "Scenario: Scenario", ("Scenario:", "Scenario", types.SCENARIO)),
+        ("en", "Examples: Vertical", ("Examples: Vertical", "", types.EXAMPLES_VERTICAL)),
+        ("en", "Examples:", ("Examples:", "", types.EXAMPLES)),
+        ("en", "Givenx", ("", "Givenx", None)),
+        ("de", "Gegeben sei eine Gurke", ("Gegeben sei", "eine Gurke", types.GIVEN)),
+        ("de", "Gegeben seien Gurken", ("Gegeben seien", "Gurken", types.GIVEN)),
+        ("de", "Beispiel: Gurken", ("Beispiel:", "Gurken", types.SCENARIO)),
+        ("de", "Beispiele:", ("Beispiele:", "", types.EXAMPLES)),
+        ("de", "Given there are cucumbers", ("", "Given there are cucumbers", None)),
+        ("es", "Dados los pepinos", ("Dados", "los pepinos", types.GIVEN)),
+        ("es", "Y como pepinos", ("Y", "como pepinos", None)),
+        ("es", "Esquema del escenario: Pepinos", ("Esquema del escenario:", "Pepinos", types.SCENARIO_OUTLINE)),
+    ],
+)
+def test_match(language, line, expected):
+    assert get_dialect(language).match(line) == expected
+
+
+def test_english_prefixes():
+    """Test that every English prefix is matched by the English dialect."""
+    dialect = get_dialect("en")
+    for prefix, _type in STEP_PREFIXES:
+        assert dialect.match(prefix + "text")[2] == _type
+    assert all(get_dialect(language).trie for language in DIALECTS)
+
+
+@pytest.mark.parametrize(
+    ["lines", "expected"],
+    [
+        (["# language: de", "Funktionalität: Gurken"], ("de", 0)),
+        (["", "# comment", "  #language:es  ", "Característica: Pepinos"], ("es", 2)),
+        (["Feature: Cucumbers", "# language: de"], ("en", None)),
+        ([], ("en", None)),
+    ],
+)
+def test_get_language(lines, expected):
+    assert get_language(lines) == expected
+
+
+@pytest.mark.parametrize("parse", [parse_feature, index_feature])
+def test_german_feature(testdir, parse):
+    """Test that the feature file is parsed with the keywords of its language."""
+    testdir.makefile(".feature", gurken=GERMAN_FEATURE)
+    feature = parse(testdir.tmpdir.strpath, "gurken.feature")
+
+    assert (feature.name, feature.language, feature.tags) == ("Gurken", "de", {"tag"})
+    assert [step.keyword for step in feature.background.steps] == ["Angenommen"]
+    scenario = feature.scenarios["Gurken essen"]
+    assert [(step.type, step.keyword, step.name) for step in scenario.steps] == [
+        (types.GIVEN, "Angenommen", "es gibt Gurken"),
+        (types.GIVEN, "Gegeben seien", "<start> Gurken"),
+        (types.WHEN, "Wenn", "ich <eat> Gurken esse"),
+        (types.THEN, "Dann", "sollte ich <left> Gurken haben"),
+        (types.THEN, "Und", "ich bin satt"),
+    ]
+    assert scenario.examples.example_params == ["start", "eat", "left"]
+
+
+def test_unknown_language(testdir):
+    testdir.makefile(".feature", unknown="# language: xx\nFeature: Unknown\n")
+    with pytest.raises(exceptions.FeatureError) as excinfo:
+        index_feature(testdir.tmpdir.strpath, "unknown.feature")
+    assert excinfo.value.args == ("Unknown language 'xx'", 1, "# language: xx", "unknown.feature")
+
+
+def test_spanish_scenarios(testdir):
+    """Test that the scenarios of the feature file in Spanish are bound and run."""
+    testdir.makefile(
+        ".feature",
+        pepinos=textwrap.dedent(
+            """\
+            # language: es
+            Característica: Pepinos
+                Escenario: Comer pepinos
+                    Dado que hay 5 pepinos
+                    Cuando como 3 pepinos
+                    Entonces quedan 2 pepinos
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, when, then, scenarios
+
+            scenarios("pepinos.feature")
+
+            @given("que hay 5 pepinos", target_fixture="pepinos")
+            def pepinos():
+                return {"count": 5}
+
+            @when("como 3 pepinos")
+            def comer(pepinos):
+                pepinos["count"] -= 3
+
+            @then("quedan 2 pepinos")
+            def quedan(pepinos):
+                assert pepinos["count"] == 2
+            """
+        )
+    )
+
+    result = testdir.runpytest("-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*test_comer_pepinos PASSED*"])
@@ -0,0 +1,86 @@
+"""Test the persistent cache of the parsed feature files."""
+import textwrap
+
+from pytest_bdd import feature, feature_cache
+from pytest_bdd.feature_cache import FeatureCache
+from pytest_bdd.parser import ScenarioIndex
+
+FEATURE = """\
+Feature: Cached feature
+    Scenario: Cached scenario
+        Given I have a bar
+"""
+
+
+def test_feature_cache_hit(testdir, monkeypatch):
+    """Test that the unchanged feature file is not parsed again."""
+    testdir.makefile(".feature", cached=FEATURE)
+    cache = FeatureCache(str(testdir.mkdir("cache")))
+
+    parsed = cache.get_feature(str(testdir.tmpdir), "cached.feature")
+    assert list(parsed.scenarios) == ["Cached scenario"]
+
+    def parse_feature(*args, **kwargs):
+        raise AssertionError("The feature should be loaded from the cache")
+
+    monkeypatch.setattr(feature_cache, "parse_feature", parse_feature)
+    cached = cache.get_feature(str(testdir.tmpdir), "cached.feature")
+    assert cached is not parsed
+    # The scenarios are stored parsed, not as the sections to parse
+    assert not isinstance(cached.scenarios, ScenarioIndex)
+    assert cached.name == "Cached feature"
+    assert [step.name for step in cached.scenarios["Cached scenario"].steps] == ["I have a bar"]
+
+
+def test_feature_cache_stale(testdir):
+    """Test that the changed feature file is parsed again."""
+    feature_file = testdir.makefile(".feature", cached=FEATURE)
+    cache = FeatureCache(str(testdir.mkdir("cache")))
+
+    cache.get_feature(str(testdir.tmpdir), "cached.feature")
+    feature_file.write(FEATURE.replace("Cached scenario", "Changed scenario"))
+    changed = cache.get_feature(str(testdir.tmpdir), "cached.feature")
+    assert list(changed.scenarios) == ["Changed scenario"]
+
+
+def test_feature_cache_option(testdir, monkeypatch):
+    """Test that the parsed features are stored in the pytest cache directory when enabled."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_cache = true
+        """
+    )
+    testdir.makefile(".feature", cached=FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("cached.feature")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+    # Do not reuse the features parsed in this process
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+    entries = testdir.tmpdir.join(".pytest_cache", "d", feature_cache.CACHE_DIR_NAME).listdir()
+    assert entries
+    mtimes = [entry.mtime() for entry in entries]
+
+    def parse_feature(*args, **kwargs):
+        raise AssertionError("The feature should be loaded from the cache")
+
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+    monkeypatch.setattr(feature, "parse_feature", parse_feature)
+    monkeypatch.setattr(feature, "index_feature", parse_feature)
+    monkeypatch.setattr(feature_cache, "parse_feature", parse_feature)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+    assert [entry.mtime() for entry in entries] == mtimes
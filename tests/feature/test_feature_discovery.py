@@ -0,0 +1,150 @@
+"""Test the feature files discovery."""
+import os
+import textwrap
+
+from pytest_bdd import discovery
+from pytest_bdd.discovery import DirectoryCache, find_feature_files
+
+
+class Cache:
+    """In-memory pytest cache."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key, default):
+        return self.values.get(key, default)
+
+    def set(self, key, value):
+        self.values[key] = value
+
+
+def make_tree(testdir):
+    features = testdir.mkdir("features")
+    for path in ["b.feature", "a/c.feature", "a/b/a.feature", "node_modules/x.feature", ".hidden/y.feature"]:
+        features.join(path).write_text("Feature: Feature\n", "utf-8", ensure=True)
+    features.join("a", "notes.txt").write_text("Not a feature", "utf-8")
+    features.join("a", ".swap.feature").write_text("Not a feature", "utf-8")
+    return features
+
+
+def test_find_feature_files(testdir):
+    """Test that the feature files are found, sorted, skipping the ignored directories."""
+    features = make_tree(testdir)
+
+    assert find_feature_files(features.strpath) == [
+        features.join("a", "b", "a.feature").strpath,
+        features.join("a", "c.feature").strpath,
+        features.join("b.feature").strpath,
+    ]
+    assert find_feature_files(features.strpath, norecursedirs=["a"]) == [
+        features.join(".hidden", "y.feature").strpath,
+        features.join("b.feature").strpath,
+        features.join("node_modules", "x.feature").strpath,
+    ]
+
+
+def test_directory_cache(testdir, monkeypatch):
+    """Test that the unchanged directories are not listed again."""
+    features = make_tree(testdir)
+    old_mtime = 10**18
+    for path in [features, features.join("a"), features.join("a", "b")]:
+        os.utime(path.strpath, ns=(old_mtime, old_mtime))
+    cache = Cache()
+    directory_cache = DirectoryCache(cache)
+    expected = find_feature_files(features.strpath)
+    assert find_feature_files(features.strpath, directory_cache=directory_cache) == expected
+    directory_cache.save()
+    assert len(cache.values[discovery.CACHE_KEY]) == 3
+
+    listed = []
+    monkeypatch.setattr(discovery, "list_directory", lambda path: listed.append(path) or ([], []))
+    directory_cache = DirectoryCache(cache)
+    assert find_feature_files(features.strpath, directory_cache=directory_cache) == expected
+    assert listed == []
+
+    features.join("a", "d.feature").write_text("Feature: Feature\n", "utf-8")
+    assert find_feature_files(features.strpath, directory_cache=directory_cache) == [
+        path for path in expected if not path.startswith(features.join("a").strpath)
+    ]
+    assert listed == [features.join("a").strpath]
+
+
+def test_norecursedirs_option(testdir):
+    """Test that the scenarios of the ignored directories are not bound."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_norecursedirs = ignored
+        """
+    )
+    feature = textwrap.dedent(
+        """\
+        Feature: Feature
+            Scenario: {name}
+                Given I have a bar
+        """
+    )
+    features = testdir.mkdir("features")
+    features.join("bound.feature").write_text(feature.format(name="Bound scenario"), "utf-8")
+    features.join("ignored", "ignored.feature").write_text(
+        feature.format(name="Ignored scenario"), "utf-8", ensure=True
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("features")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+
+    result = testdir.runpytest("-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*test_bound_scenario PASSED*"])
+
+
+def test_dir_cache_option(testdir):
+    """Test that the directory listings are stored in the pytest cache."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_dir_cache = true
+        """
+    )
+    features = testdir.mkdir("features")
+    features.join("cached.feature").write_text(
+        textwrap.dedent(
+            """\
+            Feature: Feature
+                Scenario: Cached scenario
+                    Given I have a bar
+            """
+        ),
+        "utf-8",
+    )
+    os.utime(features.strpath, ns=(10**18, 10**18))
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("features")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+
+    for _ in range(2):
+        result = testdir.runpytest()
+        result.assert_outcomes(passed=1)
+    listings = testdir.tmpdir.join(".pytest_cache", "v", *discovery.CACHE_KEY.split("/")).read_text("utf-8")
+    assert '"cached.feature"' in listings
@@ -0,0 +1,78 @@
+"""Test the feature catalog shared with the xdist workers."""
+import textwrap
+
+import pytest
+
+from pytest_bdd import catalog, feature
+from tests.utils import make_features
+
+
+def test_catalog(testdir, monkeypatch):
+    """Test that the features of the catalog are stored in the features cache."""
+    features_dir = make_features(testdir, 2)
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+    data = catalog.dump_catalog([features_dir.strpath])
+
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+    assert catalog.load_catalog(data) == 2
+
+    def index_feature(*args, **kwargs):
+        raise AssertionError("The features should be loaded from the catalog")
+
+    monkeypatch.setattr(feature, "index_feature", index_feature)
+    loaded = feature.get_features([features_dir.strpath])
+    assert [f.name for f in loaded] == ["Feature 0", "Feature 1"]
+    assert [step.name for step in loaded[0].scenarios["Scenario 0"].steps] == ["I have a bar"]
+
+
+def test_catalog_version(testdir, monkeypatch):
+    """Test that the catalog made by another parser version is ignored."""
+    features_dir = make_features(testdir, 1)
+    data = catalog.dump_catalog([features_dir.strpath])
+    monkeypatch.setattr(catalog, "PARSER_VERSION", -1)
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+
+    assert catalog.load_catalog(data) == 0
+    assert len(feature.features) == 0
+
+
+def test_catalog_option(testdir):
+    """Test that the xdist workers don't parse the features of the catalog."""
+    pytest.importorskip("xdist")
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_catalog = features
+        """
+    )
+    make_features(testdir, 3)
+    testdir.makeconftest(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import feature
+
+            def pytest_configure(config):
+                if hasattr(config, "workerinput"):
+                    def index_feature(*args, **kwargs):
+                        raise AssertionError("The features should be loaded from the catalog")
+
+                    feature.index_feature = index_feature
+            """
+        )
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("features")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+
+    result = testdir.runpytest("-n", "2")
+    result.assert_outcomes(passed=3)
@@ -0,0 +1,299 @@
+"""Test the in-memory cache of the parsed features."""
+import os.path
+import sys
+import textwrap
+import time
+
+import pytest
+
+from pytest_bdd import feature
+from pytest_bdd.feature import FeaturesCache
+from pytest_bdd.parser import parse_feature
+from pytest_bdd.utils import CONFIG_STACK
+from tests.utils import make_features
+
+
+def set_mtime(path, age):
+    """Set the modification time of the file to the given number of seconds ago."""
+    mtime = int((time.time() - age) * 10**9)
+    os.utime(path, ns=(mtime, mtime))
+
+
+def make_parsed_features(testdir, count):
+    """Make the feature files and parse them.
+
+    :return: `dict` of the parsed features by the feature file path, in the feature files order.
+    """
+    features_dir = make_features(testdir, count)
+    paths = [features_dir.join(f"test_{index}.feature").strpath for index in range(count)]
+    for path in paths:
+        set_mtime(path, 60)
+    return {path: parse_feature(*os.path.split(path)) for path in paths}
+
+
+@pytest.fixture
+def outermost_session():
+    """Run the pytester sessions of the test as the outermost pytest sessions of the process."""
+    outer_configs = CONFIG_STACK[:]
+    del CONFIG_STACK[:]
+    yield
+    CONFIG_STACK[:] = outer_configs
+
+
+def test_features_cache_maxsize(testdir):
+    """Test that the least recently used features are evicted."""
+    parsed = make_parsed_features(testdir, 3)
+    first, second, third = parsed
+    cache = FeaturesCache(maxsize=2)
+
+    cache[first] = parsed[first]
+    cache[second] = parsed[second]
+    assert cache.get(first) is parsed[first]
+    cache[third] = parsed[third]
+
+    assert list(cache) == [first, third]
+    assert cache.get(second) is None
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.evictions, info.currsize) == (1, 1, 1, 2)
+
+
+def test_features_cache_maxbytes(testdir):
+    """Test that the features are evicted when their feature files are over the byte budget."""
+    parsed = make_parsed_features(testdir, 3)
+    size = os.path.getsize(next(iter(parsed)))
+    cache = FeaturesCache(maxbytes=size * 2)
+    for path, parsed_feature in parsed.items():
+        cache[path] = parsed_feature
+
+    assert list(cache) == list(parsed)[1:]
+    assert cache.cache_info().currbytes == size * 2
+
+    cache.resize(maxbytes=1)
+    assert list(cache) == list(parsed)[2:]
+    assert cache.cache_info().evictions == 2
+
+
+def test_features_cache_clear(testdir, monkeypatch):
+    """Test that the cache is cleared when the outermost pytest session is unconfigured."""
+    parsed = make_parsed_features(testdir, 1)
+    cache = FeaturesCache()
+    cache.update(parsed)
+    cache.get(next(iter(parsed)))
+    monkeypatch.setattr(feature, "features", cache)
+
+    feature.unconfigure(None)
+    assert len(cache) == 1
+
+    monkeypatch.setattr(feature, "CONFIG_STACK", [])
+    feature.unconfigure(None)
+    assert len(cache) == 0
+    assert cache.cache_info().hits == 0
+
+
+def make_bound_features(testdir, maxsize):
+    """Make the test module binding the scenarios of two feature files, checking the features cache size."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_memory_cache_size = 1
+        """
+    )
+    for index in range(2):
+        testdir.makefile(
+            ".feature",
+            **{
+                f"test_{index}": textwrap.dedent(
+                    f"""\
+                    Feature: Feature {index}
+                        Scenario: Scenario {index}
+                            Given I have a bar
+                    """
+                )
+            },
+        )
+    testdir.makepyfile(
+        textwrap.dedent(
+            f"""\
+            from pytest_bdd import feature, given, scenarios
+
+            scenarios(".")
+
+            @given("I have a bar")
+            def bar():
+                pass
+
+            def test_cache_size():
+                assert feature.features.maxsize == {maxsize}
+                assert len(feature.features) == {maxsize or 2}
+            """
+        )
+    )
+
+
+def test_features_memory_cache_option(testdir, monkeypatch, outermost_session):
+    """Test that the cache size is set by the ini option."""
+    make_bound_features(testdir, maxsize=1)
+    monkeypatch.setattr(feature, "features", FeaturesCache())
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=3)
+    assert feature.features.maxsize == 1
+
+
+def test_features_memory_cache_nested(testdir, monkeypatch):
+    """Test that the nested pytest session doesn't change the cache bounds of the outer one."""
+    make_bound_features(testdir, maxsize=0)
+    monkeypatch.setattr(feature, "features", FeaturesCache())
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=3)
+    assert feature.features.maxsize == 0
+    assert len(feature.features) == 2
+
+
+def test_features_cache_check(testdir, monkeypatch):
+    """Test that the features of the changed feature files are dropped with their test modules."""
+    parsed = make_parsed_features(testdir, 2)
+    changed, unchanged = parsed
+    cache = FeaturesCache(check_interval=0)
+    cache.update(parsed)
+    cache.bind(changed, "test_changed_module")
+    cache.bind(unchanged, "test_unchanged_module")
+    monkeypatch.setitem(sys.modules, "test_changed_module", object())
+    monkeypatch.setitem(sys.modules, "test_unchanged_module", object())
+
+    assert cache.check() == []
+    set_mtime(changed, 30)
+
+    assert cache.check() == [changed]
+    assert list(cache) == [unchanged]
+    assert "test_changed_module" not in sys.modules
+    assert "test_unchanged_module" in sys.modules
+    assert cache.cache_info().invalidations == 1
+
+
+def test_features_cache_check_interval(testdir):
+    """Test that the features are checked on access at most once per the check interval."""
+    parsed = make_parsed_features(testdir, 1)
+    path = next(iter(parsed))
+    cache = FeaturesCache(check_interval=3600)
+    cache.update(parsed)
+
+    with open(path, "a") as file:
+        file.write("    Some description\n")
+    assert cache.get(path) is parsed[path]
+
+    cache.check_interval = 0
+    assert cache.get(path) is None
+    info = cache.cache_info()
+    assert (info.hits, info.misses, info.invalidations, info.currsize) == (1, 1, 1, 0)
+
+
+def test_features_cache_racy_signature(testdir):
+    """Test that the feature file modified just before it was read is never fresh."""
+    parsed = make_parsed_features(testdir, 1)
+    path = next(iter(parsed))
+    set_mtime(path, 0)
+    cache = FeaturesCache(check_interval=0)
+    cache.update(parsed)
+
+    assert cache.check() == [path]
+    set_mtime(path, 60)
+    cache.update(parsed)
+    assert cache.check() == []
+
+
+def test_features_signature_before_read(testdir, monkeypatch):
+    """Test that the feature file changed while it's parsed is parsed again."""
+    path = next(iter(make_parsed_features(testdir, 1)))
+    base, name = os.path.split(path)
+    monkeypatch.setattr(feature, "features", FeaturesCache(check_interval=0))
+
+    calls = []
+
+    def index_feature(*args, **kwargs):
+        parsed = parse_feature(*args, **kwargs)
+        if not calls:
+            # Changed right after it's read
+            with open(path, "a") as file:
+                file.write("        And I have a foo\n")
+            set_mtime(path, 30)
+        calls.append(parsed)
+        return parsed
+
+    monkeypatch.setattr(feature, "index_feature", index_feature)
+    feature.get_feature(base, name)
+    changed = feature.get_feature(base, name)
+    assert changed is calls[1]
+    assert len(changed.scenarios["Scenario 0"].steps) == 2
+
+
+def test_features_check_interval_option(testdir, monkeypatch, outermost_session):
+    """Test that the changed feature files are parsed again in the following pytest sessions."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_check_interval = 0
+        """
+    )
+    feature_file = testdir.makefile(
+        ".feature",
+        checked=textwrap.dedent(
+            """\
+            Feature: Checked feature
+                Scenario: First scenario
+                    Given I have a bar
+            """
+        ),
+    )
+    testdir.makepyfile(
+        test_checked=textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("checked.feature")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+    monkeypatch.setattr(feature, "features", FeaturesCache())
+    monkeypatch.delitem(sys.modules, "test_checked", raising=False)
+    set_mtime(feature_file.strpath, 60)
+
+    result = testdir.runpytest("-v")
+    result.stdout.fnmatch_lines(["*test_first_scenario PASSED*"])
+    assert feature.features.cache_info().currsize == 1
+
+    feature_file.write_text(feature_file.read_text("utf-8").replace("First", "Second"), "utf-8")
+    set_mtime(feature_file.strpath, 30)
+    result = testdir.runpytest("-v")
+    result.stdout.fnmatch_lines(["*test_second_scenario PASSED*"])
+    assert feature.features.cache_info().invalidations == 1
+
+
+def test_features_check_interval_nested(testdir, monkeypatch):
+    """Test that the nested pytest session doesn't check the features of the outer one."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_check_interval = 0
+        """
+    )
+    testdir.makepyfile("def test_nested():\n    pass\n")
+    parsed = make_parsed_features(testdir, 1)
+    path = next(iter(parsed))
+    cache = FeaturesCache()
+    cache.update(parsed)
+    cache.bind(path, "test_outer_module")
+    monkeypatch.setattr(feature, "features", cache)
+    monkeypatch.setitem(sys.modules, "test_outer_module", object())
+    set_mtime(path, 30)
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+    assert cache.check_interval is None
+    assert list(cache) == [path]
+    assert "test_outer_module" in sys.modules
@@ -0,0 +1,215 @@
+"""Test the scenarios parsed on demand."""
+import pickle
+import textwrap
+
+import pytest
+
+from pytest_bdd import exceptions, feature, parser
+from pytest_bdd.parser import FeatureBuffer, ScenarioSection, StepLines, index_feature
+
+FEATURE = textwrap.dedent(
+    """\
+    Feature: Indexed
+        Background:
+            Given there is a background
+
+        Scenario: First
+            Given there is a step with:
+                Scenario: Not a scenario
+            Then the step text is not a scenario
+
+        @tag
+        Scenario: Broken
+            Given there is a step
+    Feature: Another feature
+    """
+)
+
+
+def test_index_feature(testdir):
+    """Test that the scenarios are parsed on the first access."""
+    testdir.makefile(".feature", indexed=FEATURE)
+    feature = index_feature(str(testdir.tmpdir), "indexed.feature")
+
+    assert feature.name == "Indexed"
+    assert [step.name for step in feature.background.steps] == ["there is a background"]
+    assert list(feature.scenarios) == ["First", "Broken"]
+    assert all(isinstance(section, ScenarioSection) for section in feature.scenarios.scenarios.values())
+
+    first = feature.scenarios["First"]
+    assert feature.scenarios["First"] is first
+    assert first.line_number == 5
+    assert [step.name for step in first.steps] == [
+        "there is a background",
+        "there is a step with:\nScenario: Not a scenario",
+        "the step text is not a scenario",
+    ]
+
+    with pytest.raises(exceptions.FeatureError) as excinfo:
+        feature.scenarios["Broken"]
+    assert excinfo.value.args[:2] == ("Multiple features are not allowed in a single feature file", 13)
+
+
+def test_index_feature_background_after_scenario(testdir):
+    """Test that the feature with the background after the scenarios is parsed at once."""
+    testdir.makefile(
+        ".feature",
+        indexed=textwrap.dedent(
+            """\
+            Feature: Indexed
+                Scenario: First
+                    Given there is a step
+
+                Background:
+                    Given there is a background
+            """
+        ),
+    )
+    feature = index_feature(str(testdir.tmpdir), "indexed.feature")
+
+    assert isinstance(feature.scenarios, dict)
+    assert feature.background.line_number == 5
+
+
+def test_scenario_of_broken_feature(testdir):
+    """Test that only the bound scenarios are parsed."""
+    testdir.makefile(".feature", indexed=FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, then, parsers, scenario
+
+            @scenario("indexed.feature", "First")
+            def test_first():
+                pass
+
+            @given("there is a background")
+            @given(parsers.parse("there is a step with:\\n{text}"))
+            def step():
+                pass
+
+            @then("the step text is not a scenario")
+            def then_step():
+                pass
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_index_feature_buffer(testdir, monkeypatch):
+    """Test that the multiline step content of the large feature files is decoded on the first access."""
+    monkeypatch.setattr(parser, "BUFFER_THRESHOLD", 0)
+    testdir.makefile(".feature", indexed=FEATURE)
+    feature = index_feature(str(testdir.tmpdir), "indexed.feature")
+
+    assert isinstance(feature.scenarios.lines, FeatureBuffer)
+    assert feature.scenarios.scenarios["First"].blocks == ((6, 7),)
+    [_, step, then_step] = feature.scenarios["First"].steps
+    assert isinstance(step.lines, StepLines)
+    assert step.name == "there is a step with:\nScenario: Not a scenario"
+    assert then_step.name == "the step text is not a scenario"
+
+    unpickled = pickle.loads(pickle.dumps(feature))
+    assert unpickled.scenarios["First"].steps[1].name == step.name
+    with pytest.raises(exceptions.FeatureError):
+        unpickled.scenarios["Broken"]
+
+
+def test_index_feature_buffer_changed_file(testdir, monkeypatch):
+    """Test that the feature buffer is not affected by the changes of the feature file after indexing."""
+    monkeypatch.setattr(parser, "BUFFER_THRESHOLD", 0)
+    feature_file = testdir.makefile(".feature", indexed=FEATURE)
+    feature = index_feature(str(testdir.tmpdir), "indexed.feature")
+
+    assert type(feature.scenarios.lines.data) is bytes
+    with open(str(feature_file), "w") as f:
+        f.truncate()
+    [_, step, _] = feature.scenarios["First"].steps
+    assert step.name == "there is a step with:\nScenario: Not a scenario"
+
+
+def test_step_lines_params(testdir, monkeypatch):
+    """Test that the params of the multiline step content are found without decoding it."""
+    monkeypatch.setattr(parser, "BUFFER_THRESHOLD", 0)
+    testdir.makefile(
+        ".feature",
+        outline=textwrap.dedent(
+            """\
+            Feature: Outline
+                Scenario Outline: Outline
+                    Given there are <count> steps with:
+                        \"\"\"
+                        <count> of <what> for <whöm>
+                        <not
+                        a param>
+                        \"\"\"
+                    Then there are no params with:
+                        No params
+
+                    Examples:
+                    | count | what | whöm |
+                    | 5     | eggs | me   |
+            """
+        ),
+    )
+    feature = index_feature(str(testdir.tmpdir), "outline.feature")
+    scenario = feature.scenarios["Outline"]
+    scenario.validate()
+
+    given_step, then_step = scenario.steps
+    assert sorted(given_step.params) == ["count", "what", "whöm"]
+    assert then_step.params == ()
+    assert scenario.params == {"count", "what", "whöm"}
+    assert given_step._full_name is None and then_step._full_name is None
+    assert sorted(parser.get_step_params(given_step.name)) == sorted(given_step.params)
+
+
+def test_bound_scenario_not_decoded(testdir, monkeypatch):
+    """Test that binding a scenario doesn't decode the multiline content of its steps."""
+    monkeypatch.setattr(parser, "BUFFER_THRESHOLD", 0)
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+    feature_file = testdir.makefile(
+        ".feature",
+        large=textwrap.dedent(
+            """\
+            Feature: Large
+                Scenario: Large
+                    Given there is a large doc string:
+                        \"\"\"
+            {}
+                        \"\"\"
+            """
+        ).format("\n".join(f"            Line {index}" for index in range(1000))),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("large.feature")
+
+            @given("there is a large doc string")
+            def large():
+                pass
+            """
+        )
+    )
+
+    result = testdir.runpytest("--collect-only")
+    result.stdout.fnmatch_lines(["*test_large*"])
+    [step] = feature.features[feature_file.strpath].scenarios["Large"].steps
+    assert isinstance(step.lines, StepLines)
+    assert step._full_name is None
+
+
+def test_feature_buffer_lines():
+    """Test that the feature buffer lines are split the same way as the decoded lines."""
+    text = "Feature: \u00e9\r\n\r\n  Scenario: \u2028\x0c\u00a0step\n\n"
+    buffer = FeatureBuffer(text.encode("utf-8"))
+    assert list(buffer) == buffer[:] == text.splitlines()
+    assert buffer[1:3] == text.splitlines()[1:3]
+    assert [indent for indent, _, _ in parser.iter_indents(buffer)] == [
+        indent for indent, _, _ in parser.iter_indents(text.splitlines())
+    ]
@@ -0,0 +1,50 @@
+"""Test the incremental feature parsing."""
+import textwrap
+
+from pytest_bdd.parser import Background, Feature, Scenario, iter_feature
+
+
+def test_iter_feature(testdir):
+    """Test that the feature, background and scenarios are yielded in order."""
+    testdir.makefile(
+        ".feature",
+        incremental=textwrap.dedent(
+            """\
+            Feature: Incremental
+                Description
+
+                Background:
+                    Given there is a background
+
+                Scenario: First
+                    Given there is a first scenario
+
+                Scenario Outline: Second
+                    Given there are <count> scenarios
+
+                    Examples:
+                    | count |
+                    | 2     |
+            """
+        ),
+    )
+    items = list(iter_feature(str(testdir.tmpdir), "incremental.feature"))
+
+    assert [type(item) for item in items] == [Feature, Background, Scenario, Scenario]
+    feature, background, first, second = items
+    assert feature.name == "Incremental"
+    assert feature.description == "Description"
+    assert feature.background is background
+    assert feature.scenarios == {}
+    assert [step.name for step in first.steps] == ["there is a background", "there is a first scenario"]
+    assert second.name == "Second"
+    assert second.examples.examples == [["2"]]
+
+
+def test_iter_feature_without_scenarios(testdir):
+    """Test that the feature is yielded even if there are no scenarios."""
+    testdir.makefile(".feature", empty="Feature: Empty\n    Description\n")
+    [feature] = iter_feature(str(testdir.tmpdir), "empty.feature")
+
+    assert feature.name == "Empty"
+    assert feature.description == "Description"
@@ -3,6 +3,9 @@ import textwrap
 
 import pytest
 
+from pytest_bdd.parser import Step
+from pytest_bdd.types import GIVEN
+
 
 @pytest.mark.parametrize(
     ["feature_text", "expected_text"],
@@ -152,3 +155,17 @@ def test_multiline_wrong_indent(testdir):
     result = testdir.runpytest()
     result.assert_outcomes(failed=1)
     result.stdout.fnmatch_lines("*StepDefinitionNotFoundError: Step definition is not found:*")
+
+
+def test_multiline_step_name_is_updated():
+    """Test that the memoized step name follows the step changes."""
+    step = Step(name="I have a step with:", type=GIVEN, indent=4, line_number=1, keyword="Given")
+    assert step.name == "I have a step with:"
+
+    step.add_line('    """')
+    step.add_line("    Some")
+    step.add_line('    """')
+    assert step.name == "I have a step with:\nSome"
+
+    step.name = "I have another step with:"
+    assert step.name == "I have another step with:\nSome"
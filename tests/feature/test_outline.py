@@ -1,6 +1,10 @@
 """Scenario Outline tests."""
 import textwrap
 
+import pytest
+
+from pytest_bdd import exceptions
+from pytest_bdd.parser import Examples, split_line, split_table
 from tests.utils import assert_outcomes
 
 STEPS = """\
@@ -159,6 +163,60 @@ def test_wrong_vertical_examples_scenario(testdir):
     )
 
 
+def test_wrong_examples_row_length(testdir):
+    """Test parametrized scenario example row has wrong number of values."""
+    testdir.makefile(
+        ".feature",
+        outline=textwrap.dedent(
+            """\
+            Feature: Outline
+                Scenario Outline: Outlined with wrong example row
+                    Given there are <start> cucumbers
+                    When I eat <eat> cucumbers
+                    Then I should have <left> cucumbers
+
+                    Examples:
+                    | start | eat | left |
+                    |  12   |  5  |
+            """
+        ),
+    )
+    testdir.makeconftest(textwrap.dedent(STEPS))
+
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+        from pytest_bdd import scenario
+
+        @scenario("outline.feature", "Outlined with wrong example row")
+        def test_outline(request):
+            pass
+        """
+        )
+    )
+    result = testdir.runpytest()
+    assert_outcomes(result, errors=1)
+    result.stdout.fnmatch_lines("*Scenario has not valid examples. Example rows should contain 3 values, 2 found.*")
+
+
+def test_examples_lines_are_split_on_access():
+    """Test that the example lines are counted when added and split at once when the columns are accessed."""
+    lines = ["| 1 \\| 2 |   3   |  # comment", "|   | \\\\| |", "| ü|é |"]
+    examples = Examples()
+    examples.set_param_names(["a", "b"])
+    for line in lines:
+        examples.add_example_line(line)
+    assert len(examples) == 3
+    assert examples._lines == lines
+
+    expected = [split_line(line) for line in lines]
+    assert examples.examples == expected
+    assert split_table(["| 1 | 2 |  # comment", "|| x |"], 2) == [["1", ""], ["2", "x"]]
+    assert not examples._lines
+    examples.add_example(["4", "5"])
+    assert examples.examples == expected + [["4", "5"]]
+
+
 def test_wrong_vertical_examples_feature(testdir):
     """Test parametrized feature vertical example table has wrong format."""
     testdir.makefile(
@@ -424,3 +482,33 @@ def test_outline_with_escaped_pipes(testdir):
     )
     result = testdir.runpytest()
     result.assert_outcomes(passed=7)
+
+
+def test_examples_compatible_accessors():
+    """Test that the example rows and columns can be set and read as before the columnar storage."""
+    examples = Examples()
+    examples.add_example(["1", "2"])
+    examples.set_param_names(["a", "b"])
+    examples.add_example(["3", "4"])
+    assert examples.examples == [["1", "2"], ["3", "4"]]
+    assert examples.vertical_examples == [["1", "3"], ["2", "4"]]
+    assert examples.get_params({"a": int}) == [["a", "b"], [[1, "2"], [3, "4"]]]
+
+    examples.examples = [["5", "6"]]
+    assert examples.vertical_examples == [["5"], ["6"]]
+    assert examples.get_params(None) == [["a", "b"], [["5", "6"]]]
+    examples.vertical_examples = [["7", "8"], ["9", "10"]]
+    assert examples.examples == [["7", "9"], ["8", "10"]]
+
+    with pytest.raises(exceptions.ExamplesNotValidError):
+        examples.examples = [["1", "2", "3"]]
+    with pytest.raises(exceptions.ExamplesNotValidError):
+        examples.vertical_examples = [["1"], ["2", "3"]]
+    with pytest.raises(exceptions.ExamplesNotValidError):
+        examples.set_param_names(["a"])
+
+    examples.examples = []
+    assert not examples
+    examples.set_param_names(["c"])
+    examples.add_example(["1"])
+    assert examples.get_params(None) == [["c"], [["1"]]]
@@ -0,0 +1,60 @@
+"""Test parsing the feature files in a process pool."""
+import textwrap
+
+from pytest_bdd import feature
+from tests.utils import make_features
+
+
+def test_get_features_parallel(testdir, monkeypatch):
+    """Test that the features parsed in the process pool are stored in the features cache."""
+    features_dir = make_features(testdir, 3)
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+    monkeypatch.setattr(feature, "PARALLEL_PARSE_THRESHOLD", 2)
+
+    parsed = feature.get_features([str(features_dir)], workers=2)
+
+    assert [f.name for f in parsed] == ["Feature 0", "Feature 1", "Feature 2"]
+    assert [list(f.scenarios) for f in parsed] == [["Scenario 0"], ["Scenario 1"], ["Scenario 2"]]
+    assert sorted(feature.features) == sorted(f.filename for f in parsed)
+    assert feature.get_features([str(features_dir)]) == parsed
+
+
+def test_get_features_parallel_threshold(testdir, monkeypatch):
+    """Test that the features are parsed serially below the threshold."""
+    features_dir = make_features(testdir, 3)
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+
+    def parse_feature(*args, **kwargs):
+        raise AssertionError("The features should be parsed serially")
+
+    monkeypatch.setattr(feature, "parse_feature", parse_feature)
+
+    parsed = feature.get_features([str(features_dir)], workers=2)
+    assert [f.name for f in parsed] == ["Feature 0", "Feature 1", "Feature 2"]
+
+
+def test_parse_workers_option(testdir, monkeypatch):
+    """Test that the scenarios are found with the parallel parsing enabled."""
+    monkeypatch.setattr(feature, "PARALLEL_PARSE_THRESHOLD", 2)
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_parse_workers = 2
+        """
+    )
+    make_features(testdir, 3)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("features")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=3)
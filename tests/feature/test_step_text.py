@@ -0,0 +1,58 @@
+"""Test the step texts shared by the parsed steps."""
+import pickle
+import sys
+import textwrap
+
+from pytest_bdd.parser import get_step_params, parse_feature
+
+
+def test_step_text_is_shared(testdir):
+    """Test that the steps with the same text share the name and params, also when unpickled."""
+    testdir.makefile(
+        ".feature",
+        shared=textwrap.dedent(
+            """\
+            Feature: Shared step texts
+                Scenario: First
+                    Given I am logged in as <user>
+
+                Scenario: Second
+                    Given I am logged in as <user>
+            """
+        ),
+    )
+    feature = parse_feature(str(testdir.tmpdir), "shared.feature")
+    first, second = (feature.scenarios[name].steps[0] for name in ("First", "Second"))
+    assert first is not second
+    assert first.name is second.name
+    assert first.keyword is second.keyword
+    assert first.params is second.params == ("user",)
+
+    unpickled = pickle.loads(pickle.dumps(first))
+    assert unpickled.name is first.name
+    assert unpickled.line_number == 3
+
+
+def test_multiline_step_text_is_not_kept(testdir):
+    """Test that the multiline step names are neither interned nor kept by the params cache."""
+    testdir.makefile(
+        ".feature",
+        multiline=textwrap.dedent(
+            """\
+            Feature: Multiline step texts
+                Scenario: Multiline
+                    Given I am logged in as <user> with:
+                        \"\"\"
+                        the <password>
+                        \"\"\"
+            """
+        ),
+    )
+    feature = parse_feature(str(testdir.tmpdir), "multiline.feature")
+    [step] = feature.scenarios["Multiline"].steps
+    get_step_params.cache_clear()
+
+    assert sorted(step.params) == ["password", "user"]
+    assert get_step_params.cache_info().currsize == 1
+    assert step.name == "I am logged in as <user> with:\nthe <password>"
+    assert sys.intern("".join(list(step.name))) is not step.name
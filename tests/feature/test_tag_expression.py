@@ -0,0 +1,104 @@
+"""Test the cucumber tag expressions."""
+import textwrap
+
+import pytest
+
+from pytest_bdd.exceptions import TagExpressionError
+from pytest_bdd.parser import ScenarioSection, index_feature
+from pytest_bdd.tag_expression import TagExpression
+
+FEATURE = """\
+@feature_tag
+Feature: Tagged feature
+    @smoke @slow
+    Scenario: Slow smoke scenario
+        Given I have a bar
+
+    @smoke
+    Scenario: Smoke scenario
+        Given I have a bar
+
+    @flaky
+    Scenario: Flaky scenario
+        Given I have a bar
+"""
+
+
+@pytest.mark.parametrize(
+    ["expression", "tags", "expected"],
+    [
+        ("@smoke", {"smoke"}, True),
+        ("@smoke", {"slow"}, False),
+        ("not @smoke", {"slow"}, True),
+        ("@smoke and @slow", {"smoke"}, False),
+        ("@smoke or @slow", {"slow"}, True),
+        ("@smoke and not (@slow or @flaky)", {"smoke"}, True),
+        ("@smoke and not (@slow or @flaky)", {"smoke", "flaky"}, False),
+        ("@a or @b and @c", {"a"}, True),
+        ("not @a and @b", {"b"}, True),
+        ("not not @a", {"a"}, True),
+        (r"@with\ space or @x\(y\)", {"x(y)"}, True),
+        ("smoke", {"smoke"}, True),
+    ],
+)
+def test_evaluate(expression, tags, expected):
+    assert TagExpression(expression).evaluate(tags) is expected
+
+
+@pytest.mark.parametrize("expression", ["", "@a and", "(@a", "@a)", "not", "@a @b", "and @a", "@a\\"])
+def test_invalid(expression):
+    with pytest.raises(TagExpressionError):
+        TagExpression(expression)
+
+
+def test_select_scenarios(testdir):
+    """Test that the scenarios are selected by the feature tag index, without parsing them."""
+    path = testdir.makefile(".feature", tagged=FEATURE)
+    feature = index_feature(path.dirname, path.basename)
+
+    assert TagExpression("@smoke and not @slow").select_scenarios(feature) == ["Smoke scenario"]
+    assert TagExpression("@feature_tag and not @smoke").select_scenarios(feature) == ["Flaky scenario"]
+    assert TagExpression("@other").select_scenarios(feature) == []
+    assert all(isinstance(section, ScenarioSection) for section in feature.scenarios.scenarios.values())
+
+
+def test_bdd_tags_option(testdir):
+    """Test that only the scenarios matching the tag expression are bound."""
+    testdir.makefile(".feature", tagged=FEATURE)
+    testdir.makeconftest(
+        textwrap.dedent(
+            """\
+            def pytest_bdd_apply_tag(tag, function):
+                assert tag != "slow", "The excluded scenarios should not be marked"
+                return True
+            """
+        )
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenario, scenarios
+
+            @scenario("tagged.feature", "Slow smoke scenario")
+            def test_slow():
+                pass
+
+            scenarios("tagged.feature")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+
+    result = testdir.runpytest("-v", "--bdd-tags", "@smoke and not (@slow or @flaky)")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*test_smoke_scenario PASSED*"])
+
+
+def test_bdd_tags_option_invalid(testdir):
+    """Test that the invalid tag expression is reported as a usage error."""
+    result = testdir.runpytest("--bdd-tags", "@smoke and")
+    assert result.ret == 4
+    result.stderr.fnmatch_lines(["*--bdd-tags: Unexpected end of the tag expression '@smoke and'*"])
@@ -4,7 +4,7 @@ import textwrap
 import pkg_resources
 import pytest
 
-from pytest_bdd.parser import get_tags
+from pytest_bdd.parser import ScenarioSection, get_tags, index_feature, parse_feature
 
 
 def test_tags_selector(testdir):
@@ -261,3 +261,64 @@ def test_at_in_scenario(testdir):
 )
 def test_get_tags(line, expected):
     assert get_tags(line) == expected
+
+
+TAGGED_FEATURE = """\
+@feature_tag
+Feature: Tagged feature
+    @smoke @slow
+    Scenario: Slow smoke scenario
+        Given I have a bar
+
+    @smoke
+    Scenario: Smoke scenario
+        Given I have a bar
+
+    Scenario: Untagged scenario
+        Given I have a bar
+"""
+
+
+def test_tag_index(testdir):
+    """Test that the scenario tags are indexed, without parsing the scenarios."""
+    path = testdir.makefile(".feature", tagged=TAGGED_FEATURE)
+
+    indexed = index_feature(path.dirname, path.basename)
+    assert indexed.tag_index == {"smoke": ("Slow smoke scenario", "Smoke scenario"), "slow": ("Slow smoke scenario",)}
+    assert parse_feature(path.dirname, path.basename).tag_index == indexed.tag_index
+
+    assert indexed.select_scenarios(["smoke"]) == ["Slow smoke scenario", "Smoke scenario"]
+    assert indexed.select_scenarios(["slow", "missing"]) == ["Slow smoke scenario"]
+    assert indexed.select_scenarios(["feature_tag"]) == list(indexed.scenarios)
+    assert all(isinstance(section, ScenarioSection) for section in indexed.scenarios.scenarios.values())
+
+
+def test_scenarios_tags(testdir):
+    """Test that only the scenarios tagged with any of the tags are bound."""
+    testdir.makeini(
+        """
+        [pytest]
+        markers =
+            feature_tag
+            smoke
+            slow
+        """
+    )
+    testdir.makefile(".feature", tagged=TAGGED_FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("tagged.feature", tags=["slow"])
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+
+    result = testdir.runpytest("-v")
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(["*test_slow_smoke_scenario PASSED*"])
@@ -0,0 +1,52 @@
+"""Test the tokenizer of the feature file lines."""
+import pytest
+
+from pytest_bdd import types
+from pytest_bdd.parser import Token, match_prefix, tokenize
+
+
+@pytest.mark.parametrize(
+    ["line", "language", "expected"],
+    [
+        ("Given I have a bar", "en", ("Given", "I have a bar", types.GIVEN)),
+        ("When I eat", "en", ("When", "I eat", types.WHEN)),
+        ("Then I am full", "en", ("Then", "I am full", types.THEN)),
+        ("And I have a foo", "en", ("And", "I have a foo", None)),
+        ("But not a baz", "en", ("But", "not a baz", None)),
+        ("Scenario: Eating", "en", ("Scenario:", "Eating", types.SCENARIO)),
+        ("Scenario Outline: Eating", "en", ("Scenario Outline:", "Eating", types.SCENARIO_OUTLINE)),
+        ("Examples:", "en", ("Examples:", "", types.EXAMPLES)),
+        ("@tag", "en", ("@", "tag", types.TAG)),
+        ("Givenchy is a brand", "en", ("", "Givenchy is a brand", None)),
+        ("Angenommen ich habe", "de", ("Angenommen", "ich habe", types.GIVEN)),
+        ("Given I have a bar", "de", ("", "Given I have a bar", None)),
+    ],
+)
+def test_match_prefix(line, language, expected):
+    """Test that the keyword of the language is matched at the start of the line."""
+    assert match_prefix(line, language) == expected
+
+
+def test_tokenize():
+    """Test that every line is split into the indent, the keyword and the text without comments."""
+    lines = [
+        "Feature: Tokens  # comment",
+        "  @tag",
+        "    Given I have a bar  # comment",
+        "      And I have issue#5  # comment",
+        "    | a | b |",
+        "",
+    ]
+    tokens = list(tokenize(lines, start=3))
+
+    assert all(isinstance(token, Token) for token in tokens)
+    assert [token.line_number for token in tokens] == [3, 4, 5, 6, 7, 8]
+    assert [token.line for token in tokens] == lines
+    assert [token.indent for token in tokens] == [0, 2, 4, 6, 4, 0]
+    assert tokens[0] == Token(
+        3, lines[0], 0, "Feature: Tokens  # comment", "Feature: Tokens", types.FEATURE, "Feature:", "Tokens"
+    )
+    assert tokens[2][4:] == ("Given I have a bar", types.GIVEN, "Given", "I have a bar")
+    assert tokens[3][4:] == ("And I have issue#5", None, "And", "I have issue#5")
+    assert tokens[4][4:] == ("| a | b |", None, "", "| a | b |")
+    assert tokens[5][3:] == ("", "", None, "", "")
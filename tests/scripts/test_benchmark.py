@@ -0,0 +1,17 @@
+"""Test the benchmark script."""
+import importlib.util
+import os.path
+
+BENCHMARK_PATH = os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, "benchmarks", "benchmark.py")
+
+
+def test_benchmarks(tmpdir):
+    """Test that every benchmark runs."""
+    spec = importlib.util.spec_from_file_location("benchmark", BENCHMARK_PATH)
+    benchmark = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(benchmark)
+
+    benchmarks = benchmark.get_benchmarks(tmpdir.strpath)
+    assert [name for name, _ in benchmarks if name.startswith("lookup")]
+    for _, function in benchmarks:
+        function()
@@ -0,0 +1,107 @@
+"""Test the feature bundle compilation command."""
+import sys
+import textwrap
+
+import pytest
+
+from pytest_bdd import bundle, feature
+from pytest_bdd.bundle import FeatureBundle, load_bundle
+from pytest_bdd.scripts import main
+
+FEATURE = """\
+Feature: Compiled feature
+    Scenario: Compiled scenario
+        Given I have a bar
+"""
+
+
+def compile_features(testdir, monkeypatch, *paths):
+    monkeypatch.setattr(sys, "argv", ["", "compile", "-o", testdir.tmpdir.join("features.bundle").strpath, *paths])
+    main()
+    return FeatureBundle(testdir.tmpdir.join("features.bundle").strpath)
+
+
+def test_compile(testdir, monkeypatch, capsys):
+    """Test that the compiled features are loaded from the bundle."""
+    features = testdir.mkdir("features")
+    features.join("compiled.feature").write_text(FEATURE, "utf-8")
+    features.join("nested", "other.feature").write_text(
+        FEATURE.replace("Compiled feature", "Other feature"), "utf-8", ensure=True
+    )
+
+    bundle = compile_features(testdir, monkeypatch, features.strpath)
+    out, err = capsys.readouterr()
+    assert out == f"compiled 2 feature files into {testdir.tmpdir.join('features.bundle').strpath}\n"
+
+    compiled = bundle.get_feature(features.strpath, "compiled.feature")
+    assert compiled.name == "Compiled feature"
+    assert compiled.filename == features.join("compiled.feature").strpath
+    assert compiled.rel_filename == "features/compiled.feature"
+    assert [step.name for step in compiled.scenarios["Compiled scenario"].steps] == ["I have a bar"]
+    assert bundle.get_feature(features.join("nested").strpath, "other.feature").name == "Other feature"
+
+
+def test_compile_stale(testdir, monkeypatch):
+    """Test that the changed or not compiled feature files are not loaded from the bundle."""
+    features = testdir.mkdir("features")
+    feature_file = features.join("compiled.feature")
+    feature_file.write_text(FEATURE, "utf-8")
+
+    bundle = compile_features(testdir, monkeypatch, feature_file.strpath)
+    features.join("other.feature").write_text(FEATURE, "utf-8")
+    assert bundle.get_feature(features.strpath, "other.feature") is None
+    assert bundle.get_feature(features.strpath, "compiled.feature", encoding="latin-1") is None
+
+    feature_file.write_text(FEATURE.replace("Compiled scenario", "Changed scenario"), "utf-8")
+    assert bundle.get_feature(features.strpath, "compiled.feature") is None
+
+
+def test_load_bundle_broken(testdir, monkeypatch):
+    """Test that the broken bundle is ignored with a warning."""
+    with pytest.warns(pytest.PytestWarning, match="Cannot load the feature bundle .*missing.bundle"):
+        assert load_bundle(testdir.tmpdir.join("missing.bundle").strpath) is None
+    with pytest.warns(pytest.PytestWarning, match="is not a feature bundle"):
+        assert load_bundle(testdir.makefile(".bundle", broken="Feature: Not a bundle").strpath) is None
+    truncated = testdir.makefile(".bundle", truncated="")
+    truncated.write_binary(bundle.MAGIC)
+    with pytest.warns(pytest.PytestWarning, match="Cannot load the feature bundle"):
+        assert load_bundle(truncated.strpath) is None
+
+    compile_features(testdir, monkeypatch, testdir.makefile(".feature", compiled=FEATURE).strpath)
+    monkeypatch.setattr(bundle, "PARSER_VERSION", -1)
+    with pytest.warns(pytest.PytestWarning, match="compiled by another version"):
+        assert load_bundle(testdir.tmpdir.join("features.bundle").strpath) is None
+
+
+def test_bundle_option(testdir, monkeypatch):
+    """Test that the scenarios are loaded from the bundle set by the ini option."""
+    testdir.makeini(
+        """
+        [pytest]
+        bdd_features_bundle = features.bundle
+        """
+    )
+    testdir.makefile(".feature", compiled=FEATURE)
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, scenarios
+
+            scenarios("compiled.feature")
+
+            @given("I have a bar")
+            def bar():
+                pass
+            """
+        )
+    )
+    compile_features(testdir, monkeypatch, testdir.tmpdir.strpath)
+
+    def index_feature(*args, **kwargs):
+        raise AssertionError("The feature should be loaded from the bundle")
+
+    # Do not reuse the features parsed in this process
+    monkeypatch.setattr(feature, "features", feature.FeaturesCache())
+    monkeypatch.setattr(feature, "index_feature", index_feature)
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
@@ -0,0 +1,281 @@
+"""Step registry tests."""
+import textwrap
+
+import pytest
+
+from pytest_bdd import parsers
+from pytest_bdd.registry import StepCache, StepCacheInfo, StepRegistry
+from pytest_bdd.types import GIVEN, WHEN
+
+
+def test_register():
+    """Test that the steps are partitioned by the step type and the parser."""
+    registry = StepRegistry()
+    parser = parsers.parse("I have {count:d} cucumbers")
+    registry.register(GIVEN, parsers.string("I have a bar"), "pytestbdd_given_I have a bar")
+    registry.register(GIVEN, parser, "pytestbdd_given_I have {count:d} cucumbers")
+
+    assert registry.exact == {GIVEN: {"I have a bar": "pytestbdd_given_I have a bar"}}
+    assert registry.get_parsers(GIVEN) == (("pytestbdd_given_I have {count:d} cucumbers", parser),)
+    assert registry.get_parsers(WHEN) == ()
+
+    other_parser = parsers.parse("I have {count:d} cucumbers")
+    registry.register(GIVEN, other_parser, "pytestbdd_given_I have {count:d} cucumbers")
+    registry.register(GIVEN, parsers.re("I eat (?P<count>\\d+)"), "pytestbdd_given_I eat (?P<count>\\d+)")
+    assert [parser for _, parser in registry.get_parsers(GIVEN)][0] is other_parser
+    assert len(registry.get_parsers(GIVEN)) == 2
+
+
+def test_visible_steps(testdir):
+    """Test that the argumented steps of the other test modules are not used."""
+    testdir.makefile(
+        ".feature",
+        cucumbers=textwrap.dedent(
+            """\
+            Feature: Cucumbers
+                Scenario: Cucumbers
+                    Given I have 5 cucumbers
+                    Then the cucumbers are converted
+            """
+        ),
+    )
+    for module, converter in [("test_int", "int"), ("test_str", "str")]:
+        testdir.makepyfile(
+            **{
+                module: textwrap.dedent(
+                    f"""\
+                    from pytest_bdd import given, parsers, scenario, then
+
+                    @scenario("cucumbers.feature", "Cucumbers")
+                    def test_cucumbers():
+                        pass
+
+                    @given(
+                        parsers.parse("I have {{count}} cucumbers"),
+                        converters={{"count": {converter}}},
+                        target_fixture="cucumbers",
+                    )
+                    def cucumbers(count):
+                        return count
+
+                    @then("the cucumbers are converted")
+                    def converted(cucumbers):
+                        assert cucumbers == {converter}(5)
+                    """
+                )
+            }
+        )
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=2)
+
+
+def test_shared_step_function(testdir):
+    """Test that the parser and the converters of the step are used, not those of another step of the function."""
+    testdir.makefile(
+        ".feature",
+        cucumbers=textwrap.dedent(
+            """\
+            Feature: Cucumbers
+                Scenario: Cucumbers
+                    Given I have 5 cucumbers
+                    Then the count is converted
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenario, then
+
+            @scenario("cucumbers.feature", "Cucumbers")
+            def test_cucumbers():
+                pass
+
+            @given("there are no cucumbers")
+            @given(parsers.parse("I have {count} cucumbers"), converters={"count": int})
+            def cucumbers():
+                pass
+
+            @then("the count is converted")
+            def converted(count):
+                assert count == 5
+            """
+        )
+    )
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_step_cache():
+    """Test that the found steps are counted and dropped once a step is registered."""
+    registry = StepRegistry()
+    step_cache = StepCache(registry)
+    key = ("I have 5 cucumbers", GIVEN, "test_cucumbers.py")
+
+    assert step_cache.get(key) is None
+    step_cache[key] = ("pytestbdd_given_I have {count:d} cucumbers", {"count": 5}, {})
+    assert step_cache.get(key) == ("pytestbdd_given_I have {count:d} cucumbers", {"count": 5}, {})
+    assert step_cache.cache_info() == StepCacheInfo(hits=1, misses=1, currsize=1)
+
+    registry.register(GIVEN, parsers.string("I have a bar"), "pytestbdd_given_I have a bar")
+    assert step_cache.get(key) is None
+    assert step_cache.cache_info() == StepCacheInfo(hits=1, misses=2, currsize=0)
+
+
+def test_step_cache_summary(testdir):
+    """Test that the steps are found once per test location and converted for every test."""
+    testdir.makefile(
+        ".feature",
+        cucumbers=textwrap.dedent(
+            """\
+            Feature: Cucumbers
+                Scenario Outline: Eat cucumbers
+                    Given I have 5 cucumbers
+                    When I eat <eat> cucumbers
+                    Then the cucumbers are eaten
+
+                    Examples:
+                    | eat |
+                    |  1  |
+                    |  2  |
+                    |  3  |
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            from pytest_bdd import given, parsers, scenarios, then, when
+
+            scenarios("cucumbers.feature", example_converters={"eat": int})
+
+            @given(
+                parsers.parse("I have {count:d} cucumbers"),
+                converters={"count": lambda count: [count]},
+                target_fixture="cucumbers",
+            )
+            def cucumbers(count):
+                return count
+
+            @when("I eat <eat> cucumbers")
+            def eat(cucumbers, eat):
+                cucumbers[0] -= eat
+
+            @then("the cucumbers are eaten")
+            def eaten(cucumbers, eat):
+                assert cucumbers == [5 - eat]
+            """
+        )
+    )
+
+    result = testdir.runpytest("-v")
+    result.assert_outcomes(passed=3)
+    result.stdout.fnmatch_lines(["*pytest-bdd step cache: 6 hits, 3 misses, 3 steps*"])
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=3)
+    assert "pytest-bdd step cache" not in result.stdout.str()
+
+
+@pytest.mark.parametrize(
+    ["conftest_step", "module_step", "expected"],
+    [
+        (
+            '@given("I have 5 cucumbers", target_fixture="source")',
+            '@given(parsers.parse("I have {count:d} cucumbers"), target_fixture="source")',
+            "conftest",
+        ),
+        (
+            '@given(parsers.parse("I have {count:d} cucumbers"), target_fixture="source")',
+            '@given("I have 5 cucumbers", target_fixture="source")',
+            "module",
+        ),
+    ],
+)
+def test_exact_step_precedence(testdir, conftest_step, module_step, expected):
+    """Test that the step named by the step text itself wins over the steps with a parser, wherever it is defined."""
+    testdir.makefile(
+        ".feature",
+        cucumbers=textwrap.dedent(
+            """\
+            Feature: Cucumbers
+                Scenario: Cucumbers
+                    Given I have 5 cucumbers
+                    Then the step is found
+            """
+        ),
+    )
+    testdir.makeconftest(
+        textwrap.dedent(
+            """\
+            import pytest
+            from pytest_bdd import given, parsers
+
+            {step}
+            def conftest_step():
+                return "conftest"
+            """
+        ).format(step=conftest_step)
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            import pytest
+            from pytest_bdd import given, parsers, scenario, then
+
+            @scenario("cucumbers.feature", "Cucumbers")
+            def test_cucumbers():
+                pass
+
+            {step}
+            def module_step():
+                return "module"
+
+            @then("the step is found")
+            def found(source):
+                assert source == "{expected}"
+            """
+        ).format(step=module_step, expected=expected)
+    )
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
+
+
+def test_exact_step_fixture_precedence(testdir):
+    """Test that the step fixture defined without the step decorators wins over the steps with a parser."""
+    testdir.makefile(
+        ".feature",
+        cucumbers=textwrap.dedent(
+            """\
+            Feature: Cucumbers
+                Scenario: Cucumbers
+                    Given I have 5 cucumbers
+            """
+        ),
+    )
+    testdir.makepyfile(
+        textwrap.dedent(
+            """\
+            import pytest
+            from pytest_bdd import given, parsers, scenario
+
+            @scenario("cucumbers.feature", "Cucumbers")
+            def test_cucumbers():
+                pass
+
+            @given(parsers.parse("I have {count:d} cucumbers"))
+            def cucumbers(count):
+                raise AssertionError("The step with a parser is used")
+
+            @pytest.fixture(name="pytestbdd_given_I have 5 cucumbers")
+            def plain_step():
+                return lambda: None
+            """
+        )
+    )
+
+    result = testdir.runpytest()
+    result.assert_outcomes(passed=1)
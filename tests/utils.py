@@ -1,3 +1,5 @@
+import textwrap
+
 import pytest
 from packaging.utils import Version
 
@@ -42,3 +44,23 @@ else:
             xpassed=xpassed,
             xfailed=xfailed,
         )
+
+
+def make_features(testdir, count):
+    """Make the feature files with a single scenario in the "features" folder.
+
+    :return: The folder path.
+    """
+    features = testdir.mkdir("features")
+    for index in range(count):
+        features.join(f"test_{index}.feature").write_text(
+            textwrap.dedent(
+                f"""\
+                Feature: Feature {index}
+                    Scenario: Scenario {index}
+                        Given I have a bar
+                """
+            ),
+            "utf-8",
+        )
+    return features